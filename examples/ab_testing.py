@@ -15,15 +15,15 @@ ab_test = ABTest(
 # Simula alcuni risultati per il test
 print("🧪 Running A/B Test simulation...")
 
-# Log results for version A
-for i in range(20):
-    metric_value = random.uniform(0.75, 0.85)  # nosec B311 # Simulation only, not cryptographic
-    ab_test.log_result("a", metric_value)
-
-# Log results for version B
-for i in range(20):
-    metric_value = random.uniform(0.80, 0.90)  # nosec B311 # Simulation only, not cryptographic
-    ab_test.log_result("b", metric_value)
+# Sample both versions in small batches until the sequential test resolves the
+# difference (or the 50-sample budget per version is spent)
+batch_size = 5
+while not ab_test.should_stop(min_samples=15, max_samples=50):
+    results_a = [random.uniform(0.75, 0.85) for _ in range(batch_size)]  # nosec B311
+    results_b = [random.uniform(0.80, 0.90) for _ in range(batch_size)]  # nosec B311
+
+    ab_test.log_batch_results("a", results_a)
+    ab_test.log_batch_results("b", results_b)
 
 # Check if test has enough data
 sample_a, sample_b = ab_test.get_sample_counts()
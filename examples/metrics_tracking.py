@@ -43,6 +43,5 @@ pv.log_metrics(
 
 # Query metrics
 v = pv.get_version("summarizer", "1.0.0")
-metrics = pv.storage.get_metrics(version_id=v["id"], limit=100)
-avg_quality = sum(m["quality_score"] for m in metrics) / len(metrics)
+avg_quality = pv.storage.aggregate_metrics(v["id"], "quality_score", op="avg")
 print(f"📊 Average quality score: {avg_quality:.2f}")
@@ -1,9 +1,13 @@
+import asyncio
 import random
 from prompt_versioner import PromptVersioner
 
 print("🚀 Inizializzazione PromptVersioner...")
 pv = PromptVersioner("multi-model-demo")
 
+# Seeded generator so repeated runs produce the same simulated metrics
+rng = random.Random(0)  # nosec B311
+
 # Salva una versione di prompt
 print("\n📝 Creazione versione prompt 'text-classifier'...")
 version_id = pv.save_version(
@@ -51,55 +55,65 @@ models_config = {
 print("\n🤖 Simulazione chiamate con diversi modelli...")
 print("=" * 70)
 
-total_calls = 0
+batches = {}
 for model_name, config in models_config.items():
-    print(f"\n{model_name}: Logging {config['calls']} chiamate...")
-
-    for i in range(config["calls"]):
-        # Simula variazioni realistiche
-        input_tokens = random.randint(80, 150)  # nosec
-        output_tokens = random.randint(30, 80)  # nosec
-        total_tokens = input_tokens + output_tokens
-
-        # Calcola costo basato su token
-        cost = (input_tokens * config["input_cost"] / 1000) + (
-            output_tokens * config["output_cost"] / 1000
+    print(f"  {model_name}: generazione {config['calls']} chiamate...")
+
+    # Genera tutte le variabili casuali del modello in blocco, una colonna per campo
+    calls = config["calls"]
+    variance = config["latency_variance"]
+    input_tokens = [rng.randint(80, 150) for _ in range(calls)]  # nosec
+    output_tokens = [rng.randint(30, 80) for _ in range(calls)]  # nosec
+    # Latenza con varianza, non meno di 100ms
+    latencies = [
+        max(100, config["avg_latency"] + rng.randint(-variance, variance))  # nosec
+        for _ in range(calls)
+    ]
+    # Quality score con piccole variazioni, clamp tra 0 e 1
+    qualities = [
+        max(0, min(1, config["quality_base"] + rng.uniform(-0.05, 0.05)))  # nosec
+        for _ in range(calls)
+    ]
+    successes = [rng.random() < config["success_rate"] for _ in range(calls)]  # nosec
+
+    # Calcola costo basato su token
+    input_rate = config["input_cost"] / 1000
+    output_rate = config["output_cost"] / 1000
+
+    # Raccoglie le metriche; l'avanzamento viene riportato una sola volta a fine salvataggio
+    batches[model_name] = [
+        {
+            "model_name": model_name,
+            "input_tokens": in_tok,
+            "output_tokens": out_tok,
+            "cost_eur": in_tok * input_rate + out_tok * output_rate,
+            "latency_ms": latency,
+            "quality_score": quality if success else None,
+            "success": success,
+            "error_message": None if success else "Random simulated error",
+        }
+        for in_tok, out_tok, latency, quality, success in zip(
+            input_tokens, output_tokens, latencies, qualities, successes
         )
+    ]
 
-        # Simula latenza con varianza
-        latency = config["avg_latency"] + random.randint(
-            -config["latency_variance"], config["latency_variance"]
-        )  # nosec
-        latency = max(100, latency)  # Non meno di 100ms
 
-        # Simula quality score con piccole variazioni
-        quality = config["quality_base"] + random.uniform(-0.05, 0.05)  # nosec
-        quality = max(0, min(1, quality))  # Clamp tra 0 e 1
-
-        # Simula successo/fallimento basato su success_rate
-        success = random.random() < config["success_rate"]  # nosec
-
-        # Log metriche
-        pv.log_metrics(
-            name="text-classifier",
-            version=version_number,
-            model_name=model_name,
-            input_tokens=input_tokens,
-            output_tokens=output_tokens,
-            cost_eur=cost,
-            latency_ms=latency,
-            quality_score=quality if success else None,
-            success=success,
-            error_message=None if success else "Random simulated error",
+async def log_all_batches() -> int:
+    """Salva i batch dei modelli in parallelo (un thread per modello)."""
+    # SQLite ha un solo writer: la concorrenza sovrappone solo l'I/O restante
+    counts = await asyncio.gather(
+        *(
+            pv.alog_metrics_batch("text-classifier", version_number, batch)
+            for batch in batches.values()
         )
+    )
+    for model_name, count in zip(batches, counts):
+        print(f"  ✅ {model_name}: {count} chiamate completate")
+    return sum(counts)
 
-        total_calls += 1
-
-        # Progress indicator
-        if (i + 1) % 50 == 0:
-            print(f"  ✓ {i + 1}/{config['calls']} chiamate completate")
 
-    print(f"  ✅ {model_name}: {config['calls']} chiamate completate")
+# Log metriche
+total_calls = asyncio.run(log_all_batches())
 
 print("\n" + "=" * 70)
 print(f"🎉 Demo completata! Totale chiamate simulate: {total_calls}")
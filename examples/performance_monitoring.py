@@ -3,6 +3,9 @@ import random
 
 pv = PromptVersioner(project_name="my-ai-project", enable_git=False)
 
+# Seeded generator so repeated runs produce the same simulated metrics
+rng = random.Random(0)  # nosec B311
+
 print("🚀 Creating test data for performance monitoring...")
 
 # 1. Create a prompt with baseline version
@@ -20,21 +23,29 @@ print(f"✅ Created baseline version: {baseline_version['version']}")
 
 # 2. Log baseline metrics (good performance)
 print("📊 Logging baseline metrics...")
-for i in range(20):
-    pv.log_metrics(
-        name="test_classifier",
-        version=baseline_version["version"],
-        model_name="gpt-4o",
-        input_tokens=random.randint(100, 200),  # nosec B311
-        output_tokens=random.randint(20, 50),  # nosec B311
-        latency_ms=random.uniform(300, 500),  # nosec B311
-        quality_score=random.uniform(0.85, 0.95),  # nosec B311
-        success=True,
-        temperature=0.7,
-        max_tokens=100,
+# Draw each metric column in one call instead of several random calls per record
+n_calls = 20
+baseline_metrics_batch = [
+    {
+        "model_name": "gpt-4o",
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "latency_ms": 300 + 200 * latency,
+        "quality_score": 0.85 + 0.10 * quality,
+        "success": True,
+        "temperature": 0.7,
+        "max_tokens": 100,
+    }
+    for input_tokens, output_tokens, latency, quality in zip(
+        rng.choices(range(100, 201), k=n_calls),  # nosec B311
+        rng.choices(range(20, 51), k=n_calls),  # nosec B311
+        [rng.random() for _ in range(n_calls)],  # nosec B311
+        [rng.random() for _ in range(n_calls)],  # nosec B311
     )
+]
+pv.log_metrics_batch("test_classifier", baseline_version["version"], baseline_metrics_batch)
 
-print(f"✅ Logged {20} baseline metrics")
+print(f"✅ Logged {n_calls} baseline metrics")
 
 # 3. Create new version with worse performance
 print("\n📝 Creating new version with performance issues...")
@@ -51,21 +62,29 @@ print(f"✅ Created current version: {current_version['version']}")
 
 # 4. Log worse metrics for new version
 print("📊 Logging current metrics (with regressions)...")
-for i in range(20):
-    pv.log_metrics(
-        name="test_classifier",
-        version=current_version["version"],
-        model_name="gpt-4o",
-        input_tokens=random.randint(150, 300),  # nosec B311
-        output_tokens=random.randint(80, 150),  # nosec B311
-        latency_ms=random.uniform(600, 900),  # nosec B311
-        quality_score=random.uniform(0.70, 0.85),  # nosec B311
-        success=random.choice([True] * 18 + [False] * 2),  # nosec B311
-        temperature=0.7,
-        max_tokens=200,
+current_metrics_batch = [
+    {
+        "model_name": "gpt-4o",
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "latency_ms": 600 + 300 * latency,
+        "quality_score": 0.70 + 0.15 * quality,
+        # ~10% simulated failures
+        "success": outcome >= 0.1,
+        "temperature": 0.7,
+        "max_tokens": 200,
+    }
+    for input_tokens, output_tokens, latency, quality, outcome in zip(
+        rng.choices(range(150, 301), k=n_calls),  # nosec B311
+        rng.choices(range(80, 151), k=n_calls),  # nosec B311
+        [rng.random() for _ in range(n_calls)],  # nosec B311
+        [rng.random() for _ in range(n_calls)],  # nosec B311
+        [rng.random() for _ in range(n_calls)],  # nosec B311
     )
+]
+pv.log_metrics_batch("test_classifier", current_version["version"], current_metrics_batch)
 
-print(f"✅ Logged {20} current metrics with regressions")
+print(f"✅ Logged {n_calls} current metrics with regressions")
 
 print("\n" + "=" * 60)
 print("🔍 PERFORMANCE MONITORING TEST")
@@ -107,45 +126,45 @@ if prompts:
         )
 
         if alerts:
-            print(f"\n⚠️  Found {len(alerts)} performance alerts:")
+            lines = [f"\n⚠️  Found {len(alerts)} performance alerts:"]
             for i, alert in enumerate(alerts, 1):
-                print(f"   {i}. {alert.alert_type.value}: {alert.message}")
-                print(
-                    f"      Baseline: {alert.baseline_value:.4f} → Current: {alert.current_value:.4f}"
-                )
-                print(
-                    f"      Change: {alert.change_percent:+.1f}% (threshold: {alert.threshold:.0f}%)"
+                lines.append(
+                    f"   {i}. {alert.alert_type.value}: {alert.message}\n"
+                    f"      Baseline: {alert.baseline_value:.4f} → Current: {alert.current_value:.4f}\n"
+                    f"      Change: {alert.change_percent:+.1f}% (threshold: {alert.threshold:.0f}%)\n"
                 )
-                print()
+            print("\n".join(lines))
         else:
             print("✅ No performance regressions detected!")
 
         # Add alert handler for future monitoring
-        def alert_handler(alert):
-            print(f"🚨 REAL-TIME ALERT: {alert.alert_type.value} for {alert.prompt_name}")
-            print(f"    {alert.message}")
-            print(f"    Change: {alert.change_percent:+.1f}%")
+        def alert_handler(alerts):
+            # Receives every alert of a check at once and writes them in one go
+            print(
+                "\n".join(
+                    f"🚨 REAL-TIME ALERT: {alert.alert_type.value} for {alert.prompt_name}\n"
+                    f"    {alert.message}\n"
+                    f"    Change: {alert.change_percent:+.1f}%"
+                    for alert in alerts
+                )
+            )
 
-        monitor.add_alert_handler(alert_handler)
+        monitor.add_batch_alert_handler(alert_handler)
         print("📡 Alert handler registered for future monitoring")
 
         # Show metrics summary
         print("\n📈 Metrics Summary:")
-        baseline_metrics = pv.storage.get_metrics_summary(versions[1]["id"])
-        current_metrics = pv.storage.get_metrics_summary(versions[0]["id"])
+        summaries = pv.storage.get_metrics_summaries([versions[1]["id"], versions[0]["id"]])
+        baseline_metrics = summaries[versions[1]["id"]]
+        current_metrics = summaries[versions[0]["id"]]
 
         if baseline_metrics and current_metrics:
+            b, c = baseline_metrics, current_metrics
             print(
-                f"   Cost:    {baseline_metrics.get('avg_cost', 0):.4f} → {current_metrics.get('avg_cost', 0):.4f}"
-            )
-            print(
-                f"   Latency: {baseline_metrics.get('avg_latency', 0):.1f}ms → {current_metrics.get('avg_latency', 0):.1f}ms"
-            )
-            print(
-                f"   Quality: {baseline_metrics.get('avg_quality', 0):.3f} → {current_metrics.get('avg_quality', 0):.3f}"
-            )
-            print(
-                f"   Success: {baseline_metrics.get('success_rate', 0):.1%} → {current_metrics.get('success_rate', 0):.1%}"
+                f"   Cost:    {b.get('avg_cost', 0):.4f} → {c.get('avg_cost', 0):.4f}\n"
+                f"   Latency: {b.get('avg_latency', 0):.1f}ms → {c.get('avg_latency', 0):.1f}ms\n"
+                f"   Quality: {b.get('avg_quality', 0):.3f} → {c.get('avg_quality', 0):.3f}\n"
+                f"   Success: {b.get('success_rate', 0):.1%} → {c.get('success_rate', 0):.1%}"
             )
 
     else:
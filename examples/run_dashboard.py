@@ -1,5 +1,6 @@
 """Run the web dashboard."""
 
+import os
 import sys
 from pathlib import Path
 
@@ -19,8 +20,7 @@ def main():
     pv = PromptVersioner(project_name="dashboard-app", enable_git=False)
 
     # Create some sample data if database is empty
-    prompts = pv.list_prompts()
-    if not prompts:
+    if not pv.has_prompts():
         print("\n📝 Creating sample data...")
 
         # Sample prompt 1
@@ -56,10 +56,22 @@ def main():
     print(f"\nDashboard running at: http://localhost:{port}")
     print(f"Database: {pv.storage.db_path}")
     print(f"Tracked prompts: {len(pv.list_prompts())}")
+    print("Set DASHBOARD_DEV=1 to enable the Flask debugger and reloader")
     print("\nPress Ctrl+C to stop\n")
     print("=" * 80)
 
-    app.run(host="localhost", port=port, debug=True)
+    # The debugger and reloader are for development only
+    if os.getenv("DASHBOARD_DEV"):
+        app.run(host="localhost", port=port, debug=True)
+        return
+
+    try:
+        from waitress import serve
+    except ImportError:
+        # waitress is optional; fall back to the threaded Werkzeug server
+        app.run(host="localhost", port=port, debug=False, threaded=True)
+    else:
+        serve(app, host="localhost", port=port, threads=8)
 
 
 if __name__ == "__main__":
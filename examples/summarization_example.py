@@ -1,4 +1,8 @@
 import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional, Tuple
 from prompt_versioner.core import PromptVersioner, VersionBump
 
 print("🚀 Starting News Summarizer Example")
@@ -30,47 +34,98 @@ print(f"   System prompt length: {len(baseline_version['system_prompt'])} chars"
 print(f"   User prompt length: {len(baseline_version['user_prompt'])} chars")
 
 
+# Stand-ins for the OpenAI response objects, defined once at module level
+@dataclass(frozen=True, slots=True)
+class MockMessage:
+    content: str
+
+
+@dataclass(frozen=True, slots=True)
+class MockChoice:
+    message: MockMessage
+
+
+@dataclass(frozen=True, slots=True)
+class MockUsage:
+    prompt_tokens: int
+    completion_tokens: int
+
+
+@dataclass(frozen=True, slots=True)
+class MockResponse:
+    choices: Tuple[MockChoice, ...]
+    usage: MockUsage
+
+
+# The simulated summary never changes, so its choice objects are shared
+_MOCK_CHOICES = (
+    MockChoice(
+        MockMessage(
+            "This is a simulated summary of the article about breaking news. The key points are highlighted in this concise overview."
+        )
+    ),
+)
+
+
+@lru_cache(maxsize=32)
+def split_template(user_prompt: str) -> Optional[Tuple[str, str]]:
+    """Split a template with a single {article_text} field into (prefix, suffix).
+
+    Returns None when the template has other fields or escaped braces, in which
+    case str.format is still needed.
+    """
+    prefix, sep, suffix = user_prompt.partition("{article_text}")
+    if not sep or any(c in prefix or c in suffix for c in "{}"):
+        return None
+    return prefix, suffix
+
+
+def render_prompt(user_prompt: str, article_text: str) -> str:
+    """Render the user prompt, concatenating pre-split templates."""
+    parts = split_template(user_prompt)
+    if parts is not None:
+        return parts[0] + article_text + parts[1]
+    return user_prompt.format(article_text=article_text)
+
+
+def rendered_length(user_prompt: str, article_text: str) -> int:
+    """Length of the rendered prompt, without building it when the template is split."""
+    parts = split_template(user_prompt)
+    if parts is not None:
+        return len(parts[0]) + len(article_text) + len(parts[1])
+    return len(render_prompt(user_prompt, article_text))
+
+
 # Use in production with metrics tracking
-def summarize_article(article_text: str) -> str:
+def summarize_article(
+    article_text: str, prompt_data: dict, metrics_buffer: Optional[list] = None
+) -> str:
     print(f"\n📰 Processing article ({len(article_text)} chars)...")
-    prompt_data = pv.get_latest("news_summarizer")
     print(f"   Using prompt version: {prompt_data['version']}")
 
-    # Format the prompt
-    formatted_prompt = prompt_data["user_prompt"].format(article_text=article_text)
-    print(f"   Formatted prompt length: {len(formatted_prompt)} chars")
+    # The simulated call only needs the prompt length; the real call below renders it
+    prompt_length = rendered_length(prompt_data["user_prompt"], article_text)
+    print(f"   Formatted prompt length: {prompt_length} chars")
 
     # Call your LLM (simulated - comment out for real API call)
     print("   ⏳ Calling LLM...")
     start_time = time.time()
 
     # Simulate API response
-    class MockResponse:
-        def __init__(self):
-            self.choices = [MockChoice()]
-            self.usage = MockUsage()
-
-    class MockChoice:
-        def __init__(self):
-            self.message = MockMessage()
-
-    class MockMessage:
-        def __init__(self):
-            self.content = "This is a simulated summary of the article about breaking news. The key points are highlighted in this concise overview."
-
-    class MockUsage:
-        def __init__(self):
-            self.prompt_tokens = len(formatted_prompt) // 4  # Rough estimation
-            self.completion_tokens = 45
-
-    response = MockResponse()
+    response = MockResponse(
+        choices=_MOCK_CHOICES,
+        usage=MockUsage(
+            prompt_tokens=prompt_length // 4,  # Rough estimation
+            completion_tokens=45,
+        ),
+    )
 
     # Uncomment for real OpenAI API call:
     # response = openai.chat.completions.create(
     #     model="gpt-4o",
     #     messages=[
     #         {"role": "system", "content": prompt_data["system_prompt"]},
-    #         {"role": "user", "content": formatted_prompt}
+    #         {"role": "user", "content": render_prompt(prompt_data["user_prompt"], article_text)}
     #     ],
     #     temperature=0.7,
     #     max_tokens=200
@@ -82,18 +137,22 @@ def summarize_article(article_text: str) -> str:
         f"   📊 Tokens - Input: {response.usage.prompt_tokens}, Output: {response.usage.completion_tokens}"
     )
 
-    # Log metrics automatically
-    print("   💾 Logging metrics...")
-    pv.log_metrics(
-        name="news_summarizer",
-        version=prompt_data["version"],
-        model_name="gpt-4o",
-        input_tokens=response.usage.prompt_tokens,
-        output_tokens=response.usage.completion_tokens,
-        latency_ms=latency,
-        success=True,
-    )
-    print("   ✅ Metrics logged successfully")
+    metrics = {
+        "model_name": "gpt-4o",
+        "input_tokens": response.usage.prompt_tokens,
+        "output_tokens": response.usage.completion_tokens,
+        "latency_ms": latency,
+        "success": True,
+    }
+
+    if metrics_buffer is not None:
+        # Collected by the caller and flushed in a single transaction
+        metrics_buffer.append((prompt_data["version"], metrics))
+    else:
+        # Log metrics automatically
+        print("   💾 Logging metrics...")
+        pv.log_metrics(name="news_summarizer", version=prompt_data["version"], **metrics)
+        print("   ✅ Metrics logged successfully")
 
     summary = response.choices[0].message.content
     print(f"   📝 Generated summary: {summary[:100]}...")
@@ -136,18 +195,34 @@ sample_articles = [
     "Tech News: Major social media platform announces significant changes to its privacy policy, affecting over 2 billion users worldwide. The updates include new data retention policies and enhanced user control over personal information sharing.",
 ]
 
-for i, article in enumerate(sample_articles, 1):
+# The prompt does not change while processing the batch, so look it up once
+prompt_data = pv.get_latest("news_summarizer")
+metrics_buffer: list = []
+
+# Articles are independent LLM calls, so overlap their latency
+with ThreadPoolExecutor(max_workers=len(sample_articles)) as executor:
+    summaries = list(
+        executor.map(
+            lambda article: summarize_article(article, prompt_data, metrics_buffer),
+            sample_articles,
+        )
+    )
+
+for i, (article, summary) in enumerate(zip(sample_articles, summaries), 1):
     print(f"\n📖 Article {i}:")
     print(f"   Content: {article[:100]}...")
-
-    summary = summarize_article(article)
     print(f"   Summary: {summary}")
 
-print("\n📈 Checking stored metrics...")
-all_prompts = pv.list_prompts()
-print(f"Available prompts: {all_prompts}")
+print("\n💾 Logging metrics...")
+metrics_by_version: dict = {}
+for version, metrics in metrics_buffer:
+    metrics_by_version.setdefault(version, []).append(metrics)
+for version, rows in metrics_by_version.items():
+    pv.log_metrics_batch("news_summarizer", version, rows)
+print("✅ Metrics logged successfully")
 
-if "news_summarizer" in all_prompts:
+print("\n📈 Checking stored metrics...")
+if pv.prompt_exists("news_summarizer"):
     versions = pv.list_versions("news_summarizer")
     print(f"Versions for news_summarizer: {[v['version'] for v in versions]}")
 
@@ -1,6 +1,7 @@
 """Test script with full metrics tracking and new features."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import time
 import random  # nosec B311
@@ -12,29 +13,55 @@ from prompt_versioner.core import PromptVersioner, VersionBump
 from prompt_versioner.testing import ABTest
 from prompt_versioner.app import PerformanceMonitor
 
-
-def simulate_llm_call(prompt_data, model="claude-sonnet-4"):
-    """Simulate an LLM call with metrics."""
-    time.sleep(random.uniform(0.05, 0.15))  # nosec B311
-
-    input_tokens = len(prompt_data["system"].split()) * 1.3 + len(prompt_data["user"].split()) * 1.3
-    output_tokens = random.randint(50, 200)  # nosec B311
-    latency_ms = random.uniform(200, 800)  # nosec B311
-    quality_score = random.uniform(0.75, 0.95)  # nosec B311
-    accuracy = random.uniform(0.80, 0.98)  # nosec B311
-
-    return {
-        "model_name": model,
-        "input_tokens": int(input_tokens),
-        "output_tokens": output_tokens,
-        "latency_ms": latency_ms,
-        "quality_score": quality_score,
-        "accuracy": accuracy,
-        "temperature": 0.7,
-        "top_p": 0.95,
-        "max_tokens": 1000,
-        "success": True,
-    }
+# Seeded generator so repeated runs produce the same simulated metrics
+_rng = random.Random(0)  # nosec B311
+
+
+def draw_ints(low, high, n, rng=_rng):
+    """Draw a column of n random integers in [low, high] with a single call."""
+    return rng.choices(range(low, high + 1), k=n)  # nosec B311
+
+
+def draw_floats(low, high, n, rng=_rng):
+    """Draw a column of n random floats in [low, high)."""
+    span = high - low
+    return [low + span * rng.random() for _ in range(n)]  # nosec B311
+
+
+def estimate_input_tokens(system_prompt, user_prompt):
+    """Estimate prompt tokens from word counts; computed once per version, not per call."""
+    return int(len(system_prompt.split()) * 1.3 + len(user_prompt.split()) * 1.3)
+
+
+def simulate_llm_calls(input_tokens, n, model="claude-sonnet-4", rng=_rng):
+    """Simulate a batch of n LLM calls, drawing each metric as one column.
+
+    input_tokens is estimated once by the caller, since the prompt is the same
+    for every call of the batch. Pass a dedicated rng when running batches in
+    parallel threads, so the drawn values stay reproducible.
+    """
+    time.sleep(rng.uniform(0.05, 0.15))  # nosec B311
+
+    return [
+        {
+            "model_name": model,
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": latency_ms,
+            "quality_score": quality_score,
+            "accuracy": accuracy,
+            "temperature": 0.7,
+            "top_p": 0.95,
+            "max_tokens": 1000,
+            "success": True,
+        }
+        for output_tokens, latency_ms, quality_score, accuracy in zip(
+            draw_ints(50, 200, n, rng),
+            draw_floats(200, 800, n, rng),
+            draw_floats(0.75, 0.95, n, rng),
+            draw_floats(0.80, 0.98, n, rng),
+        )
+    ]
 
 
 def main():  # nosec B311
@@ -57,25 +84,29 @@ def main():  # nosec B311
     v1 = pv.get_latest("code_reviewer")
     print(f"   Created version: {v1['version']}")
 
-    # Log metrics for v1
-    for i in range(10):
-
-        input_tokens = len(v1["system_prompt"].split()) * 1.3 + len(v1["user_prompt"].split()) * 1.3
-        output_tokens = random.randint(50, 200)  # nosec B311
-        latency_ms = random.uniform(200, 800)  # nosec B311
-        quality_score = random.uniform(0.75, 0.95)  # nosec B311
-        accuracy = random.uniform(0.80, 0.98)  # nosec B311
-        pv.log_metrics(
-            name="code_reviewer",
-            version=v1["version"],
-            model_name="gpt-4o",
-            input_tokens=int(input_tokens),
-            output_tokens=output_tokens,
-            max_tokens=500,
-            latency_ms=latency_ms,
-            quality_score=quality_score,
-            accuracy=accuracy,
+    # Log metrics for v1 in a single transaction
+    v1_input_tokens = estimate_input_tokens(v1["system_prompt"], v1["user_prompt"])
+    v1_metrics = [
+        {
+            "model_name": "gpt-4o",
+            "input_tokens": v1_input_tokens,
+            "output_tokens": output_tokens,
+            "max_tokens": 500,
+            "latency_ms": latency_ms,
+            "quality_score": quality_score,
+            "accuracy": accuracy,
+        }
+        for output_tokens, latency_ms, quality_score, accuracy in zip(
+            draw_ints(50, 200, 10),
+            draw_floats(200, 800, 10),
+            draw_floats(0.75, 0.95, 10),
+            draw_floats(0.80, 0.98, 10),
         )
+    ]
+    pv.log_metrics_batch("code_reviewer", v1["version"], v1_metrics)
+    latency_ms = v1_metrics[-1]["latency_ms"]
+    quality_score = v1_metrics[-1]["quality_score"]
+    accuracy = v1_metrics[-1]["accuracy"]
 
     print(f"   Logged 10 calls for {v1['version']}")
 
@@ -134,18 +165,26 @@ def main():  # nosec B311
         metric_name="quality_score",
     )
 
-    # Simulate A/B test calls
-    for i in range(15):
-        # Test version A
-        metrics_a = simulate_llm_call({"system": v1["system_prompt"], "user": v1["user_prompt"]})
-        pv.log_metrics(name="code_reviewer", version=v1["version"], **metrics_a)
-        ab_test.log_result("a", metrics_a["quality_score"])
+    # Simulate both arms concurrently (each with its own seeded generator), then
+    # store each arm in one transaction
+    arm_tokens = [
+        v1_input_tokens,
+        estimate_input_tokens(v2["system_prompt"], v2["user_prompt"]),
+    ]
+    arm_rngs = [random.Random(_rng.random()) for _ in arm_tokens]  # nosec B311
+    with ThreadPoolExecutor(max_workers=len(arm_tokens)) as executor:
+        metrics_a_batch, metrics_b_batch = executor.map(
+            lambda tokens, rng: simulate_llm_calls(tokens, n=15, rng=rng), arm_tokens, arm_rngs
+        )
 
-        # Test version B (slightly better)
-        metrics_b = simulate_llm_call({"system": v2["system_prompt"], "user": v2["user_prompt"]})
+    # Version B (slightly better)
+    for metrics_b in metrics_b_batch:
         metrics_b["quality_score"] = min(0.98, metrics_b["quality_score"] + 0.05)
-        pv.log_metrics(name="code_reviewer", version=v2["version"], **metrics_b)
-        ab_test.log_result("b", metrics_b["quality_score"])
+
+    pv.log_metrics_batch("code_reviewer", v1["version"], metrics_a_batch)
+    pv.log_metrics_batch("code_reviewer", v2["version"], metrics_b_batch)
+    ab_test.log_batch_results("a", (m["quality_score"] for m in metrics_a_batch))
+    ab_test.log_batch_results("b", (m["quality_score"] for m in metrics_b_batch))
 
     ab_test.print_result()
 
@@ -154,12 +193,18 @@ def main():  # nosec B311
     monitor = PerformanceMonitor(pv)
 
     # Add alert handler
-    def alert_handler(alert):
-        print(f"   ALERT: {alert.alert_type.value.upper()}")
-        print(f"     {alert.message}")
-        print(f"     Baseline: {alert.baseline_value:.4f}, Current: {alert.current_value:.4f}")
+    def alert_handler(alerts):
+        # Receives every alert of a check at once and writes them in one go
+        print(
+            "\n".join(
+                f"   ALERT: {alert.alert_type.value.upper()}\n"
+                f"     {alert.message}\n"
+                f"     Baseline: {alert.baseline_value:.4f}, Current: {alert.current_value:.4f}"
+                for alert in alerts
+            )
+        )
 
-    monitor.add_alert_handler(alert_handler)
+    monitor.add_batch_alert_handler(alert_handler)
 
     # Check for regressions
     alerts = monitor.check_regression(
@@ -205,20 +250,26 @@ def main():  # nosec B311
     )
 
     latest_sum = pv.get_latest("summarizer")
-    for i in range(8):
-        pv.log_metrics(
-            name="summarizer",
-            version=latest_sum["version"],
-            model_name="gpt-4o",
-            input_tokens=random.randint(500, 1000),  # nosec B311
-            output_tokens=random.randint(100, 200),  # nosec B311
-            latency_ms=random.uniform(300, 600),  # nosec B311
-            quality_score=random.uniform(0.85, 0.95),  # nosec B311
-            temperature=0.5,
-            top_p=1.0,
-            max_tokens=500,
-            success=True,
+    summarizer_metrics = [
+        {
+            "model_name": "gpt-4o",
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": latency_ms,
+            "quality_score": quality_score,
+            "temperature": 0.5,
+            "top_p": 1.0,
+            "max_tokens": 500,
+            "success": True,
+        }
+        for input_tokens, output_tokens, latency_ms, quality_score in zip(
+            draw_ints(500, 1000, 8),
+            draw_ints(100, 200, 8),
+            draw_floats(300, 600, 8),
+            draw_floats(0.85, 0.95, 8),
         )
+    ]
+    pv.log_metrics_batch("summarizer", latest_sum["version"], summarizer_metrics)
 
     pv.add_annotation(
         name="summarizer",
@@ -237,21 +288,30 @@ def main():  # nosec B311
     )
 
     latest_entity = pv.get_latest("entity_extractor")
-    for i in range(12):
-        pv.log_metrics(
-            name="entity_extractor",
-            version=latest_entity["version"],
-            model_name="claude-sonnet-4",
-            input_tokens=random.randint(200, 500),  # nosec B311
-            output_tokens=random.randint(50, 150),  # nosec B311
-            latency_ms=random.uniform(250, 500),  # nosec B311
-            quality_score=random.uniform(0.88, 0.96),  # nosec B311
-            accuracy=random.uniform(0.85, 0.95),  # nosec B311
-            temperature=0.3,
-            top_p=0.9,
-            max_tokens=800,
-            success=random.choice([True, True, True, False]),  # nosec B311
+    entity_metrics = [
+        {
+            "model_name": "claude-sonnet-4",
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            "latency_ms": latency_ms,
+            "quality_score": quality_score,
+            "accuracy": accuracy,
+            "temperature": 0.3,
+            "top_p": 0.9,
+            "max_tokens": 800,
+            # ~25% simulated failures
+            "success": outcome >= 0.25,
+        }
+        for input_tokens, output_tokens, latency_ms, quality_score, accuracy, outcome in zip(
+            draw_ints(200, 500, 12),
+            draw_ints(50, 150, 12),
+            draw_floats(250, 500, 12),
+            draw_floats(0.88, 0.96, 12),
+            draw_floats(0.85, 0.95, 12),
+            draw_floats(0, 1, 12),
         )
+    ]
+    pv.log_metrics_batch("entity_extractor", latest_entity["version"], entity_metrics)
 
     print("   Created 3 prompts with metrics")
 
@@ -260,24 +320,23 @@ def main():  # nosec B311
     print("Test Summary")
     print("=" * 80)
 
-    all_prompts = pv.list_prompts()
-    print(f"\nTotal Prompts: {len(all_prompts)}")
+    # One grouped query instead of listing versions, metrics and annotations per prompt
+    versions_by_prompt: dict = {}
+    for row in pv.storage.get_version_summaries():
+        versions_by_prompt.setdefault(row["name"], []).append(row)
+    print(f"\nTotal Prompts: {len(versions_by_prompt)}")
 
-    for prompt_name in all_prompts:
-        versions = pv.list_versions(prompt_name)
+    for prompt_name, versions in versions_by_prompt.items():
         print(f"\n  {prompt_name}:")
         print(f"    Versions: {len(versions)}")
 
-        for v in versions[:2]:  # Show first 2 versions
-            summary = pv.storage.get_metrics_summary(v["id"])
-            annotations = pv.get_annotations(prompt_name, v["version"])
-
-            if summary and summary.get("call_count", 0) > 0:
+        for summary in versions[:2]:  # Show first 2 versions
+            if summary["call_count"] > 0:
                 print(
-                    f"    - {v['version']}: {summary['call_count']} calls, "
+                    f"    - {summary['version']}: {summary['call_count']} calls, "
                     f"${summary['total_cost']:.4f} cost, "
                     f"{summary['avg_quality']:.1%} quality, "
-                    f"{len(annotations)} annotations"
+                    f"{summary['annotation_count']} annotations"
                 )
 
     print("\n" + "=" * 80)
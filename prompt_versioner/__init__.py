@@ -1,7 +1,13 @@
 """Prompt Versioner - Intelligent versioning for LLM prompts."""
 
 # Import relativi corretti per quando è installato come package
-from prompt_versioner.core import PromptVersioner, TestContext, VersionBump, PreReleaseLabel
+from prompt_versioner.core import (
+    PromptVersioner,
+    TestContext,
+    MetricsBuffer,
+    VersionBump,
+    PreReleaseLabel,
+)
 from prompt_versioner.storage import PromptStorage
 from prompt_versioner.app import (
     DiffEngine,
@@ -33,6 +39,7 @@ __version__ = "0.1.0"
 __all__ = [
     "PromptVersioner",
     "TestContext",
+    "MetricsBuffer",
     "VersionBump",
     "PreReleaseLabel",
     "PromptStorage",
@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING, Any
+
 from prompt_versioner.app.services import (
     AlertService,
     PerformanceMonitor,
@@ -6,7 +8,19 @@ from prompt_versioner.app.services import (
     MetricsService,
 )
 from prompt_versioner.app.models import PromptDiff, ChangeType, Alert, AlertType
-from prompt_versioner.app.flask_builder import create_app
+
+if TYPE_CHECKING:
+    from prompt_versioner.app.flask_builder import create_app
+
+
+def __getattr__(name: str) -> Any:
+    # Flask is only needed by the dashboard; import it on first use of create_app
+    if name == "create_app":
+        from prompt_versioner.app.flask_builder import create_app
+
+        return create_app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "MetricsService",
@@ -13,6 +13,8 @@ class Config:
 
     # Upload settings
     MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    # Larger imports are spooled to EXPORT_TEMP_DIR instead of parsed in memory
+    MAX_IN_MEMORY_IMPORT = int(os.environ.get("MAX_IN_MEMORY_IMPORT", 4 * 1024 * 1024))
 
     BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -34,6 +36,9 @@ class Config:
     # A/B Testing
     MIN_CALLS_FOR_AB_TEST = 5
 
+    # Seconds aggregated dashboard stats are cached (also refreshed on any write)
+    METRICS_CACHE_TTL = float(os.environ.get("METRICS_CACHE_TTL", 60))
+
 
 class DevelopmentConfig(Config):
     """Development configuration."""
@@ -1,8 +1,13 @@
 """Controller for export/import routes."""
 
-from flask import Blueprint, jsonify, send_file, request, current_app
+from flask import Blueprint, Response, jsonify, send_file, request, current_app, stream_with_context
+import io
+import itertools
+import json
+import shutil
 import zipfile
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator, Set
 
 
 export_import_bp = Blueprint("export_import", __name__, url_prefix="/api")
@@ -13,16 +18,16 @@ def export_prompt(name: str) -> Any:
     """Export a prompt to JSON file."""
     try:
         versioner = current_app.versioner  # type: ignore[attr-defined]
-        config = current_app.config
 
-        temp_file = config["EXPORT_TEMP_DIR"] / f"{name}.json"
-        versioner.export_prompt(name, temp_file, format="json", include_metrics=True)
+        # Serve the export from memory instead of a temp file
+        data = versioner.export_prompt_to_bytes(name, format="json", include_metrics=True)
 
         return send_file(
-            temp_file,
+            io.BytesIO(data),
             as_attachment=True,
             download_name=f"{name}_export.json",
             mimetype="application/json",
+            max_age=0,
         )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -33,7 +38,6 @@ def export_version(name: str, version: str) -> Any:
     """Export a specific version of a prompt to JSON file."""
     try:
         versioner = current_app.versioner  # type: ignore[attr-defined]
-        config = current_app.config
 
         # Get the specific version
         version_data = versioner.get_version(name, version)
@@ -49,18 +53,14 @@ def export_version(name: str, version: str) -> Any:
             "export_type": "single_version",
         }
 
-        temp_file = config["EXPORT_TEMP_DIR"] / f"{name}_v{version}.json"
-
-        import json
-
-        with open(temp_file, "w", encoding="utf-8") as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False)
+        data = json.dumps(export_data, indent=2, ensure_ascii=False).encode("utf-8")
 
         return send_file(
-            temp_file,
+            io.BytesIO(data),
             as_attachment=True,
             download_name=f"{name}_v{version}_export.json",
             mimetype="application/json",
+            max_age=0,
         )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -80,45 +80,120 @@ def import_prompt() -> Any:
         versioner = current_app.versioner  # type: ignore[attr-defined]
         config = current_app.config
 
-        temp_file = config["EXPORT_TEMP_DIR"] / file.filename
-        file.save(temp_file)
+        max_in_memory = config["MAX_IN_MEMORY_IMPORT"]
+        if request.content_length is not None and request.content_length > max_in_memory:
+            return jsonify(_import_via_temp_file(versioner, file, config["EXPORT_TEMP_DIR"]))
 
-        result = versioner.import_prompt(temp_file, overwrite=False)
+        # Parse the upload in memory, without a temp file round trip
+        data = file.stream.read(max_in_memory + 1)
+        if len(data) > max_in_memory:
+            return jsonify(_import_via_temp_file(versioner, file, config["EXPORT_TEMP_DIR"], data))
 
-        temp_file.unlink()
+        suffix = Path(file.filename or "").suffix
+        if suffix == ".json":
+            data_format = "json"
+        elif suffix in [".yaml", ".yml"]:
+            data_format = "yaml"
+        else:
+            raise ValueError(f"Unsupported format: {suffix}")
+
+        result = versioner.import_prompt_from_bytes(data, format=data_format, overwrite=False)
 
         return jsonify(result)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
 
-@export_import_bp.route("/export-all", methods=["GET"])
-def export_all() -> Any:
-    """Export all prompts as ZIP."""
-    try:
-        versioner = current_app.versioner  # type: ignore[attr-defined]
-        config = current_app.config
+def _import_via_temp_file(versioner: Any, file: Any, temp_dir: Path, head: bytes = b"") -> Any:
+    """Import an upload too large to parse in memory through a temp file.
 
-        temp_dir = config["EXPORT_TEMP_DIR"] / "prompt_export"
-        temp_dir.mkdir(exist_ok=True)
+    ``head`` holds any bytes already consumed from the upload stream.
+    """
+    temp_file = temp_dir / Path(file.filename).name
+    with temp_file.open("wb") as f:
+        f.write(head)
+        shutil.copyfileobj(file.stream, f)
 
-        versioner.export_all(temp_dir, format="json")
+    try:
+        return versioner.import_prompt(temp_file, overwrite=False)
+    finally:
+        temp_file.unlink()
 
-        zip_path = config["EXPORT_TEMP_DIR"] / "all_prompts.zip"
-        with zipfile.ZipFile(zip_path, "w") as zipf:
-            for json_file in temp_dir.glob("*.json"):
-                zipf.write(json_file, json_file.name)
 
-        # Cleanup
-        for json_file in temp_dir.glob("*.json"):
-            json_file.unlink()
-        temp_dir.rmdir()
+@export_import_bp.route("/export-all", methods=["GET"])
+def export_all() -> Any:
+    """Export all prompts as ZIP, streamed to the client while it is built.
 
-        return send_file(
-            zip_path,
-            as_attachment=True,
-            download_name="all_prompts.zip",
+    The first member is built before the response starts, so a failure there
+    still returns a JSON error. A failure after that can only abort the
+    stream, and the client receives a truncated archive.
+    """
+    try:
+        versioner = current_app.versioner  # type: ignore[attr-defined]
+        prompt_names = versioner.list_prompts()
+
+        def generate() -> Iterator[bytes]:
+            # Each member is compressed and sent as soon as it is written, so the
+            # archive is never held in full in memory or on disk
+            stream = _ZipStream()
+            used_names: Set[str] = set()
+            with zipfile.ZipFile(stream, "w", zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+                for prompt_name in prompt_names:
+                    data = versioner.export_prompt_to_bytes(prompt_name)
+                    zipf.writestr(_unique_member_name(prompt_name, used_names), data)
+                    yield stream.drain()
+            yield stream.drain()
+
+        chunks = generate()
+        first_chunk = next(chunks)
+
+        return Response(
+            stream_with_context(itertools.chain([first_chunk], chunks)),
             mimetype="application/zip",
+            headers={
+                "Content-Disposition": "attachment; filename=all_prompts.zip",
+                "Cache-Control": "no-cache",
+            },
         )
     except Exception as e:
         return jsonify({"error": str(e)}), 500
+
+
+def _unique_member_name(prompt_name: str, used_names: Set[str]) -> str:
+    """Get a ZIP member name for a prompt that no earlier member uses.
+
+    Path separators are replaced, so distinct prompts such as ``p/0`` and
+    ``p_0`` can map to the same name; later ones get a numeric suffix.
+    """
+    safe_name = prompt_name.replace("/", "_").replace("\\", "_")
+    member_name = f"{safe_name}.json"
+    suffix = 2
+    while member_name in used_names:
+        member_name = f"{safe_name}_{suffix}.json"
+        suffix += 1
+    used_names.add(member_name)
+    return member_name
+
+
+class _ZipStream(io.RawIOBase):
+    """Write-only, non-seekable sink that buffers ZIP output until drained.
+
+    ZipFile falls back to data descriptors when it cannot seek, which lets the
+    archive be produced chunk by chunk.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        return len(data)
+
+    def drain(self) -> bytes:
+        """Return and clear everything written since the last call."""
+        chunk = bytes(self._buffer)
+        self._buffer.clear()
+        return chunk
@@ -1,19 +1,35 @@
 """Controller for prompt-related routes."""
 
-from flask import Blueprint, jsonify, current_app
+from flask import Blueprint, jsonify, current_app, request
+import hashlib
 from typing import Any
 
 
 prompts_bp = Blueprint("prompts", __name__, url_prefix="/api/prompts")
 
 
+def _data_etag(*parts: str) -> str:
+    """Build an ETag that changes whenever the stored data changes."""
+    versioner = current_app.versioner  # type: ignore[attr-defined]
+    token = repr((versioner.storage.get_data_version(), parts))
+    return hashlib.sha1(token.encode("utf-8"), usedforsecurity=False).hexdigest()
+
+
 @prompts_bp.route("", methods=["GET"])
 def get_prompts() -> Any:
     """Get all prompts with metadata."""
     try:
+        # Polling clients get 304 until something is written to the database
+        etag = _data_etag()
+        if request.if_none_match.contains(etag):
+            return "", 304
+
+        # Cached as the serialized body, so hits skip aggregation and encoding
         metrics_service = current_app.metrics_service  # type: ignore[attr-defined]
-        stats = metrics_service.get_global_stats()
-        return jsonify(stats)
+        body = metrics_service.get_global_stats_json()
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        return response
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -22,9 +38,15 @@ def get_prompts() -> Any:
 def get_prompt_stats(name: str) -> Any:
     """Get aggregated stats for a specific prompt."""
     try:
+        etag = _data_etag(name)
+        if request.if_none_match.contains(etag):
+            return "", 304
+
         metrics_service = current_app.metrics_service  # type: ignore[attr-defined]
-        stats = metrics_service.get_prompt_stats(name)
-        return jsonify(stats)
+        body = metrics_service.get_prompt_stats_json(name)
+        response = current_app.response_class(body, mimetype="application/json")
+        response.set_etag(etag)
+        return response
     except ValueError as e:
         return jsonify({"error": str(e)}), 404
     except Exception as e:
@@ -38,22 +60,22 @@ def get_ab_tests(name: str) -> Any:
         versioner = current_app.versioner  # type: ignore[attr-defined]
         config = current_app.config
 
-        versions = versioner.list_versions(name)
-
-        testable_versions = []
-        for v in versions:
-            summary = versioner.storage.get_metrics_summary(v["id"])
-            if summary and summary.get("call_count", 0) >= config["MIN_CALLS_FOR_AB_TEST"]:
-                testable_versions.append(
-                    {
-                        "version": v["version"],
-                        "timestamp": v["timestamp"],
-                        "call_count": summary["call_count"],
-                        "avg_quality": summary.get("avg_quality", 0),
-                        "avg_cost": summary.get("avg_cost", 0),
-                        "avg_latency": summary.get("avg_latency", 0),
-                    }
-                )
+        # Summaries for all versions in one grouped query, filtered in SQL
+        summaries = versioner.storage.get_prompt_metrics_summaries(
+            name, min_calls=config["MIN_CALLS_FOR_AB_TEST"]
+        )
+
+        testable_versions = [
+            {
+                "version": summary["version"],
+                "timestamp": summary["timestamp"],
+                "call_count": summary["call_count"],
+                "avg_quality": summary["avg_quality"],
+                "avg_cost": summary["avg_cost"],
+                "avg_latency": summary["avg_latency"],
+            }
+            for summary in summaries
+        ]
 
         return jsonify(testable_versions)
     except Exception as e:
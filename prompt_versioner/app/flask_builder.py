@@ -39,7 +39,9 @@ def create_app(versioner: Any, config_name: str | None = None) -> Flask:
     app.versioner = versioner  # type: ignore[attr-defined]
 
     # Initialize services
-    app.metrics_service = MetricsService(versioner)  # type: ignore[attr-defined]
+    app.metrics_service = MetricsService(  # type: ignore[attr-defined]
+        versioner, cache_ttl=app.config["METRICS_CACHE_TTL"]
+    )
     app.diff_service = DiffService(versioner)  # type: ignore[attr-defined]
     app.alert_service = AlertService(versioner, app.config)  # type: ignore[attr-defined]
 
@@ -49,6 +51,12 @@ def create_app(versioner: Any, config_name: str | None = None) -> Flask:
     app.register_blueprint(alerts_bp)
     app.register_blueprint(export_import_bp)
 
+    # Storage keeps one connection per thread for the whole request; release it
+    # afterwards so connections do not outlive the server's worker threads
+    @app.teardown_appcontext
+    def close_storage(error: BaseException | None) -> None:
+        versioner.storage.close()
+
     # Main route
     @app.route("/")
     def index() -> str:
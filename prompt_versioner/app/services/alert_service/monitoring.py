@@ -4,6 +4,8 @@ from typing import Dict, List, Optional, Callable, Any
 from prompt_versioner.app.models import Alert, AlertType
 import logging
 
+logger = logging.getLogger(__name__)
+
 
 class PerformanceMonitor:
     """Monitor prompt performance and trigger alerts."""
@@ -16,6 +18,7 @@ class PerformanceMonitor:
         """
         self.versioner = versioner
         self.alert_handlers = []  # type: List[Callable[[Alert], None]]
+        self.batch_alert_handlers = []  # type: List[Callable[[List[Alert]], None]]
 
     def add_alert_handler(self, handler: Callable[[Alert], None]) -> None:
         """Add alert handler function.
@@ -25,6 +28,17 @@ class PerformanceMonitor:
         """
         self.alert_handlers.append(handler)
 
+    def add_batch_alert_handler(self, handler: Callable[[List[Alert]], None]) -> None:
+        """Add a handler that receives all alerts of a check at once.
+
+        Called once per check_regression that raised alerts, so handlers can
+        format, write or forward the whole batch in a single operation.
+
+        Args:
+            handler: Function that receives the list of Alert objects
+        """
+        self.batch_alert_handlers.append(handler)
+
     def check_regression(
         self,
         name: str,
@@ -38,7 +52,8 @@ class PerformanceMonitor:
             name: Prompt name
             current_version: Current version to check
             baseline_version: Baseline version (uses previous if None)
-            thresholds: Dict of metric -> threshold (e.g., {"cost": 0.20} for 20%)
+            thresholds: Dict of metric -> threshold (e.g., {"cost": 0.20} for 20%).
+                Also accepts "latency_p95" to compare 95th percentile latency.
 
         Returns:
             List of triggered alerts
@@ -121,6 +136,42 @@ class PerformanceMonitor:
                         )
                     )
 
+        # Check tail latency increase (opt-in, computed in SQL); like the other
+        # checks it needs latency data for both versions
+        if (
+            "latency_p95" in thresholds
+            and baseline_metrics.get("avg_latency") is not None
+            and current_metrics.get("avg_latency") is not None
+        ):
+            baseline_p95 = self.versioner.storage.get_metric_percentiles(
+                baseline_v["id"], "latency_ms", [95]
+            )[95]
+            current_p95 = self.versioner.storage.get_metric_percentiles(
+                current_v["id"], "latency_ms", [95]
+            )[95]
+
+            if baseline_p95 and baseline_p95 > 0:
+                change = (current_p95 - baseline_p95) / baseline_p95
+
+                if change > thresholds["latency_p95"]:
+                    alerts.append(
+                        Alert(
+                            alert_type=AlertType.LATENCY_INCREASE,
+                            prompt_name=name,
+                            current_version=current_version,
+                            baseline_version=baseline_version,
+                            metric_name="p95_latency",
+                            baseline_value=baseline_p95,
+                            current_value=current_p95,
+                            change_percent=change * 100,
+                            threshold=thresholds["latency_p95"] * 100,
+                            message=(
+                                f"P95 latency increased by {change*100:.1f}% "
+                                f"(threshold: {thresholds['latency_p95']*100:.0f}%)"
+                            ),
+                        )
+                    )
+
         # Check quality decrease
         if "quality" in thresholds:
             baseline_quality = baseline_metrics.get("avg_quality", 0)
@@ -172,6 +223,13 @@ class PerformanceMonitor:
                 try:
                     handler(alert)
                 except Exception as e:
-                    logging.warning(f"Alert handler failed: {e}")
+                    logger.warning(f"Alert handler failed: {e}")
+
+        if alerts:
+            for batch_handler in self.batch_alert_handlers:
+                try:
+                    batch_handler(alerts)
+                except Exception as e:
+                    logger.warning(f"Batch alert handler failed: {e}")
 
         return alerts
@@ -1,18 +1,24 @@
 """Service for handling metrics operations."""
 
+import json
 from typing import Any, Dict, List
 
+from prompt_versioner.app.services.metrics_service.stats_cache import StatsCache
+
 
 class MetricsService:
     """Service for metrics aggregation and retrieval."""
 
-    def __init__(self, versioner: Any):
+    def __init__(self, versioner: Any, cache_ttl: float = 60.0):
         """Initialize service.
 
         Args:
             versioner: PromptVersioner instance
+            cache_ttl: Seconds aggregated stats are cached (0 disables caching).
+                Cached stats are also refreshed whenever the database changes.
         """
         self.versioner = versioner
+        self.cache = StatsCache(cache_ttl, data_version=versioner.storage.get_data_version)
 
     def get_global_stats(self) -> Dict[str, Any]:
         """Get global statistics across all prompts.
@@ -20,6 +26,44 @@ class MetricsService:
         Returns:
             Dictionary with global stats
         """
+        return self.cache.get_or_compute(("global",), self._compute_global_stats)
+
+    def get_prompt_stats(self, name: str) -> Dict[str, Any]:
+        """Get aggregated stats for a specific prompt.
+
+        Args:
+            name: Prompt name
+
+        Returns:
+            Dictionary with prompt stats
+        """
+        return self.cache.get_or_compute(("prompt", name), lambda: self._compute_prompt_stats(name))
+
+    def get_global_stats_json(self) -> bytes:
+        """Get global statistics already serialized as a JSON body.
+
+        Returns:
+            UTF-8 encoded JSON, cached so repeated requests skip serialization
+        """
+        return self.cache.get_or_compute(
+            ("global", "json"), lambda: _to_json(self._compute_global_stats())
+        )
+
+    def get_prompt_stats_json(self, name: str) -> bytes:
+        """Get aggregated stats for a specific prompt serialized as a JSON body.
+
+        Args:
+            name: Prompt name
+
+        Returns:
+            UTF-8 encoded JSON, cached so repeated requests skip serialization
+        """
+        return self.cache.get_or_compute(
+            ("prompt", name, "json"), lambda: _to_json(self._compute_prompt_stats(name))
+        )
+
+    def _compute_global_stats(self) -> Dict[str, Any]:
+        """Compute global statistics across all prompts."""
         prompts = self.versioner.list_prompts()
 
         prompt_data = []
@@ -57,15 +101,8 @@ class MetricsService:
             "total_calls": total_calls,
         }
 
-    def get_prompt_stats(self, name: str) -> Dict[str, Any]:
-        """Get aggregated stats for a specific prompt.
-
-        Args:
-            name: Prompt name
-
-        Returns:
-            Dictionary with prompt stats
-        """
+    def _compute_prompt_stats(self, name: str) -> Dict[str, Any]:
+        """Compute aggregated stats for a specific prompt."""
         versions = self.versioner.list_versions(name)
 
         if not versions:
@@ -91,7 +128,8 @@ class MetricsService:
                 if summary.get("avg_quality"):
                     all_quality_scores.append(summary["avg_quality"])
 
-                metrics = self.versioner.storage.get_metrics(v["id"])
+                # Only model names are read, so skip decoding metadata
+                metrics = self.versioner.storage.iter_metrics(v["id"], decode_metadata=False)
                 for m in metrics:
                     if m.get("model_name"):
                         models_used.add(m["model_name"])
@@ -135,7 +173,7 @@ class MetricsService:
             v["metrics_summary"] = self.versioner.storage.get_metrics_summary(v["id"])
 
             # Get model name from metrics
-            metrics_list = self.versioner.storage.get_metrics(v["id"])
+            metrics_list = self.versioner.storage.get_metrics(v["id"], decode_metadata=False)
             model_name = None
             if metrics_list:
                 model_names = [m.get("model_name") for m in metrics_list if m.get("model_name")]
@@ -149,3 +187,8 @@ class MetricsService:
             v["annotations"] = annotations
 
         return versions
+
+
+def _to_json(value: Any) -> bytes:
+    """Serialize a response payload the way jsonify does (sorted, compact)."""
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8")
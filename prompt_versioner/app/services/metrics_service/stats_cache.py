@@ -0,0 +1,64 @@
+"""In-memory cache for aggregated dashboard statistics."""
+
+import copy
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class StatsCache:
+    """Thread-safe TTL cache for computed statistics.
+
+    Entries expire after ``ttl`` seconds and are also dropped as soon as the
+    data version reported by ``data_version`` changes, so writes (new metrics,
+    saved, rolled back or deleted versions) are visible on the next request.
+    """
+
+    def __init__(self, ttl: float = 60.0, data_version: Optional[Callable[[], Hashable]] = None):
+        """Initialize cache.
+
+        Args:
+            ttl: Seconds an entry stays valid. 0 or less disables caching
+            data_version: Optional callable returning a token that changes
+                whenever the underlying data changes
+        """
+        self.ttl = ttl
+        self._data_version = data_version
+        self._entries: Dict[Hashable, Tuple[float, Hashable, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Return the cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            compute: Function producing the value
+
+        Returns:
+            A copy of the cached value, safe for the caller to modify
+        """
+        if self.ttl <= 0:
+            return compute()
+
+        version = self._data_version() if self._data_version else None
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, entry_version, value = entry
+            if now < expires_at and entry_version == version:
+                return copy.deepcopy(value)
+
+        # Compute outside the lock so slow queries do not block other keys
+        value = compute()
+        with self._lock:
+            self._entries[key] = (now + self.ttl, version, value)
+        return copy.deepcopy(value)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        with self._lock:
+            self._entries.clear()
@@ -1,6 +1,20 @@
 """Command-line interface for prompt-versioner."""
 
+from typing import TYPE_CHECKING, Any
+
 from prompt_versioner.cli.main_cli import cli, main
-from prompt_versioner.cli.commands.dashboard import dashboard_standalone
+
+if TYPE_CHECKING:
+    from prompt_versioner.cli.commands.dashboard import dashboard_standalone
+
+
+def __getattr__(name: str) -> Any:
+    # Importing the CLI package should not load the dashboard command module
+    if name == "dashboard_standalone":
+        from prompt_versioner.cli.commands.dashboard import dashboard_standalone
+
+        return dashboard_standalone
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["cli", "main", "dashboard_standalone"]
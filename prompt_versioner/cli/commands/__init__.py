@@ -1,11 +1,7 @@
-"""CLI commands modules."""
+"""CLI commands modules.
 
-# Import all command modules to register them with the CLI group
-from prompt_versioner.cli.commands import init
-from prompt_versioner.cli.commands import prompts
-from prompt_versioner.cli.commands import diff
-from prompt_versioner.cli.commands import management
-from prompt_versioner.cli.commands import dashboard
-from prompt_versioner.cli.commands import pricing
+Command modules are not imported here: the main group loads each one on first
+use (see ``LAZY_COMMANDS`` in ``prompt_versioner.cli.main_cli``).
+"""
 
 __all__ = ["init", "prompts", "diff", "management", "dashboard", "pricing"]
@@ -2,61 +2,74 @@
 
 import click
 from pathlib import Path
+from typing import Optional
 from rich.table import Table
-from prompt_versioner.cli.main_cli import cli
 from prompt_versioner.cli.utils import format_dashboard_info, print_success, print_warning, console
 
+# Database location auto-detected in the current directory
+DEFAULT_DB_PATH = Path(".prompt_versions") / "db.sqlite"
 
-@cli.command()
-@click.option("--port", "-p", default=5000, help="Port to run dashboard on")
-@click.option("--host", "-h", default="127.0.0.1", help="Host to bind to (default: localhost)")
-@click.option("--db-path", type=click.Path(), default=None, help="Custom database path")
-@click.pass_context
-def dashboard(ctx: click.Context, port: int, host: str, db_path: str) -> None:
-    """Launch web dashboard (auto-detects database in current directory)."""
-    from prompt_versioner.core import PromptVersioner
-    from prompt_versioner.app import create_app
 
-    project = ctx.obj.get("project", "default")
+def _find_database(db_path: Optional[str]) -> Optional[Path]:
+    """Resolve the database to serve and report where it comes from.
 
-    # Auto-detect database in current directory
-    default_db_dir = Path.cwd() / ".prompt_versions"
-    default_db_path = default_db_dir / "db.sqlite"
+    Args:
+        db_path: Database path given on the command line, if any
 
+    Returns:
+        Path of the database, or None if a new one will be created
+    """
     if db_path:
-        db_path_obj = Path(db_path)
-        console.print(f"[cyan]Using database:[/cyan] {db_path_obj}")
-    elif default_db_path.exists():
-        db_path_obj = default_db_path
-        print_success(f"Found database: {db_path_obj}")
-    else:
-        db_path_obj = None
-        print_warning("No database found, will create new one")
-        if not project or project == "default":
-            project = click.prompt("Enter project name", default=Path.cwd().name)
+        console.print(f"[cyan]Using database:[/cyan] {db_path}")
+        return Path(db_path)
+
+    default_db_path = Path.cwd() / DEFAULT_DB_PATH
+    if default_db_path.exists():
+        print_success(f"Found database: {default_db_path}")
+        return default_db_path
+
+    print_warning("No database found, will create new one")
+    return None
+
+
+def _run_dashboard(
+    project: str, db_path: Optional[Path], host: str, port: int, debug: bool = False
+) -> None:
+    """Print the startup summary and serve the dashboard until interrupted.
+
+    Args:
+        project: Project name
+        db_path: Database path, or None for the default location
+        host: Host to bind to
+        port: Port to run dashboard on
+        debug: Run Flask in debug mode
+    """
+    from prompt_versioner.core import PromptVersioner
+    from prompt_versioner.app import create_app
 
     # Display startup info
     panel = format_dashboard_info(
-        project=project, db_path=str(db_path_obj or default_db_path), port=port
+        project=project, db_path=str(db_path or Path.cwd() / DEFAULT_DB_PATH), port=port
     )
     console.print(panel)
 
     # Create versioner
-    pv = PromptVersioner(project_name=project, db_path=db_path_obj, enable_git=False)
+    pv = PromptVersioner(project_name=project, db_path=db_path, enable_git=False)
 
     # Show current stats
-    prompts = pv.list_prompts()
+    # Version count and latest version per prompt in one query
+    prompts = pv.list_prompt_summaries()
     if prompts:
         table = Table(title="Current Prompts")
         table.add_column("Name", style="cyan")
         table.add_column("Versions", style="magenta")
         table.add_column("Latest", style="green")
 
-        for prompt_name in prompts[:10]:
-            versions = pv.list_versions(prompt_name)
-            latest = versions[0] if versions else None
+        for summary in prompts[:10]:
             table.add_row(
-                prompt_name, str(len(versions)), latest["version"][:20] if latest else "N/A"
+                summary["name"],
+                str(summary["version_count"]),
+                summary["latest_version"][:20],
             )
 
         console.print(table)
@@ -72,83 +85,52 @@ def dashboard(ctx: click.Context, port: int, host: str, db_path: str) -> None:
 
     try:
         app = create_app(pv)
-        app.run(host=host, port=port, debug=False)
+        app.run(host=host, port=port, debug=debug)
     except KeyboardInterrupt:
         print_warning("\nDashboard stopped")
 
 
+@click.command()
+@click.option("--port", "-p", default=5000, help="Port to run dashboard on")
+@click.option("--host", "-h", default="127.0.0.1", help="Host to bind to (default: localhost)")
+@click.option("--db-path", type=click.Path(), default=None, help="Custom database path")
+@click.option(
+    "--debug/--no-debug",
+    default=False,
+    help="Run Flask in debug mode (starts a reloader child process that loads the app twice)",
+)
+@click.pass_context
+def dashboard(ctx: click.Context, port: int, host: str, db_path: str, debug: bool) -> None:
+    """Launch web dashboard (auto-detects database in current directory)."""
+    project = ctx.obj.get("project", "default")
+
+    db_path_obj = _find_database(db_path)
+    if db_path_obj is None and (not project or project == "default"):
+        project = click.prompt("Enter project name", default=Path.cwd().name)
+
+    _run_dashboard(project, db_path_obj, host, port, debug=debug)
+
+
 # Standalone command (can be called directly without CLI group)
 @click.command()
 @click.option("--port", "-p", default=5000, help="Port to run dashboard on")
 @click.option("--host", "-h", default="127.0.0.1", help="Host to bind to (default: localhost)")
 @click.option("--project", default=None, help="Project name")
 @click.option("--db-path", type=click.Path(), default=None, help="Database path")
-def dashboard_standalone(port: int, host: str, project: str, db_path: str) -> None:
+@click.option(
+    "--debug/--no-debug",
+    default=False,
+    help="Run Flask in debug mode (starts a reloader child process that loads the app twice)",
+)
+def dashboard_standalone(port: int, host: str, project: str, db_path: str, debug: bool) -> None:
     """Launch Prompt Versioner Dashboard (standalone).
 
     Auto-detects database in current directory (.prompt_versions/db.sqlite)
     or creates new one if not found.
     """
-    from prompt_versioner.core import PromptVersioner
-    from prompt_versioner.app import create_app
-    from rich.console import Console
-    from rich.table import Table
-
-    console = Console()
-
-    # Auto-detect database
-    default_db_dir = Path.cwd() / ".prompt_versions"
-    default_db_path = default_db_dir / "db.sqlite"
-
-    if db_path:
-        db_path_obj = Path(db_path)
-        console.print(f"[cyan]Using database:[/cyan] {db_path_obj}")
-    elif default_db_path.exists():
-        db_path_obj = default_db_path
-        console.print(f"[green]✓ Found database:[/green] {db_path_obj}")
-    else:
-        db_path_obj = None
-        console.print("[yellow]No database found, will create new one[/yellow]")
+    db_path_obj = _find_database(db_path)
 
     if not project:
         project = Path.cwd().name
 
-    panel = format_dashboard_info(
-        project=project, db_path=str(db_path_obj or default_db_path), port=port
-    )
-    console.print(panel)
-
-    # Create versioner
-    pv = PromptVersioner(project_name=project, db_path=db_path_obj, enable_git=False)
-
-    # Show stats
-    prompts = pv.list_prompts()
-    if prompts:
-        table = Table(title="Current Prompts")
-        table.add_column("Name", style="cyan")
-        table.add_column("Versions", style="magenta")
-        table.add_column("Latest", style="green")
-
-        for prompt_name in prompts[:10]:
-            versions = pv.list_versions(prompt_name)
-            latest = versions[0] if versions else None
-            table.add_row(
-                prompt_name, str(len(versions)), latest["version"][:20] if latest else "N/A"
-            )
-
-        console.print(table)
-
-        if len(prompts) > 10:
-            console.print(f"\n[dim]... and {len(prompts) - 10} more prompts[/dim]")
-    else:
-        console.print("\n[yellow]No prompts tracked yet[/yellow]")
-        console.print("[dim]Start using PromptVersioner in your code to see data here[/dim]\n")
-
-    console.print(f"\n[bold green]Dashboard: http://localhost:{port}[/bold green]")
-    console.print("[dim]Press Ctrl+C to stop[/dim]\n")
-
-    try:
-        app = create_app(pv)
-        app.run(host=host, port=port, debug=False)
-    except KeyboardInterrupt:
-        console.print("\n\n[yellow]Dashboard stopped[/yellow]")
+    _run_dashboard(project, db_path_obj, host, port, debug=debug)
@@ -1,8 +1,6 @@
 """Commands for diffing and comparing versions."""
 
 import click
-from prompt_versioner.app.services.diff_service import DiffEngine
-from prompt_versioner.cli.main_cli import cli
 from prompt_versioner.cli.utils.formatters import (
     format_diff_panel,
     format_comparison_table,
@@ -11,13 +9,15 @@ from prompt_versioner.cli.utils.formatters import (
 )
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.argument("version1")
 @click.argument("version2")
 @click.pass_context
 def diff(ctx: click.Context, name: str, version1: str, version2: str) -> None:
     """Show diff between two versions."""
+    from prompt_versioner.app.services.diff_service import DiffEngine
+
     versioner = ctx.obj["versioner"]
 
     try:
@@ -35,7 +35,7 @@ def diff(ctx: click.Context, name: str, version1: str, version2: str) -> None:
         print_error(str(e))
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.argument("versions", nargs=-1)
 @click.pass_context
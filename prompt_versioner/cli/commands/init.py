@@ -2,7 +2,6 @@
 
 import click
 from pathlib import Path
-from prompt_versioner.cli.main_cli import cli
 from prompt_versioner.cli.utils.formatters import (
     print_success,
     print_error,
@@ -12,7 +11,7 @@ from prompt_versioner.cli.utils.formatters import (
 )
 
 
-@cli.command()
+@click.command()
 @click.pass_context
 def init(ctx: click.Context) -> None:
     """Initialize prompt versioner in current directory."""
@@ -31,7 +30,7 @@ def init(ctx: click.Context) -> None:
             print_success("Git hooks installed")
 
 
-@cli.command()
+@click.command()
 @click.pass_context
 def install_hooks(ctx: click.Context) -> None:
     """Install Git hooks for automatic versioning."""
@@ -44,7 +43,7 @@ def install_hooks(ctx: click.Context) -> None:
         print_error(str(e))
 
 
-@cli.command()
+@click.command()
 @click.pass_context
 def uninstall_hooks(ctx: click.Context) -> None:
     """Uninstall Git hooks."""
@@ -57,7 +56,7 @@ def uninstall_hooks(ctx: click.Context) -> None:
         print_error(str(e))
 
 
-@cli.command()
+@click.command()
 @click.option("--pre-commit", is_flag=True, help="Run in pre-commit mode")
 @click.option("--post-commit", is_flag=True, help="Run in post-commit mode")
 @click.pass_context
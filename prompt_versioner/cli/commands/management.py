@@ -1,19 +1,20 @@
 """Commands for managing versions (rollback, delete)."""
 
 import click
-from prompt_versioner.cli.main_cli import cli
-from prompt_versioner.cli.utils.formatters import print_success, print_error, print_warning, console
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.argument("to_version")
+@click.option("--yes", "-y", is_flag=True, default=False, help="Skip confirmation prompt")
 @click.pass_context
-def rollback(ctx: click.Context, name: str, to_version: str) -> None:
+def rollback(ctx: click.Context, name: str, to_version: str, yes: bool) -> None:
     """Rollback to a previous version."""
+    from prompt_versioner.cli.utils.formatters import print_success, print_error, console
+
     versioner = ctx.obj["versioner"]
 
-    if not click.confirm(f"Rollback '{name}' to version '{to_version}'?"):
+    if not (yes or click.confirm(f"Rollback '{name}' to version '{to_version}'?")):
         return
 
     try:
@@ -24,30 +25,30 @@ def rollback(ctx: click.Context, name: str, to_version: str) -> None:
         print_error(str(e))
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.option("--delete-all", is_flag=True, help="Delete all versions")
 @click.argument("version", required=False)
+@click.option("--yes", "-y", is_flag=True, default=False, help="Skip confirmation prompt")
 @click.pass_context
-def delete(ctx: click.Context, name: str, version: str, delete_all: bool) -> None:
+def delete(ctx: click.Context, name: str, version: str, delete_all: bool, yes: bool) -> None:
     """Delete a specific version or all versions of a prompt."""
+    from prompt_versioner.cli.utils.formatters import print_success, print_error, print_warning
+
     versioner = ctx.obj["versioner"]
 
     if delete_all:
-        if not click.confirm(f"Delete ALL versions of '{name}'?", abort=True):
+        if not (yes or click.confirm(f"Delete ALL versions of '{name}'?", abort=True)):
             return
 
-        versions = versioner.list_versions(name)
-        for v in versions:
-            versioner.storage.delete_version(name, v["version"])
-
-        print_success(f"Deleted {len(versions)} versions of '{name}'")
+        deleted = versioner.storage.delete_versions(name)
+        print_success(f"Deleted {deleted} versions of '{name}'")
 
     elif version:
-        if not click.confirm(f"Delete version '{version}' of '{name}'?", abort=True):
+        if not (yes or click.confirm(f"Delete version '{version}' of '{name}'?", abort=True)):
             return
 
-        if versioner.storage.delete_version(name, version):
+        if versioner.delete_version(name, version):
             print_success(f"Deleted version '{version}'")
         else:
             print_error(f"Version '{version}' not found")
@@ -56,11 +57,13 @@ def delete(ctx: click.Context, name: str, version: str, delete_all: bool) -> Non
         print_warning("Specify a version or use --delete-all")
 
 
-@cli.command("clear-db")
+@click.command("clear-db")
 @click.option("--force", is_flag=True, help="Skip confirmation prompt")
 @click.pass_context
 def clear_db(ctx: click.Context, force: bool) -> None:
     """Clear all prompts and data from the database."""
+    from prompt_versioner.cli.utils.formatters import print_success, console
+
     versioner = ctx.obj["versioner"]
 
     # Get all prompts
@@ -73,10 +76,9 @@ def clear_db(ctx: click.Context, force: bool) -> None:
     # Show what will be deleted
     console.print(f"\n📊 [yellow]Found {len(prompts)} prompt(s):[/yellow]")
     total_versions = 0
-    for prompt in prompts:
-        versions = versioner.list_versions(prompt)
-        total_versions += len(versions)
-        console.print(f"   • {prompt} ({len(versions)} versions)")
+    for summary in versioner.list_prompt_summaries():
+        total_versions += summary["version_count"]
+        console.print(f"   • {summary['name']} ({summary['version_count']} versions)")
 
     console.print(f"\n📈 [red]Total: {total_versions} versions across {len(prompts)} prompts[/red]")
 
@@ -99,10 +101,7 @@ def clear_db(ctx: click.Context, force: bool) -> None:
     with console.status("[spinner] Deleting prompts...") as status:
         for prompt in prompts:
             status.update(f"[spinner] Deleting {prompt}...")
-            versions = versioner.list_versions(prompt)
-            for version in versions:
-                versioner.storage.delete_version(prompt, version["version"])
-                deleted_count += 1
+            deleted_count += versioner.storage.delete_versions(prompt)
 
     # Clean up database
     console.print("🧹 [yellow]Cleaning up database...[/yellow]")
@@ -124,6 +123,7 @@ def clear_db(ctx: click.Context, force: bool) -> None:
 def clear_db_standalone(force: bool, project: str, db_path: str) -> None:
     """Clear all prompts and data from the database (standalone)."""
     from prompt_versioner.core import PromptVersioner
+    from prompt_versioner.cli.utils.formatters import console
     from pathlib import Path
 
     # Auto-detect database
@@ -159,10 +159,9 @@ def clear_db_standalone(force: bool, project: str, db_path: str) -> None:
     # Show what will be deleted
     console.print(f"\n📊 [yellow]Found {len(prompts)} prompt(s):[/yellow]")
     total_versions = 0
-    for prompt in prompts:
-        versions = versioner.list_versions(prompt)
-        total_versions += len(versions)
-        console.print(f"   • {prompt} ({len(versions)} versions)")
+    for summary in versioner.list_prompt_summaries():
+        total_versions += summary["version_count"]
+        console.print(f"   • {summary['name']} ({summary['version_count']} versions)")
 
     console.print(f"\n📈 [red]Total: {total_versions} versions across {len(prompts)} prompts[/red]")
 
@@ -185,10 +184,7 @@ def clear_db_standalone(force: bool, project: str, db_path: str) -> None:
     with console.status("[spinner] Deleting prompts...") as status:
         for prompt in prompts:
             status.update(f"[spinner] Deleting {prompt}...")
-            versions = versioner.list_versions(prompt)
-            for version in versions:
-                versioner.storage.delete_version(prompt, version["version"])
-                deleted_count += 1
+            deleted_count += versioner.storage.delete_versions(prompt)
 
     # Clean up database
     console.print("🧹 [yellow]Cleaning up database...[/yellow]")
@@ -2,7 +2,6 @@
 
 import click
 from typing import Optional, List, Dict, Any, cast
-from prompt_versioner.cli.main_cli import cli
 from prompt_versioner.cli.utils.formatters import (
     print_info,
     print_warning,
@@ -13,7 +12,7 @@ from rich.table import Table
 import json
 
 
-@cli.command()
+@click.command()
 @click.option(
     "--format",
     type=click.Choice(["table", "json"]),
@@ -153,7 +152,7 @@ def models(
             console.print(f"  [cyan]{cast(str, model['name']):<25}[/cyan] €{cost:.6f}")
 
 
-@cli.command()
+@click.command()
 @click.argument("model_name")
 @click.argument("input_tokens", type=int)
 @click.argument("output_tokens", type=int)
@@ -203,7 +202,7 @@ def estimate_cost(
     console.print(table)
 
 
-@cli.command()
+@click.command()
 @click.argument("input_tokens", type=int)
 @click.argument("output_tokens", type=int)
 @click.option("--top", type=int, default=5, help="Show top N cheapest models")
@@ -1,20 +1,18 @@
 """Commands for listing and viewing prompts."""
 
-from typing import Dict, List
 import click
-from prompt_versioner.cli.main_cli import cli
 from prompt_versioner.cli.utils.formatters import (
     format_prompts_table,
     format_versions_table,
     format_version_detail,
-    format_metrics_table,
+    format_metric_stats_table,
     print_warning,
     print_error,
     console,
 )
 
 
-@cli.command()
+@click.command()
 @click.pass_context
 def list(ctx: click.Context) -> None:
     """List all tracked prompts."""
@@ -29,7 +27,7 @@ def list(ctx: click.Context) -> None:
     console.print(table)
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.pass_context
 def versions(ctx: click.Context, name: str) -> None:
@@ -45,7 +43,7 @@ def versions(ctx: click.Context, name: str) -> None:
     console.print(table)
 
 
-@cli.command()
+@click.command()
 @click.argument("name")
 @click.argument("version")
 @click.pass_context
@@ -62,25 +60,14 @@ def show(ctx: click.Context, name: str, version: str) -> None:
     format_version_detail(name, v)
 
     # Show metrics if available
-    metrics = versioner.storage.get_metrics(v["id"])
-    if metrics:
+    if versioner.storage.get_metrics_summary(v["id"])["call_count"]:
         console.print("\n[bold]Metrics:[/bold]")
 
-        # Aggregate metrics for display
-        aggregated: Dict[str, List[float]] = {}
-        for metric in metrics:
-            for key, value in metric.items():
-                if (
-                    key not in ["id", "version_id", "timestamp", "metadata", "error_message"]
-                    and value is not None
-                ):
-                    if isinstance(value, (int, float)):
-                        if key not in aggregated:
-                            aggregated[key] = []
-                        aggregated[key].append(float(value))
-
-        if aggregated:
-            table = format_metrics_table(aggregated)
+        # Per-metric count/avg/min/max aggregated in SQL, no metric rows loaded
+        stats = versioner.storage.get_metric_column_stats(v["id"])
+
+        if stats:
+            table = format_metric_stats_table(stats)
             console.print(table)
         else:
             console.print("No numeric metrics available for this version.")
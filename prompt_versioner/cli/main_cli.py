@@ -1,10 +1,61 @@
 """Main CLI group and entry point."""
 
+import importlib
+from typing import Any, Dict, List, Optional
+
 import click
 from prompt_versioner.core import PromptVersioner
 
+# Command name -> "module:attribute"; a module is imported only when one of its
+# commands is invoked
+LAZY_COMMANDS: Dict[str, str] = {
+    "init": "prompt_versioner.cli.commands.init:init",
+    "install-hooks": "prompt_versioner.cli.commands.init:install_hooks",
+    "uninstall-hooks": "prompt_versioner.cli.commands.init:uninstall_hooks",
+    "auto-version": "prompt_versioner.cli.commands.init:auto_version",
+    "list": "prompt_versioner.cli.commands.prompts:list",
+    "versions": "prompt_versioner.cli.commands.prompts:versions",
+    "show": "prompt_versioner.cli.commands.prompts:show",
+    "diff": "prompt_versioner.cli.commands.diff:diff",
+    "compare": "prompt_versioner.cli.commands.diff:compare",
+    "rollback": "prompt_versioner.cli.commands.management:rollback",
+    "delete": "prompt_versioner.cli.commands.management:delete",
+    "clear-db": "prompt_versioner.cli.commands.management:clear_db",
+    "dashboard": "prompt_versioner.cli.commands.dashboard:dashboard",
+    "models": "prompt_versioner.cli.commands.pricing:models",
+    "estimate-cost": "prompt_versioner.cli.commands.pricing:estimate_cost",
+    "compare-costs": "prompt_versioner.cli.commands.pricing:compare_costs",
+}
+
+
+class LazyGroup(click.Group):
+    """Click group that imports command modules on demand."""
+
+    def __init__(
+        self, *args: Any, lazy_commands: Optional[Dict[str, str]] = None, **kwargs: Any
+    ) -> None:
+        """Initialize group.
+
+        Args:
+            lazy_commands: Mapping of command name to "module:attribute"
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_commands = lazy_commands or {}
 
-@click.group()
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted({*super().list_commands(ctx), *self.lazy_commands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        if cmd_name in self.lazy_commands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_commands[cmd_name].split(":")
+            command = getattr(importlib.import_module(module_name), attr)
+            if not isinstance(command, click.Command):
+                raise ValueError(f"Lazy command '{cmd_name}' is not a click.Command")
+            self.add_command(command, cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS)
 @click.option("--project", default="default", help="Project name")
 @click.pass_context
 def cli(ctx: click.Context, project: str) -> None:
@@ -16,8 +67,6 @@ def cli(ctx: click.Context, project: str) -> None:
 
 def main() -> None:
     """Entry point for CLI."""
-    # Import commands to register them
-
     cli()
 
 
@@ -1,11 +1,13 @@
 """Utilities for CLI."""
 
+from typing import Any
+
 from prompt_versioner.cli.utils.formatters import (
-    console,
     format_prompts_table,
     format_versions_table,
     format_version_detail,
     format_metrics_table,
+    format_metric_stats_table,
     format_comparison_table,
     format_diff_panel,
     format_dashboard_info,
@@ -15,12 +17,23 @@ from prompt_versioner.cli.utils.formatters import (
     print_info,
 )
 
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``console`` on first access so importing utils does not load rich."""
+    if name == "console":
+        from prompt_versioner.cli.utils import formatters
+
+        return formatters.console
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     "console",
     "format_prompts_table",
     "format_versions_table",
     "format_version_detail",
     "format_metrics_table",
+    "format_metric_stats_table",
     "format_comparison_table",
     "format_diff_panel",
     "format_dashboard_info",
@@ -1,15 +1,35 @@
 """Formatting utilities for CLI output."""
 
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any, Optional
 
+# rich is imported on first use so loading the CLI does not pay for it
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.panel import Panel
 
-console = Console()
 
+_console: Optional["Console"] = None
 
-def format_prompts_table(prompts: List[str], versioner: Any) -> Table:
+
+def _get_console() -> "Console":
+    """Get the shared console, creating it on first use."""
+    global _console
+    if _console is None:
+        from rich.console import Console
+
+        _console = Console()
+    return _console
+
+
+def __getattr__(name: str) -> Any:
+    """Create the module-level ``console`` lazily (PEP 562)."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def format_prompts_table(prompts: List[str], versioner: Any) -> "Table":
     """Format prompts list as table.
 
     Args:
@@ -19,25 +39,29 @@ def format_prompts_table(prompts: List[str], versioner: Any) -> Table:
     Returns:
         Rich Table
     """
+    from rich.table import Table
+
     table = Table(title="Tracked Prompts")
     table.add_column("Name", style="cyan")
     table.add_column("Versions", style="magenta")
     table.add_column("Latest", style="green")
 
+    # Version counts and latest versions for all prompts in one query
+    summaries = {summary["name"]: summary for summary in versioner.list_prompt_summaries()}
+
     for prompt in prompts:
-        versions = versioner.list_versions(prompt)
-        latest = versions[0] if versions else None
+        summary = summaries.get(prompt)
 
         table.add_row(
             prompt,
-            str(len(versions)),
-            latest["version"] if latest else "N/A",
+            str(summary["version_count"]) if summary else "0",
+            summary["latest_version"] if summary else "N/A",
         )
 
     return table
 
 
-def format_versions_table(name: str, versions: List[Dict[str, Any]]) -> Table:
+def format_versions_table(name: str, versions: List[Dict[str, Any]]) -> "Table":
     """Format versions list as table.
 
     Args:
@@ -47,6 +71,8 @@ def format_versions_table(name: str, versions: List[Dict[str, Any]]) -> Table:
     Returns:
         Rich Table
     """
+    from rich.table import Table
+
     table = Table(title=f"Versions of '{name}'")
     table.add_column("Version", style="cyan")
     table.add_column("Timestamp", style="green")
@@ -69,6 +95,10 @@ def format_version_detail(name: str, version: Dict[str, Any]) -> None:
         name: Prompt name
         version: Version dict
     """
+    from rich.panel import Panel
+
+    console = _get_console()
+
     # Metadata panel
     console.print(
         Panel(
@@ -89,7 +119,7 @@ def format_version_detail(name: str, version: Dict[str, Any]) -> None:
     console.print(Panel(version["user_prompt"], border_style="magenta"))
 
 
-def format_metrics_table(metrics: Dict[str, List[float]]) -> Table:
+def format_metrics_table(metrics: Dict[str, List[float]]) -> "Table":
     """Format metrics as table.
 
     Args:
@@ -98,6 +128,30 @@ def format_metrics_table(metrics: Dict[str, List[float]]) -> Table:
     Returns:
         Rich Table
     """
+    stats = {
+        metric_name: {
+            "count": len(values),
+            "avg": sum(values) / len(values),
+            "min": min(values),
+            "max": max(values),
+        }
+        for metric_name, values in metrics.items()
+        if values
+    }
+    return format_metric_stats_table(stats)
+
+
+def format_metric_stats_table(stats: Dict[str, Dict[str, Any]]) -> "Table":
+    """Format precomputed metric statistics as table.
+
+    Args:
+        stats: Dict of metric name to its count, avg, min and max
+
+    Returns:
+        Rich Table
+    """
+    from rich.table import Table
+
     table = Table(title="Metrics")
     table.add_column("Metric", style="cyan")
     table.add_column("Count", style="yellow")
@@ -105,20 +159,19 @@ def format_metrics_table(metrics: Dict[str, List[float]]) -> Table:
     table.add_column("Min", style="blue")
     table.add_column("Max", style="magenta")
 
-    for metric_name, values in metrics.items():
-        if values:
-            table.add_row(
-                metric_name,
-                str(len(values)),
-                f"{sum(values)/len(values):.4f}",
-                f"{min(values):.4f}",
-                f"{max(values):.4f}",
-            )
+    for metric_name, metric_stats in stats.items():
+        table.add_row(
+            metric_name,
+            str(metric_stats["count"]),
+            f"{metric_stats['avg']:.4f}",
+            f"{metric_stats['min']:.4f}",
+            f"{metric_stats['max']:.4f}",
+        )
 
     return table
 
 
-def format_comparison_table(name: str, comparison: Dict[str, Any]) -> Table:
+def format_comparison_table(name: str, comparison: Dict[str, Any]) -> "Table":
     """Format version comparison as table.
 
     Args:
@@ -128,6 +181,8 @@ def format_comparison_table(name: str, comparison: Dict[str, Any]) -> Table:
     Returns:
         Rich Table
     """
+    from rich.table import Table
+
     table = Table(title=f"Comparison: {name}")
     table.add_column("Version", style="cyan")
     table.add_column("Timestamp", style="green")
@@ -135,7 +190,7 @@ def format_comparison_table(name: str, comparison: Dict[str, Any]) -> Table:
 
     for v_data in comparison["versions"]:
         metrics_str = (
-            ", ".join(f"{k}: {sum(v)/len(v):.2f}" for k, v in v_data["metrics"].items() if v)
+            ", ".join(f"{k}: {avg:.2f}" for k, avg in v_data["metrics"].items())
             or "No metrics"
         )
 
@@ -148,7 +203,7 @@ def format_comparison_table(name: str, comparison: Dict[str, Any]) -> Table:
     return table
 
 
-def format_diff_panel(version1: str, version2: str, summary: str) -> Panel:
+def format_diff_panel(version1: str, version2: str, summary: str) -> "Panel":
     """Format diff summary as panel.
 
     Args:
@@ -159,6 +214,8 @@ def format_diff_panel(version1: str, version2: str, summary: str) -> Panel:
     Returns:
         Rich Panel
     """
+    from rich.panel import Panel
+
     return Panel(
         summary,
         title=f"Diff: {version1} → {version2}",
@@ -166,7 +223,7 @@ def format_diff_panel(version1: str, version2: str, summary: str) -> Panel:
     )
 
 
-def format_dashboard_info(project: str, db_path: str, port: int) -> Panel:
+def format_dashboard_info(project: str, db_path: str, port: int) -> "Panel":
     """Format dashboard startup info.
 
     Args:
@@ -177,6 +234,8 @@ def format_dashboard_info(project: str, db_path: str, port: int) -> Panel:
     Returns:
         Rich Panel
     """
+    from rich.panel import Panel
+
     return Panel(
         f"[cyan]Project:[/cyan] {project}\n"
         f"[cyan]Database:[/cyan] {db_path}\n"
@@ -188,19 +247,19 @@ def format_dashboard_info(project: str, db_path: str, port: int) -> Panel:
 
 def print_success(message: str) -> None:
     """Print success message."""
-    console.print(f"[green]✓[/green] {message}")
+    _get_console().print(f"[green]✓[/green] {message}")
 
 
 def print_error(message: str) -> None:
     """Print error message."""
-    console.print(f"[red]Error:[/red] {message}")
+    _get_console().print(f"[red]Error:[/red] {message}")
 
 
 def print_warning(message: str) -> None:
     """Print warning message."""
-    console.print(f"[yellow]{message}[/yellow]")
+    _get_console().print(f"[yellow]{message}[/yellow]")
 
 
 def print_info(message: str) -> None:
     """Print info message."""
-    console.print(f"[blue]{message}[/blue]")
+    _get_console().print(f"[blue]{message}[/blue]")
@@ -3,10 +3,12 @@
 from prompt_versioner.core.versioner import PromptVersioner
 from prompt_versioner.core.enums import VersionBump, PreReleaseLabel
 from prompt_versioner.core.test_context import TestContext
+from prompt_versioner.core.metrics_buffer import MetricsBuffer
 
 __all__ = [
     "PromptVersioner",
     "VersionBump",
     "PreReleaseLabel",
     "TestContext",
+    "MetricsBuffer",
 ]
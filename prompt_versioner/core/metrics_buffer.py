@@ -0,0 +1,84 @@
+"""Write-behind buffer for logging metrics in batches."""
+
+import threading
+from typing import Any, Dict, List
+
+from prompt_versioner.storage.metrics import MetricsStorage
+
+# Keyword arguments accepted by log, checked before a record is buffered
+_METRIC_FIELDS = frozenset(MetricsStorage.INSERT_COLUMNS) | {"metadata"}
+
+
+class MetricsBuffer:
+    """Collects metrics records for a prompt version and writes them in batches.
+
+    Records are held in memory and saved with ``log_metrics_batch`` (one
+    ``executemany`` transaction) every ``flush_every`` records, on ``flush()``
+    and when the context exits. Records still buffered are lost if the
+    process dies before they are flushed.
+    """
+
+    def __init__(self, versioner: Any, name: str, version: str, flush_every: int = 64):
+        """Initialize metrics buffer.
+
+        Args:
+            versioner: PromptVersioner instance
+            name: Prompt name
+            version: Version string
+            flush_every: Number of buffered records that triggers a write
+        """
+        if flush_every < 1:
+            raise ValueError("flush_every must be at least 1")
+
+        self.versioner = versioner
+        self.name = name
+        self.version = version
+        self.flush_every = flush_every
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "MetricsBuffer":
+        """Enter context."""
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Exit context and write the remaining records."""
+        self.flush()
+
+    def __len__(self) -> int:
+        """Get number of records waiting to be written."""
+        return len(self._pending)
+
+    def log(self, **metrics: Any) -> None:
+        """Buffer one metrics record.
+
+        Args:
+            **metrics: Same keyword arguments as ``PromptVersioner.log_metrics``
+
+        Raises:
+            ValueError: If an argument is not a metric field
+        """
+        unknown = metrics.keys() - _METRIC_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown metric fields: {', '.join(sorted(unknown))}")
+
+        with self._lock:
+            self._pending.append(metrics)
+            if len(self._pending) < self.flush_every:
+                return
+            batch, self._pending = self._pending, []
+
+        self.versioner.log_metrics_batch(self.name, self.version, batch)
+
+    def flush(self) -> int:
+        """Write all buffered records.
+
+        Returns:
+            Number of records written
+        """
+        with self._lock:
+            batch, self._pending = self._pending, []
+
+        if not batch:
+            return 0
+        return int(self.versioner.log_metrics_batch(self.name, self.version, batch))
@@ -6,6 +6,9 @@ from typing import Any, Dict, Optional
 class TestContext:
     """Context manager for testing prompt versions."""
 
+    # Often created once per LLM call; no per-instance __dict__
+    __slots__ = ("versioner", "name", "version", "metrics")
+
     def __init__(self, versioner: Any, name: str, version: str):
         """Initialize test context.
 
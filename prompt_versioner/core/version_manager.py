@@ -1,9 +1,51 @@
 """Semantic version management."""
 
 import re
-from typing import Optional, Dict
+from functools import lru_cache
+from typing import Optional, Dict, Tuple
 from prompt_versioner.core.enums import VersionBump, PreReleaseLabel
 
+# Pattern: MAJOR.MINOR.PATCH[-PRERELEASE]
+_SEMVER_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)(?:-([A-Za-z]+)(?:\.(\d+))?)?$")
+# Stable versions are the common case and skip the pre-release alternation
+_SIMPLE_VERSION_RE = re.compile(r"^(\d+)\.(\d+)\.(\d+)$")
+
+# Lower-cased names accepted for bump types and pre-release labels
+_BUMP_MAP: Dict[str, VersionBump] = {
+    "major": VersionBump.MAJOR,
+    "minor": VersionBump.MINOR,
+    "patch": VersionBump.PATCH,
+}
+_LABEL_MAP: Dict[str, PreReleaseLabel] = {
+    "snapshot": PreReleaseLabel.SNAPSHOT,
+    "milestone": PreReleaseLabel.MILESTONE,
+    "m": PreReleaseLabel.MILESTONE,
+    "rc": PreReleaseLabel.RC,
+    "release_candidate": PreReleaseLabel.RC,
+    "stable": PreReleaseLabel.STABLE,
+    "": PreReleaseLabel.STABLE,
+}
+# Precedence of pre-release labels within the same base version
+_PRE_LABEL_ORDER: Dict[str, int] = {"SNAPSHOT": 1, "M": 2, "RC": 3}
+
+
+@lru_cache(maxsize=1024)
+def _parse_version_parts(
+    version_string: str,
+) -> Optional[Tuple[int, int, int, Optional[str], Optional[int]]]:
+    """Parse a version string into an immutable, cacheable tuple of components."""
+    simple = _SIMPLE_VERSION_RE.match(version_string)
+    if simple:
+        major, minor, patch = simple.groups()
+        return int(major), int(minor), int(patch), None, None
+
+    match = _SEMVER_RE.match(version_string)
+    if not match:
+        return None
+
+    major, minor, patch, pre_label, pre_number = match.groups()
+    return int(major), int(minor), int(patch), pre_label, int(pre_number) if pre_number else None
+
 
 class VersionManager:
     """Manager for semantic versioning operations."""
@@ -33,12 +75,7 @@ class VersionManager:
             return bump_type
 
         if isinstance(bump_type, str):
-            bump_map = {
-                "major": VersionBump.MAJOR,
-                "minor": VersionBump.MINOR,
-                "patch": VersionBump.PATCH,
-            }
-            return bump_map.get(bump_type.lower())
+            return _BUMP_MAP.get(bump_type.lower())
 
         return None
 
@@ -69,16 +106,7 @@ class VersionManager:
             return pre_label
 
         if isinstance(pre_label, str):
-            label_map = {
-                "snapshot": PreReleaseLabel.SNAPSHOT,
-                "milestone": PreReleaseLabel.MILESTONE,
-                "m": PreReleaseLabel.MILESTONE,
-                "rc": PreReleaseLabel.RC,
-                "release_candidate": PreReleaseLabel.RC,
-                "stable": PreReleaseLabel.STABLE,
-                "": PreReleaseLabel.STABLE,
-            }
-            return label_map.get(pre_label.lower())
+            return _LABEL_MAP.get(pre_label.lower())
 
         return None
 
@@ -92,21 +120,17 @@ class VersionManager:
         Returns:
             Dict with parsed components or None if invalid
         """
-        # Pattern: MAJOR.MINOR.PATCH[-PRERELEASE]
-        pattern = r"^(\d+)\.(\d+)\.(\d+)(?:-([A-Za-z]+)(?:\.(\d+))?)?$"
-        match = re.match(pattern, version_string)
-
-        if not match:
+        parts = _parse_version_parts(version_string)
+        if parts is None:
             return None
 
-        major, minor, patch, pre_label, pre_number = match.groups()
-
+        major, minor, patch, pre_label, pre_number = parts
         return {
-            "major": int(major),
-            "minor": int(minor),
-            "patch": int(patch),
+            "major": major,
+            "minor": minor,
+            "patch": patch,
             "pre_label": pre_label,
-            "pre_number": int(pre_number) if pre_number else None,
+            "pre_number": pre_number,
         }
 
     @staticmethod
@@ -140,6 +164,7 @@ class VersionManager:
         return base
 
     @staticmethod
+    @lru_cache(maxsize=4096)
     def calculate_next_version(
         current_version: Optional[str],
         bump_type: VersionBump,
@@ -155,7 +180,8 @@ class VersionManager:
             pre_number: Pre-release number (for M.X or RC.X)
 
         Returns:
-            Next version string
+            Next version string. Results are memoized, since imports and
+            auto-tracking repeat the same inputs
 
         Examples:
             >>> calculate_next_version(None, VersionBump.PATCH)
@@ -177,20 +203,18 @@ class VersionManager:
         if current_version is None:
             major, minor, patch = 1, 0, 0
         else:
-            # Parse current version
-            parsed = VersionManager.parse_version(current_version)
+            # Parse current version (cached tuple, no dict built)
+            parsed = _parse_version_parts(current_version)
             if not parsed:
                 # Invalid format, start fresh
                 major, minor, patch = 1, 0, 0
             else:
-                major = parsed["major"]
-                minor = parsed["minor"]
-                patch = parsed["patch"]
+                major, minor, patch, current_label, _ = parsed
 
                 # If current is pre-release and new is stable with same version, keep numbers
                 if (
                     pre_label == PreReleaseLabel.STABLE
-                    and parsed["pre_label"] is not None
+                    and current_label is not None
                     and bump_type == VersionBump.PATCH
                 ):
                     # Releasing stable from pre-release, keep version
@@ -231,37 +255,37 @@ class VersionManager:
         Returns:
             -1 if version1 < version2, 0 if equal, 1 if version1 > version2
         """
-        v1 = VersionManager.parse_version(version1)
-        v2 = VersionManager.parse_version(version2)
+        v1 = _parse_version_parts(version1)
+        v2 = _parse_version_parts(version2)
 
         if not v1 or not v2:
             # Fallback to string comparison
             return -1 if version1 < version2 else (1 if version1 > version2 else 0)
 
         # Compare major.minor.patch
-        for key in ["major", "minor", "patch"]:
-            if v1[key] < v2[key]:
-                return -1
-            elif v1[key] > v2[key]:
-                return 1
+        if v1[:3] != v2[:3]:
+            return -1 if v1[:3] < v2[:3] else 1
+
+        label1, number1 = v1[3], v1[4]
+        label2, number2 = v2[3], v2[4]
 
         # If base versions equal, compare pre-release
         # Stable > pre-release
-        if v1["pre_label"] is None and v2["pre_label"] is not None:
+        if label1 is None and label2 is not None:
             return 1
-        if v1["pre_label"] is not None and v2["pre_label"] is None:
+        if label1 is not None and label2 is None:
             return -1
 
         # Both have pre-release, compare
-        if v1["pre_label"] and v2["pre_label"]:
-            if v1["pre_label"] != v2["pre_label"]:
+        if label1 and label2:
+            if label1 != label2:
                 # SNAPSHOT < M < RC
-                order = {"SNAPSHOT": 1, "M": 2, "RC": 3}
-                return -1 if order.get(v1["pre_label"], 0) < order.get(v2["pre_label"], 0) else 1
+                rank1 = _PRE_LABEL_ORDER.get(label1, 0)
+                return -1 if rank1 < _PRE_LABEL_ORDER.get(label2, 0) else 1
 
             # Same pre-label, compare numbers
-            num1 = v1["pre_number"] or 0
-            num2 = v2["pre_number"] or 0
+            num1 = number1 or 0
+            num2 = number2 or 0
             return -1 if num1 < num2 else (1 if num1 > num2 else 0)
 
         return 0
@@ -1,10 +1,29 @@
 """Core PromptVersioner class - main interface for the library."""
 
 from pathlib import Path
+import copy
 import json
+import logging
+import os
+import sqlite3
+import textwrap
 import yaml
 from datetime import datetime, timezone
-from typing import Any, Callable, Dict, List, Optional, TypeVar, cast, Literal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    TextIO,
+    Tuple,
+    TypeVar,
+    cast,
+)
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 
 from prompt_versioner.storage import PromptStorage
@@ -15,9 +34,61 @@ from prompt_versioner.metrics import MetricsTracker, MetricsCalculator, PricingM
 from prompt_versioner.core.enums import VersionBump, PreReleaseLabel
 from prompt_versioner.core.version_manager import VersionManager
 from prompt_versioner.core.test_context import TestContext
+from prompt_versioner.core.metrics_buffer import MetricsBuffer
+
+logger = logging.getLogger(__name__)
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# libyaml's C emitter and parser, when PyYAML was built with them
+_YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Path separators replaced in prompt names to build export file names
+_UNSAFE_FILENAME_CHARS = str.maketrans({"/": "_", "\\": "_"})
+
+# Raised when a tracked function returns neither a prompt dict nor a pair
+_TRACK_RESULT_ERROR = (
+    "Tracked function must return dict with 'system' and 'user' keys, or tuple of (system, user)"
+)
+
+
+def _extract_dict_prompts(result: Dict[str, Any]) -> Tuple[str, str]:
+    """Extract prompts from a tracked function's {"system": ..., "user": ...} result."""
+    return result.get("system", ""), result.get("user", "")
+
+
+def _extract_tuple_prompts(result: Tuple[Any, ...]) -> Tuple[str, str]:
+    """Extract prompts from a tracked function's (system, user) result."""
+    if len(result) != 2:
+        raise ValueError(_TRACK_RESULT_ERROR)
+    return result[0], result[1]
+
+
+# Prompt extractor for each exact return type of tracked functions, used by track
+_PROMPT_EXTRACTORS: Dict[type, Callable[[Any], Tuple[str, str]]] = {
+    dict: _extract_dict_prompts,
+    tuple: _extract_tuple_prompts,
+}
+
+
+class _ReadCaches:
+    """Read caches of PromptVersioner for one storage data version.
+
+    A new instance replaces the current one when the data version changes, so
+    a reader that keeps a reference only ever fills the caches of the data
+    version it read before querying; entries it adds after a write land in a
+    replaced instance and are never served.
+    """
+
+    __slots__ = ("data_version", "version", "latest", "versions")
+
+    def __init__(self, data_version: Optional[Tuple[Any, ...]]) -> None:
+        self.data_version = data_version
+        self.version: Dict[Tuple[str, str], Optional[Dict[str, Any]]] = {}
+        self.latest: Dict[str, Optional[Dict[str, Any]]] = {}
+        self.versions: Dict[str, List[Dict[str, Any]]] = {}
+
 
 class PromptVersioner:
     """Main interface for prompt versioning system."""
@@ -28,6 +99,7 @@ class PromptVersioner:
         db_path: Optional[Path] = None,
         enable_git: bool = True,
         auto_track: bool = False,
+        sqlite_pragmas: Optional[Dict[str, Any]] = None,
     ):
         """Initialize PromptVersioner.
 
@@ -36,9 +108,11 @@ class PromptVersioner:
             db_path: Optional custom database path
             enable_git: Enable Git integration
             auto_track: Enable automatic tracking on prompt changes
+            sqlite_pragmas: Optional SQLite pragmas applied to every connection,
+                overriding the defaults (WAL-friendly synchronous=NORMAL, 5 s busy_timeout, ...)
         """
         self.project_name = project_name
-        self.storage = PromptStorage(db_path)
+        self.storage = PromptStorage(db_path, sqlite_pragmas=sqlite_pragmas)
         self.version_manager = VersionManager()
         self.pricing_manager = PricingManager()
         self.metrics_calculator = MetricsCalculator(self.pricing_manager)
@@ -59,6 +133,10 @@ class PromptVersioner:
         # Metrics
         self.metrics_tracker = MetricsTracker()
 
+        # Read caches for get_version, get_latest and list_versions, valid while
+        # the storage data version is unchanged
+        self._read_caches = _ReadCaches(None)
+
     def track(
         self,
         name: str,
@@ -85,21 +163,32 @@ class PromptVersioner:
         """
 
         def decorator(func: F) -> F:
+            # Prompts last handed to auto_version by this function and the data
+            # version right after; any later write (e.g. a deleted or rolled
+            # back version) makes the next call check storage again
+            last_tracked: List[Optional[Tuple[Tuple[str, str], Tuple[Any, ...]]]] = [None]
+
             @wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 result = func(*args, **kwargs)
 
-                # Extract prompts from result
-                system_prompt, user_prompt = self._extract_prompts(result)
+                # Extract prompts from result; exact dict/tuple results skip the
+                # isinstance checks of the general path
+                extract = _PROMPT_EXTRACTORS.get(type(result), self._extract_prompts)
+                system_prompt, user_prompt = extract(result)
 
-                # Auto-version if enabled
+                # Auto-version if enabled; prompts equal to the last tracked ones
+                # skip the storage lookup while the stored data is unchanged
                 if auto_commit or self.auto_track_enabled:
-                    self.auto_tracker.auto_version(
-                        name=name,
-                        system_prompt=system_prompt,
-                        user_prompt=user_prompt,
-                        metadata=metadata,
-                    )
+                    prompts = (system_prompt, user_prompt)
+                    if last_tracked[0] != (prompts, self.storage.get_data_version()):
+                        self.auto_tracker.auto_version(
+                            name=name,
+                            system_prompt=system_prompt,
+                            user_prompt=user_prompt,
+                            metadata=metadata,
+                        )
+                        last_tracked[0] = (prompts, self.storage.get_data_version())
 
                 return result
 
@@ -143,17 +232,29 @@ class PromptVersioner:
             name, version, parsed_bump, parsed_label, pre_number, system_prompt, user_prompt
         )
 
-        # Check for existing version
-        self._handle_existing_version(name, version_str, overwrite)
+        version_fields = {
+            "name": name,
+            "version": version_str,
+            "system_prompt": system_prompt,
+            "user_prompt": user_prompt,
+            "metadata": metadata,
+            "git_commit": git_commit,
+        }
 
-        return self.storage.save_version(
-            name=name,
-            version=version_str,
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            metadata=metadata,
-            git_commit=git_commit,
-        )
+        # Single-statement replace; without overwrite the UNIQUE(name, version)
+        # constraint rejects duplicates instead of a separate existence check
+        if overwrite:
+            return self.storage.upsert_version(**version_fields)
+
+        try:
+            return self.storage.save_version(**version_fields)
+        except sqlite3.IntegrityError as e:
+            if e.sqlite_errorname != "SQLITE_CONSTRAINT_UNIQUE":
+                raise
+            raise ValueError(
+                f"Version {version_str} already exists for prompt '{name}'. "
+                f"Use overwrite=True to replace it or use a different bump_type."
+            ) from None
 
     def get_version(self, name: str, version: str) -> Optional[Dict[str, Any]]:
         """Get a specific prompt version.
@@ -165,7 +266,22 @@ class PromptVersioner:
         Returns:
             Version data or None
         """
-        return self.storage.get_version(name, version)
+        caches = self._current_read_caches()
+
+        key = (name, version)
+        try:
+            cached = caches.version[key]
+        except KeyError:
+            listed = caches.versions.get(name)
+            if listed is not None:
+                # Already listed: look it up without another query
+                cached = next((v for v in listed if v["version"] == version), None)
+            else:
+                cached = self.storage.get_version(name, version)
+            caches.version[key] = cached
+
+        # Deep copies: decoded metadata is nested and must not leak into the cache
+        return copy.deepcopy(cached)
 
     def get_latest(self, name: str) -> Optional[Dict[str, Any]]:
         """Get the latest version of a prompt.
@@ -176,7 +292,14 @@ class PromptVersioner:
         Returns:
             Latest version data or None
         """
-        return self.storage.get_latest_version(name)
+        caches = self._current_read_caches()
+
+        try:
+            latest = caches.latest[name]
+        except KeyError:
+            latest = caches.latest[name] = self.storage.get_latest_version(name)
+
+        return copy.deepcopy(latest)
 
     def list_versions(self, name: str) -> List[Dict[str, Any]]:
         """List all versions of a prompt.
@@ -187,7 +310,22 @@ class PromptVersioner:
         Returns:
             List of versions (newest first)
         """
-        return self.storage.list_versions(name)
+        caches = self._current_read_caches()
+
+        try:
+            versions = caches.versions[name]
+        except KeyError:
+            versions = caches.versions[name] = self.storage.list_versions(name)
+
+        return copy.deepcopy(versions)
+
+    def list_prompt_summaries(self) -> List[Dict[str, Any]]:
+        """List all tracked prompts with version count and latest version.
+
+        Returns:
+            List of dicts with name, version_count, latest_version and latest_timestamp
+        """
+        return self.storage.list_prompt_summaries()
 
     def list_prompts(self) -> List[str]:
         """List all tracked prompt names.
@@ -197,6 +335,25 @@ class PromptVersioner:
         """
         return self.storage.list_all_prompts()
 
+    def prompt_exists(self, name: str) -> bool:
+        """Check whether a prompt is tracked, without listing all prompts.
+
+        Args:
+            name: Prompt name
+
+        Returns:
+            True if the prompt has at least one version
+        """
+        return self.storage.prompt_exists(name)
+
+    def has_prompts(self) -> bool:
+        """Check whether any prompt is tracked.
+
+        Returns:
+            True if at least one prompt exists
+        """
+        return self.storage.has_prompts()
+
     def diff(
         self,
         name: str,
@@ -269,30 +426,24 @@ class PromptVersioner:
             versions: List of version strings to compare
 
         Returns:
-            Comparison data with metrics
+            Comparison data; each version carries the average of every metric
         """
-        comparison: Dict[str, Any] = {
-            "versions": [],
+        # Versions and their metric averages in one joined, grouped query
+        found = self.storage.get_versions_with_metrics(name, versions)
+
+        return {
+            "versions": [
+                {
+                    "version": v["version"],
+                    "timestamp": v["timestamp"],
+                    "git_commit": v["git_commit"],
+                    "metrics": v["metrics"],
+                }
+                for v in found
+            ],
             "metrics": {},
         }
 
-        for version in versions:
-            v = self.storage.get_version(name, version)
-            if v:
-                metrics = self.storage.get_metrics(v["id"])
-
-                versions_list = cast(List[Dict[str, Any]], comparison["versions"])
-                versions_list.append(
-                    {
-                        "version": version,
-                        "timestamp": v["timestamp"],
-                        "git_commit": v.get("git_commit"),
-                        "metrics": metrics,
-                    }
-                )
-
-        return comparison
-
     def log_metrics(
         self,
         name: str,
@@ -330,9 +481,7 @@ class PromptVersioner:
             error_message: Error message if failed
             metadata: Additional metadata
         """
-        v = self.storage.get_version(name, version)
-        if not v:
-            raise ValueError(f"Version {version} not found for prompt {name}")
+        version_id = self._resolve_id(name, version)
 
         # Auto-calculate cost if not provided
         if cost_eur is None and model_name and input_tokens and output_tokens:
@@ -346,7 +495,7 @@ class PromptVersioner:
             total_tokens = input_tokens + output_tokens
 
         self.storage.save_metrics(
-            version_id=v["id"],
+            version_id=version_id,
             model_name=model_name,
             input_tokens=input_tokens,
             output_tokens=output_tokens,
@@ -363,6 +512,100 @@ class PromptVersioner:
             metadata=metadata,
         )
 
+    def log_metrics_batch(self, name: str, version: str, metrics: List[Dict[str, Any]]) -> int:
+        """Log many metrics records for a specific version in one transaction.
+
+        The version is resolved once and every record is written with a single
+        ``executemany``, which is much cheaper than calling ``log_metrics`` in a loop.
+
+        Args:
+            name: Prompt name
+            version: Version string
+            metrics: List of dicts accepting the same keyword arguments as ``log_metrics``
+                (``cost_eur`` and ``total_tokens`` are filled in when missing)
+
+        Returns:
+            Number of records logged
+        """
+        version_id = self._resolve_id(name, version)
+
+        rows = []
+        for record in metrics:
+            row = dict(record)
+            model_name = row.get("model_name")
+            input_tokens = row.get("input_tokens")
+            output_tokens = row.get("output_tokens")
+
+            # Auto-calculate cost if not provided
+            if row.get("cost_eur") is None and model_name and input_tokens and output_tokens:
+                row["cost_eur"] = self.metrics_calculator.calculate_cost(
+                    model_name, input_tokens, output_tokens
+                )
+
+            # Calculate total tokens
+            if input_tokens is not None and output_tokens is not None:
+                row["total_tokens"] = input_tokens + output_tokens
+
+            rows.append(row)
+
+        return self.storage.save_metrics_batch(version_id, rows)
+
+    async def alog_metrics(self, name: str, version: str, **kwargs: Any) -> None:
+        """Async variant of ``log_metrics``.
+
+        The SQLite write runs in a worker thread, so an event loop can keep
+        serving LLM requests while metrics are persisted. SQLite still allows a
+        single writer at a time, so concurrent calls only overlap with other I/O,
+        not with each other; prefer ``alog_metrics_batch`` for many records.
+
+        Args:
+            name: Prompt name
+            version: Version string
+            **kwargs: Same keyword arguments as ``log_metrics``
+        """
+        import asyncio
+
+        await asyncio.to_thread(self.log_metrics, name, version, **kwargs)
+
+    async def alog_metrics_batch(
+        self, name: str, version: str, metrics: List[Dict[str, Any]]
+    ) -> int:
+        """Async variant of ``log_metrics_batch``.
+
+        Args:
+            name: Prompt name
+            version: Version string
+            metrics: List of dicts accepting the same keyword arguments as ``log_metrics``
+
+        Returns:
+            Number of records logged
+        """
+        import asyncio
+
+        return await asyncio.to_thread(self.log_metrics_batch, name, version, metrics)
+
+    def get_percentiles(
+        self,
+        name: str,
+        version: str,
+        metric_name: str = "latency_ms",
+        percentiles: Sequence[float] = (50, 90, 95, 99),
+    ) -> Dict[float, float]:
+        """Get tail percentiles of a metric for a specific version.
+
+        Args:
+            name: Prompt name
+            version: Version string
+            metric_name: Metric column (e.g. 'latency_ms', 'cost_eur')
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            Dict of percentile -> value
+        """
+        version_id = self._resolve_id(name, version)
+
+        return self.storage.get_metric_percentiles(version_id, metric_name, percentiles)
+
     def test_version(
         self,
         name: str,
@@ -384,6 +627,25 @@ class PromptVersioner:
         """
         return TestContext(self, name, version)
 
+    def buffered_metrics(self, name: str, version: str, flush_every: int = 64) -> MetricsBuffer:
+        """Context manager for logging many metrics records in batches.
+
+        Args:
+            name: Prompt name
+            version: Version string
+            flush_every: Number of buffered records written per transaction
+
+        Returns:
+            MetricsBuffer collecting records until it is flushed
+
+        Example:
+            with pv.buffered_metrics("my_prompt", "1.0.0") as buffer:
+                for item in dataset:
+                    result = call_llm(prompt, item)
+                    buffer.log(model_name="gpt-4o", input_tokens=150, output_tokens=40)
+        """
+        return MetricsBuffer(self, name, version, flush_every=flush_every)
+
     def install_git_hooks(self) -> None:
         """Install Git hooks for automatic versioning."""
         if not self.git_tracker:
@@ -412,45 +674,35 @@ class PromptVersioner:
             output_file: Output file path
             format: Export format (json or yaml)
             include_metrics: Whether to include metrics data
-        """
-        versions = self.list_versions(name)
-
-        if not versions:
-            raise ValueError(f"No versions found for prompt '{name}'")
-
-        versions_list: List[Dict[str, Any]] = []
-        export_data = {
-            "prompt_name": name,
-            "export_date": datetime.now(timezone.utc).isoformat(),
-            "versions": versions_list,
-        }
-
-        for v in versions:
-            version_data = {
-                "version": v["version"],
-                "system_prompt": v["system_prompt"],
-                "user_prompt": v["user_prompt"],
-                "metadata": v.get("metadata"),
-                "git_commit": v.get("git_commit"),
-                "timestamp": v["timestamp"],
-            }
 
-            if include_metrics:
-                metrics_summary = self.storage.get_metrics_summary(v["id"])
-                metrics_list = self.storage.get_metrics(v["id"])
-                version_data["metrics_summary"] = metrics_summary
-                version_data["metrics_count"] = len(metrics_list)
+        Raises:
+            ValueError: If the format is not supported
+        """
+        self._export_prompt_file(
+            name, output_file, format, include_metrics, datetime.now(timezone.utc).isoformat()
+        )
 
-            versions_list.append(version_data)
+    def export_prompt_to_bytes(
+        self,
+        name: str,
+        format: Literal["json", "yaml"] = "json",
+        include_metrics: bool = True,
+    ) -> bytes:
+        """Export all versions of a prompt to an in-memory document.
 
-        output_file.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            name: Prompt name to export
+            format: Export format (json or yaml)
+            include_metrics: Whether to include metrics data
 
-        if format == "json":
-            output_file.write_text(json.dumps(export_data, indent=2, ensure_ascii=False))
-        elif format == "yaml":
-            output_file.write_text(yaml.dump(export_data, allow_unicode=True))
+        Returns:
+            UTF-8 encoded export, in the same layout as export_prompt
+        """
+        export_data = self._build_export_data(name, include_metrics)
 
-        print(f"Exported {len(versions)} versions of '{name}' to {output_file}")
+        if format == "yaml":
+            return yaml.dump(export_data, Dumper=_YAML_DUMPER, allow_unicode=True).encode("utf-8")
+        return json.dumps(export_data, indent=2, ensure_ascii=False).encode("utf-8")
 
     def import_prompt(
         self, input_file: Path, overwrite: bool = False, bump_type: Optional[VersionBump] = None
@@ -473,68 +725,76 @@ class PromptVersioner:
         if input_file.suffix == ".json":
             import_data = json.loads(content)
         elif input_file.suffix in [".yaml", ".yml"]:
-            import_data = yaml.safe_load(content)
+            import_data = yaml.load(content, Loader=_YAML_LOADER)  # nosec: B506 -- safe loader
         else:
             raise ValueError(f"Unsupported format: {input_file.suffix}")
 
-        prompt_name = import_data["prompt_name"]
-        versions = import_data["versions"]
-
-        imported = 0
-        skipped = 0
-
-        for v in versions:
-            existing = self.get_version(prompt_name, v["version"])
+        return self._import_data(import_data, overwrite=overwrite, bump_type=bump_type)
 
-            if existing and not overwrite:
-                skipped += 1
-                continue
-
-            version_str = v["version"]
-            if bump_type:
-                latest = self.get_latest(prompt_name)
-                current_version = latest["version"] if latest else None
-                version_str = self.version_manager.calculate_next_version(
-                    current_version, bump_type
-                )
-
-            self.save_version(
-                name=prompt_name,
-                system_prompt=v["system_prompt"],
-                user_prompt=v["user_prompt"],
-                version=version_str,
-                metadata=v.get("metadata"),
-                overwrite=overwrite,
-            )
-            imported += 1
+    def import_prompt_from_bytes(
+        self,
+        data: bytes,
+        format: Literal["json", "yaml"] = "json",
+        overwrite: bool = False,
+        bump_type: Optional[VersionBump] = None,
+    ) -> dict:
+        """Import prompt versions from an in-memory document.
 
-        result = {
-            "prompt_name": prompt_name,
-            "imported": imported,
-            "skipped": skipped,
-            "total": len(versions),
-        }
+        Args:
+            data: Encoded export, as produced by export_prompt or export_prompt_to_bytes
+            format: Document format (json or yaml)
+            overwrite: If True, overwrite existing versions
+            bump_type: If specified, renumber versions with semantic versioning
 
-        print(f"Import completed: {imported} imported, {skipped} skipped")
+        Returns:
+            Dict with import statistics
+        """
+        if format == "json":
+            import_data = json.loads(data)
+        elif format == "yaml":
+            import_data = yaml.load(data, Loader=_YAML_LOADER)  # nosec: B506 -- safe loader
+        else:
+            raise ValueError(f"Unsupported format: {format}")
 
-        return result
+        return self._import_data(import_data, overwrite=overwrite, bump_type=bump_type)
 
-    def export_all(self, output_dir: Path, format: Literal["json", "yaml"] = "json") -> None:
+    def export_all(
+        self,
+        output_dir: Path,
+        format: Literal["json", "yaml"] = "json",
+        max_workers: Optional[int] = None,
+    ) -> None:
         """Export all prompts to directory.
 
+        Prompts are exported concurrently; each worker thread reads through its
+        own SQLite connection, and WAL mode lets those readers run in parallel.
+
         Args:
             output_dir: Output directory
             format: Export format
+            max_workers: Maximum number of export threads (default: up to 8)
         """
         output_dir.mkdir(parents=True, exist_ok=True)
         prompts = self.list_prompts()
+        # One timestamp for the whole batch
+        export_date = datetime.now(timezone.utc).isoformat()
 
-        for prompt_name in prompts:
-            safe_name = prompt_name.replace("/", "_").replace("\\", "_")
+        def export_one(prompt_name: str) -> None:
+            safe_name = prompt_name.translate(_UNSAFE_FILENAME_CHARS)
             output_file = output_dir / f"{safe_name}.{format}"
-            self.export_prompt(prompt_name, output_file, format)
+            self._export_prompt_file(prompt_name, output_file, format, True, export_date)
 
-        print(f"Exported {len(prompts)} prompts to {output_dir}")
+        workers = max_workers or min(8, os.cpu_count() or 1)
+        if len(prompts) <= 1 or workers <= 1:
+            for prompt_name in prompts:
+                export_one(prompt_name)
+        else:
+            with ThreadPoolExecutor(max_workers=min(workers, len(prompts))) as executor:
+                # Consume the results so the first failed export is raised
+                for _ in executor.map(export_one, prompts):
+                    pass
+
+        logger.info("Exported %d prompts to %s", len(prompts), output_dir)
 
     def add_annotation(self, name: str, version: str, text: str, author: str = "unknown") -> None:
         """Add annotation to a prompt version.
@@ -545,12 +805,10 @@ class PromptVersioner:
             text: Annotation text
             author: Author name/email
         """
-        v = self.get_version(name, version)
-        if not v:
-            raise ValueError(f"Version {version} not found for prompt {name}")
+        version_id = self._resolve_id(name, version)
 
-        self.storage.add_annotation(v["id"], author, text)
-        print(f"Added annotation to {name} v{version} by {author}")
+        self.storage.add_annotation(version_id, author, text)
+        logger.info("Added annotation to %s v%s by %s", name, version, author)
 
     def get_annotations(self, name: str, version: str) -> List[Dict[str, Any]]:
         """Get annotations for a version.
@@ -562,11 +820,11 @@ class PromptVersioner:
         Returns:
             List of annotations
         """
-        v = self.get_version(name, version)
-        if not v:
+        version_id = self.storage.get_version_id(name, version)
+        if version_id is None:
             return []
 
-        return self.storage.get_annotations(v["id"])
+        return self.storage.get_annotations(version_id)
 
     def delete_version(self, name: str, version: str) -> bool:
         """Delete a specific version of a prompt (and related data).
@@ -593,6 +851,289 @@ class PromptVersioner:
 
     # Private helper methods
 
+    def _resolve_id(self, name: str, version: str) -> int:
+        """Get the ID of a version, without loading its prompts.
+
+        Args:
+            name: Prompt name
+            version: Version string
+
+        Returns:
+            Version ID
+
+        Raises:
+            ValueError: If the version does not exist
+        """
+        version_id = self.storage.get_version_id(name, version)
+        if version_id is None:
+            raise ValueError(f"Version {version} not found for prompt {name}")
+        return version_id
+
+    def _current_read_caches(self) -> _ReadCaches:
+        """Get the read caches of the current data version.
+
+        Read the data version before querying and fill only the returned
+        instance, never self._read_caches, which another thread may replace.
+        """
+        data_version = self.storage.get_data_version()
+        caches = self._read_caches
+        if caches.data_version != data_version:
+            caches = self._read_caches = _ReadCaches(data_version)
+        return caches
+
+    def _versions_for_export(self, name: str) -> List[Dict[str, Any]]:
+        """Load the versions of a prompt to export.
+
+        Args:
+            name: Prompt name to export
+
+        Returns:
+            List of versions (newest first)
+
+        Raises:
+            ValueError: If the prompt has no versions
+        """
+        versions = self.list_versions(name)
+
+        if not versions:
+            raise ValueError(f"No versions found for prompt '{name}'")
+
+        return versions
+
+    def _export_prompt_file(
+        self,
+        name: str,
+        output_file: Path,
+        format: str,
+        include_metrics: bool,
+        export_date: str,
+    ) -> None:
+        """Export all versions of a prompt to file with a given export date.
+
+        Args:
+            name: Prompt name to export
+            output_file: Output file path
+            format: Export format (json or yaml)
+            include_metrics: Whether to include metrics data
+            export_date: ISO timestamp recorded in the export
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        try:
+            writer = self._EXPORTERS[format]
+        except KeyError:
+            raise ValueError(f"Unsupported format: {format}") from None
+
+        versions = self._versions_for_export(name)
+
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+
+        # Stream the encoded output to the file instead of building one large string
+        with output_file.open("w", encoding="utf-8", buffering=1 << 20) as f:
+            writer(self, f, name, versions, include_metrics, export_date)
+
+        logger.info("Exported %d versions of '%s' to %s", len(versions), name, output_file)
+
+    def _build_export_data(
+        self,
+        name: str,
+        include_metrics: bool,
+        versions: Optional[List[Dict[str, Any]]] = None,
+        export_date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Collect the export document for all versions of a prompt.
+
+        Args:
+            name: Prompt name to export
+            include_metrics: Whether to include metrics data
+            versions: Versions to export, if already loaded
+            export_date: ISO timestamp to record, defaults to now
+
+        Returns:
+            Export data dict
+        """
+        if versions is None:
+            versions = self._versions_for_export(name)
+
+        return {
+            "prompt_name": name,
+            "export_date": export_date or datetime.now(timezone.utc).isoformat(),
+            "versions": list(self._iter_export_versions(versions, include_metrics)),
+        }
+
+    def _iter_export_versions(
+        self, versions: List[Dict[str, Any]], include_metrics: bool
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield the export entry of each version, one at a time.
+
+        Args:
+            versions: Versions to export
+            include_metrics: Whether to include metrics data
+
+        Yields:
+            Export data of one version
+        """
+        # One grouped query for all summaries; call_count doubles as the metrics count
+        summaries = (
+            self.storage.get_metrics_summaries([v["id"] for v in versions])
+            if include_metrics
+            else {}
+        )
+
+        for v in versions:
+            version_data = {
+                "version": v["version"],
+                "system_prompt": v["system_prompt"],
+                "user_prompt": v["user_prompt"],
+                "metadata": v.get("metadata"),
+                "git_commit": v.get("git_commit"),
+                "timestamp": v["timestamp"],
+            }
+
+            if include_metrics:
+                metrics_summary = summaries[v["id"]]
+                version_data["metrics_summary"] = metrics_summary
+                version_data["metrics_count"] = metrics_summary["call_count"]
+
+            yield version_data
+
+    def _write_json_export(
+        self,
+        f: TextIO,
+        name: str,
+        versions: List[Dict[str, Any]],
+        include_metrics: bool,
+        export_date: str,
+    ) -> None:
+        """Write a JSON export one version at a time.
+
+        The output matches ``json.dump(export_data, f, indent=2)``, but only one
+        version entry is held in memory as a dict and encoded string at a time.
+
+        Args:
+            f: Text file to write to
+            name: Prompt name to export
+            versions: Versions to export
+            include_metrics: Whether to include metrics data
+            export_date: ISO timestamp recorded in the export
+        """
+        f.write("{\n")
+        f.write(f'  "prompt_name": {json.dumps(name, ensure_ascii=False)},\n')
+        f.write(f'  "export_date": {json.dumps(export_date)},\n')
+        f.write('  "versions": [')
+
+        separator = "\n"
+        for version_data in self._iter_export_versions(versions, include_metrics):
+            encoded = json.dumps(version_data, indent=2, ensure_ascii=False)
+            f.write(separator)
+            f.write(textwrap.indent(encoded, "    "))
+            separator = ",\n"
+
+        f.write("\n  ]\n}" if versions else "]\n}")
+
+    def _write_yaml_export(
+        self,
+        f: TextIO,
+        name: str,
+        versions: List[Dict[str, Any]],
+        include_metrics: bool,
+        export_date: str,
+    ) -> None:
+        """Write a YAML export.
+
+        Args:
+            f: Text file to write to
+            name: Prompt name to export
+            versions: Versions to export
+            include_metrics: Whether to include metrics data
+            export_date: ISO timestamp recorded in the export
+        """
+        export_data = self._build_export_data(name, include_metrics, versions, export_date)
+        yaml.dump(export_data, f, Dumper=_YAML_DUMPER, allow_unicode=True)
+
+    # Export writer for each supported format, looked up once per exported prompt
+    _EXPORTERS: Dict[
+        str, Callable[["PromptVersioner", TextIO, str, List[Dict[str, Any]], bool, str], None]
+    ] = {
+        "json": _write_json_export,
+        "yaml": _write_yaml_export,
+    }
+
+    def _import_data(
+        self, import_data: Dict[str, Any], overwrite: bool, bump_type: Optional[VersionBump]
+    ) -> dict:
+        """Save the versions of a parsed export document.
+
+        Args:
+            import_data: Parsed export data
+            overwrite: If True, overwrite existing versions
+            bump_type: If specified, renumber versions with semantic versioning
+
+        Returns:
+            Dict with import statistics
+        """
+        prompt_name = import_data["prompt_name"]
+        versions = import_data["versions"]
+
+        imported = 0
+        skipped = 0
+        git_commit = self.git_tracker.get_current_commit() if self.git_tracker else None
+        latest = self.get_latest(prompt_name)
+        current_version = latest["version"] if latest else None
+        # One query for every stored version string instead of a lookup per entry
+        existing_versions = self.storage.list_version_strings(prompt_name)
+
+        # Versions to insert, keyed by version string; saved in one transaction
+        pending: Dict[str, Dict[str, Any]] = {}
+
+        for v in versions:
+            existing = v["version"] in existing_versions or v["version"] in pending
+
+            if existing and not overwrite:
+                skipped += 1
+                continue
+
+            version_str = v["version"]
+            if bump_type:
+                version_str = self.version_manager.calculate_next_version(
+                    current_version, bump_type
+                )
+                if not overwrite and (version_str in existing_versions or version_str in pending):
+                    raise ValueError(
+                        f"Version {version_str} already exists for prompt '{prompt_name}'. "
+                        f"Use overwrite=True to replace it or use a different bump_type."
+                    )
+            current_version = version_str
+
+            if overwrite and (version_str in existing_versions or version_str in pending):
+                logger.info("Overwriting existing version %s for %s", version_str, prompt_name)
+
+            # A later entry for the same version replaces the earlier one
+            pending.pop(version_str, None)
+            pending[version_str] = {
+                "name": prompt_name,
+                "version": version_str,
+                "system_prompt": v["system_prompt"],
+                "user_prompt": v["user_prompt"],
+                "metadata": v.get("metadata"),
+                "git_commit": git_commit,
+            }
+            imported += 1
+
+        self.storage.save_versions_bulk(list(pending.values()), replace=overwrite)
+
+        result = {
+            "prompt_name": prompt_name,
+            "imported": imported,
+            "skipped": skipped,
+            "total": len(versions),
+        }
+
+        logger.info("Import completed: %d imported, %d skipped", imported, skipped)
+
+        return result
+
     def _extract_prompts(self, result: Any) -> tuple[str, str]:
         """Extract system and user prompts from function result.
 
@@ -608,10 +1149,7 @@ class PromptVersioner:
         elif isinstance(result, tuple) and len(result) == 2:
             system_prompt, user_prompt = result
         else:
-            raise ValueError(
-                "Tracked function must return dict with 'system' and 'user' keys, "
-                "or tuple of (system, user)"
-            )
+            raise ValueError(_TRACK_RESULT_ERROR)
 
         return system_prompt, user_prompt
 
@@ -660,25 +1198,3 @@ class PromptVersioner:
             git_commit = self.git_tracker.get_current_commit() if self.git_tracker else None
 
         return version, git_commit
-
-    def _handle_existing_version(self, name: str, version: str, overwrite: bool) -> None:
-        """Handle existing version conflict.
-
-        Args:
-            name: Prompt name
-            version: Version string
-            overwrite: Whether to overwrite existing
-
-        Raises:
-            ValueError: If version exists and overwrite is False
-        """
-        existing = self.get_version(name, version)
-        if existing:
-            if overwrite:
-                self.storage.delete_version(name, version)
-                print(f"Overwriting existing version {version} for {name}")
-            else:
-                raise ValueError(
-                    f"Version {version} already exists for prompt '{name}'. "
-                    f"Use overwrite=True to replace it or use a different bump_type."
-                )
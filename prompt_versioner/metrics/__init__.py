@@ -1,6 +1,6 @@
 """Metrics tracking and analysis for prompt versions."""
 
-from prompt_versioner.metrics.models import ModelMetrics, MetricStats, MetricType
+from prompt_versioner.metrics.models import ModelMetrics, MetricStats, MetricType, RunningStats
 from prompt_versioner.metrics.pricing import ModelPricing, PricingManager
 from prompt_versioner.metrics.calculator import MetricsCalculator
 from prompt_versioner.metrics.tracker import MetricsTracker
@@ -11,6 +11,7 @@ __all__ = [
     "ModelMetrics",
     "MetricStats",
     "MetricType",
+    "RunningStats",
     "ModelPricing",
     "PricingManager",
     "MetricsCalculator",
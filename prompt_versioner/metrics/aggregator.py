@@ -1,15 +1,90 @@
 """Metrics aggregation across multiple runs."""
 
+from bisect import insort
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from prompt_versioner.metrics.models import ModelMetrics
 
+# Numeric ModelMetrics fields summarized by get_summary
+_SUMMARY_FIELDS = (
+    "input_tokens",
+    "output_tokens",
+    "total_tokens",
+    "cost_eur",
+    "latency_ms",
+    "quality_score",
+    "accuracy",
+)
+
+
+class _RunningColumn:
+    """Running count, sum, min and max of the non-zero values of one metric field."""
+
+    __slots__ = ("count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total: float = 0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def add(self, value: Optional[float]) -> None:
+        """Fold one value in; None and 0 are skipped like missing values."""
+        if not value:
+            return
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def avg(self) -> float:
+        """Average of the folded values, 0.0 if there are none."""
+        return self.total / self.count if self.count else 0.0
+
 
 class MetricAggregator:
-    """Aggregates metrics across multiple test runs."""
+    """Aggregates metrics across multiple test runs.
+
+    Summary statistics are kept as running totals per field, updated once
+    for each metric appended to ``metrics``, so get_summary does not rescan
+    all records. Replacing or shrinking the ``metrics`` list is detected and
+    triggers a rebuild; records edited in place are not.
+    """
 
     def __init__(self) -> None:
         """Initialize aggregator."""
         self.metrics: List[ModelMetrics] = []
+        self._reset_running()
+
+    def _reset_running(self) -> None:
+        """Drop the running totals; the next summary rebuilds them."""
+        self._folded_source: Optional[List[ModelMetrics]] = None
+        self._folded_count = 0
+        self._columns = {field: _RunningColumn() for field in _SUMMARY_FIELDS}
+        self._latencies: List[float] = []
+        self._success_count = 0
+        self._models: Counter[str] = Counter()
+
+    def _sync_running(self) -> None:
+        """Fold metrics appended since the last summary into the running totals."""
+        if self._folded_source is not self.metrics or self._folded_count > len(self.metrics):
+            self._reset_running()
+            self._folded_source = self.metrics
+
+        columns = [(field, self._columns[field]) for field in _SUMMARY_FIELDS]
+        for metric in self.metrics[self._folded_count :]:
+            for field, column in columns:
+                column.add(getattr(metric, field))
+            if metric.latency_ms:
+                insort(self._latencies, metric.latency_ms)
+            if metric.success:
+                self._success_count += 1
+            if metric.model_name:
+                self._models[metric.model_name] += 1
+
+        self._folded_count = len(self.metrics)
 
     def add(self, metric: ModelMetrics) -> None:
         """Add a metric.
@@ -47,45 +122,45 @@ class MetricAggregator:
                 "has_data": False,
             }
 
+        self._sync_running()
+        call_count = len(self.metrics)
+        tokens = self._columns["total_tokens"]
+        cost = self._columns["cost_eur"]
+        latency = self._columns["latency_ms"]
+        quality = self._columns["quality_score"]
+        primary = self._models.most_common(1)
+
         return {
-            "call_count": len(self.metrics),
+            "call_count": call_count,
             "has_data": True,
             # Token statistics
-            "total_tokens": sum(m.total_tokens or 0 for m in self.metrics),
-            "avg_input_tokens": self._avg([m.input_tokens for m in self.metrics if m.input_tokens]),
-            "avg_output_tokens": self._avg(
-                [m.output_tokens for m in self.metrics if m.output_tokens]
-            ),
-            "avg_total_tokens": self._avg([m.total_tokens for m in self.metrics if m.total_tokens]),
+            "total_tokens": tokens.total,
+            "avg_input_tokens": self._columns["input_tokens"].avg(),
+            "avg_output_tokens": self._columns["output_tokens"].avg(),
+            "avg_total_tokens": tokens.avg(),
             # Cost statistics
-            "total_cost": sum(m.cost_eur or 0 for m in self.metrics),
-            "avg_cost": self._avg([m.cost_eur for m in self.metrics if m.cost_eur]),
-            "min_cost": min([m.cost_eur for m in self.metrics if m.cost_eur], default=0),
-            "max_cost": max([m.cost_eur for m in self.metrics if m.cost_eur], default=0),
+            "total_cost": cost.total,
+            "avg_cost": cost.avg(),
+            "min_cost": cost.min or 0,
+            "max_cost": cost.max or 0,
             # Latency statistics
-            "avg_latency": self._avg([m.latency_ms for m in self.metrics if m.latency_ms]),
-            "min_latency": min([m.latency_ms for m in self.metrics if m.latency_ms], default=0),
-            "max_latency": max([m.latency_ms for m in self.metrics if m.latency_ms], default=0),
-            "median_latency": self._median([m.latency_ms for m in self.metrics if m.latency_ms]),
+            "avg_latency": latency.avg(),
+            "min_latency": latency.min or 0,
+            "max_latency": latency.max or 0,
+            "median_latency": self._sorted_median(self._latencies),
             # Quality statistics
-            "avg_quality": self._avg([m.quality_score for m in self.metrics if m.quality_score]),
-            "min_quality": min(
-                [m.quality_score for m in self.metrics if m.quality_score], default=0
-            ),
-            "max_quality": max(
-                [m.quality_score for m in self.metrics if m.quality_score], default=0
-            ),
+            "avg_quality": quality.avg(),
+            "min_quality": quality.min or 0,
+            "max_quality": quality.max or 0,
             # Accuracy statistics
-            "avg_accuracy": self._avg([m.accuracy for m in self.metrics if m.accuracy]),
+            "avg_accuracy": self._columns["accuracy"].avg(),
             # Success metrics
-            "success_count": sum(1 for m in self.metrics if m.success),
-            "failure_count": sum(1 for m in self.metrics if not m.success),
-            "success_rate": sum(1 for m in self.metrics if m.success) / len(self.metrics),
+            "success_count": self._success_count,
+            "failure_count": call_count - self._success_count,
+            "success_rate": self._success_count / call_count,
             # Model usage
-            "models_used": list(set(m.model_name for m in self.metrics if m.model_name)),
-            "primary_model": self._most_common(
-                [m.model_name for m in self.metrics if m.model_name]
-            ),
+            "models_used": list(self._models),
+            "primary_model": primary[0][0] if primary else None,
         }
 
     def get_summary_by_model(self) -> Dict[str, Dict[str, Any]]:
@@ -147,6 +222,16 @@ class MetricAggregator:
         else:
             return valid_values[n // 2]
 
+    @staticmethod
+    def _sorted_median(values: List[float]) -> float:
+        """Calculate median of already sorted values."""
+        n = len(values)
+        if n == 0:
+            return 0.0
+        if n % 2 == 0:
+            return (values[n // 2 - 1] + values[n // 2]) / 2
+        return values[n // 2]
+
     @staticmethod
     def _most_common(values: List[Optional[str]]) -> Optional[str]:
         """Find most common value."""
@@ -162,6 +247,7 @@ class MetricAggregator:
     def clear(self) -> None:
         """Clear all metrics."""
         self.metrics.clear()
+        self._reset_running()
 
     def to_list(self) -> List[Dict[str, Any]]:
         """Export metrics as list of dicts.
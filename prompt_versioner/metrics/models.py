@@ -1,8 +1,9 @@
 """Data models for metrics."""
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional
 from enum import Enum
+import math
 
 
 @dataclass
@@ -100,6 +101,47 @@ class MetricStats:
         )
 
 
+@dataclass
+class RunningStats:
+    """Streaming mean and variance of a metric (Welford's algorithm).
+
+    Updated in O(1) per value, so summary statistics never require another
+    pass over the stored samples.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    def add(self, value: float) -> None:
+        """Add a single value."""
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    def update(self, values: Iterable[float]) -> None:
+        """Add multiple values."""
+        for value in values:
+            self.add(value)
+
+    def clear(self) -> None:
+        """Reset to the empty state."""
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 with fewer than two values)."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    @property
+    def std_dev(self) -> float:
+        """Sample standard deviation."""
+        return math.sqrt(self.variance)
+
+
 @dataclass
 class MetricComparison:
     """Comparison between two metric sets."""
@@ -1,6 +1,6 @@
 """Model pricing and cost calculation."""
 
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 
 # Model pricing per 1M tokens (input/output) in EUR
@@ -26,6 +26,16 @@ DEFAULT_MODEL_PRICING = {
     "gpt-4o-mini": {"input": 0.13, "output": 0.52},
 }
 
+# Rates are kept as integer units of 1e-8 EUR per 1M tokens, so a cost is one
+# integer multiply-add per call and a single division at the end
+_RATE_SCALE = 100_000_000
+_COST_DIVISOR = 1_000_000 * _RATE_SCALE
+
+
+def _scale_rates(prices: Dict[str, float]) -> Tuple[int, int]:
+    """Convert per-1M-token prices to scaled integer rates (input, output)."""
+    return round(prices["input"] * _RATE_SCALE), round(prices["output"] * _RATE_SCALE)
+
 
 class ModelPricing:
     """Model pricing information."""
@@ -77,6 +87,10 @@ class PricingManager:
         self.pricing = DEFAULT_MODEL_PRICING.copy()
         if custom_pricing:
             self.pricing.update(custom_pricing)
+        # Integer rates used by calculate_cost, kept in sync by add_model/remove_model
+        self._scaled_rates: Dict[str, Tuple[int, int]] = {
+            model_name: _scale_rates(prices) for model_name, prices in self.pricing.items()
+        }
 
     def get_pricing(self, model_name: str) -> Optional[ModelPricing]:
         """Get pricing for a model.
@@ -87,10 +101,10 @@ class PricingManager:
         Returns:
             ModelPricing object or None if not found
         """
-        if model_name not in self.pricing:
+        prices = self.pricing.get(model_name)
+        if prices is None:
             return None
 
-        prices = self.pricing[model_name]
         return ModelPricing(input_price=prices["input"], output_price=prices["output"])
 
     def add_model(self, model_name: str, input_price: float, output_price: float) -> None:
@@ -102,6 +116,7 @@ class PricingManager:
             output_price: Price per 1M output tokens
         """
         self.pricing[model_name] = {"input": input_price, "output": output_price}
+        self._scaled_rates[model_name] = _scale_rates(self.pricing[model_name])
 
     def remove_model(self, model_name: str) -> bool:
         """Remove a model from pricing.
@@ -114,6 +129,7 @@ class PricingManager:
         """
         if model_name in self.pricing:
             del self.pricing[model_name]
+            self._scaled_rates.pop(model_name, None)
             return True
         return False
 
@@ -136,11 +152,11 @@ class PricingManager:
         Returns:
             Cost in EUR, or 0.0 if model not found
         """
-        pricing = self.get_pricing(model_name)
-        if pricing is None:
+        rates = self._scaled_rates.get(model_name)
+        if rates is None:
             return 0.0
 
-        return pricing.calculate_cost(input_tokens, output_tokens)
+        return (input_tokens * rates[0] + output_tokens * rates[1]) / _COST_DIVISOR
 
     def estimate_cost(
         self, model_name: str, input_tokens: int, output_tokens: int, num_calls: int = 1
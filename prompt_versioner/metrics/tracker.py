@@ -1,10 +1,29 @@
 """Metrics tracking and statistical analysis."""
 
+import math
+import operator
 import statistics
 from typing import Dict, List, Any
 from prompt_versioner.metrics.models import MetricStats
 
 
+def _sample_stdev(values: List[float], mean: float) -> float:
+    """Sample standard deviation around a precomputed mean.
+
+    Float arithmetic with an exactly rounded sum (math.fsum), instead of the
+    exact fractions statistics.stdev converts every value to.
+
+    Args:
+        values: At least two metric values
+        mean: Mean of values
+
+    Returns:
+        Sample standard deviation
+    """
+    deviations = [x - mean for x in values]
+    return math.sqrt(math.fsum(map(operator.mul, deviations, deviations)) / (len(values) - 1))
+
+
 class MetricsTracker:
     """Tracks and analyzes metrics for prompt versions."""
 
@@ -29,14 +48,22 @@ class MetricsTracker:
                 "sum": 0.0,
             }
 
+        # One exactly rounded sum for sum and mean, one sort for median, min and max
+        count = len(values)
+        total = math.fsum(values)
+        mean = total / count
+        ordered = sorted(values)
+        middle = count // 2
+        median = ordered[middle] if count % 2 else (ordered[middle - 1] + ordered[middle]) / 2
+
         return {
-            "count": len(values),
-            "mean": statistics.mean(values),
-            "median": statistics.median(values),
-            "std_dev": statistics.stdev(values) if len(values) > 1 else 0.0,
-            "min": min(values),
-            "max": max(values),
-            "sum": sum(values),
+            "count": count,
+            "mean": mean,
+            "median": median,
+            "std_dev": _sample_stdev(values, mean) if count > 1 else 0.0,
+            "min": ordered[0],
+            "max": ordered[-1],
+            "sum": total,
         }
 
     @staticmethod
@@ -134,8 +161,8 @@ class MetricsTracker:
 
         elif method == "zscore":
             # Z-score method
-            mean = statistics.mean(values)
-            std_dev = statistics.stdev(values)
+            mean = statistics.fmean(values)
+            std_dev = _sample_stdev(values, mean)
 
             for i, val in enumerate(values):
                 z_score = abs((val - mean) / std_dev) if std_dev > 0 else 0
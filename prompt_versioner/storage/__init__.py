@@ -1,62 +1,127 @@
 """Storage module for prompt versions using SQLite."""
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
 from prompt_versioner.storage.database import DatabaseManager
 from prompt_versioner.storage.versions import VersionStorage
 from prompt_versioner.storage.metrics import MetricsStorage
 from prompt_versioner.storage.annotations import AnnotationStorage
-from prompt_versioner.storage.queries import QueryBuilder
+from prompt_versioner.storage.queries import CommonQueries, QueryBuilder
 
 
 # Main storage class that combines all operations
 class PromptStorage:
     """Unified storage interface for prompt versions."""
 
-    def __init__(self, db_path: Path | None = None) -> None:
+    def __init__(
+        self, db_path: Path | None = None, sqlite_pragmas: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Initialize storage with SQLite database.
 
         Args:
             db_path: Path to SQLite database file
+            sqlite_pragmas: Connection pragmas overriding DatabaseManager.CONNECTION_PRAGMAS
         """
         self.db_path = db_path
-        self.db = DatabaseManager(self.db_path)
+        self.db = DatabaseManager(self.db_path, pragmas=sqlite_pragmas)
         self.versions = VersionStorage(self.db)
         self.metrics = MetricsStorage(self.db)
         self.annotations = AnnotationStorage(self.db)
 
+    def get_data_version(self) -> Tuple[Any, ...]:
+        """Get a token that changes whenever the stored data changes."""
+        return self.db.get_data_version()
+
+    def close(self) -> None:
+        """Close the database connection held by the current thread."""
+        self.db.close()
+
     # Delegate version operations
     def save_version(self, *args: Any, **kwargs: Any) -> int:
         return self.versions.save(*args, **kwargs)
 
+    def upsert_version(self, *args: Any, **kwargs: Any) -> int:
+        return self.versions.upsert(*args, **kwargs)
+
+    def save_versions_bulk(self, *args: Any, **kwargs: Any) -> int:
+        return self.versions.save_batch(*args, **kwargs)
+
     def get_version(self, *args: Any, **kwargs: Any) -> Optional[Dict[str, Any]]:
         return self.versions.get(*args, **kwargs)
 
+    def get_version_id(self, *args: Any, **kwargs: Any) -> Optional[int]:
+        return self.versions.get_id(*args, **kwargs)
+
     def get_latest_version(self, *args: Any, **kwargs: Any) -> Optional[Dict[str, Any]]:
         return self.versions.get_latest(*args, **kwargs)
 
     def list_versions(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
         return self.versions.list(*args, **kwargs)
 
+    def iter_versions(self, *args: Any, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        return self.versions.iter_versions(*args, **kwargs)
+
+    def list_version_strings(self, *args: Any, **kwargs: Any) -> Set[str]:
+        return self.versions.list_version_strings(*args, **kwargs)
+
     def list_all_prompts(self, *args: Any, **kwargs: Any) -> List[str]:
         return self.versions.list_all_prompts(*args, **kwargs)
 
+    def list_prompt_summaries(self) -> List[Dict[str, Any]]:
+        return self.versions.list_prompt_summaries()
+
+    def prompt_exists(self, *args: Any, **kwargs: Any) -> bool:
+        return self.versions.prompt_exists(*args, **kwargs)
+
+    def has_prompts(self) -> bool:
+        return self.versions.has_prompts()
+
     def delete_version(self, *args: Any, **kwargs: Any) -> bool:
         return self.versions.delete(*args, **kwargs)
 
     def delete_prompt(self, *args: Any, **kwargs: Any) -> bool:
         return self.versions.delete_prompt(*args, **kwargs)
 
+    def delete_versions(self, *args: Any, **kwargs: Any) -> int:
+        return self.versions.delete_versions(*args, **kwargs)
+
     # Delegate metrics operations
     def save_metrics(self, *args: Any, **kwargs: Any) -> int:
         return self.metrics.save(*args, **kwargs)
 
+    def save_metrics_batch(self, *args: Any, **kwargs: Any) -> int:
+        return self.metrics.save_batch(*args, **kwargs)
+
     def get_metrics(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
         return self.metrics.get(*args, **kwargs)
 
+    def iter_metrics(self, *args: Any, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        return self.metrics.iter_metrics(*args, **kwargs)
+
     def get_metrics_summary(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
         return self.metrics.get_summary(*args, **kwargs)
 
+    def get_metrics_summaries(self, *args: Any, **kwargs: Any) -> Dict[int, Dict[str, Any]]:
+        return self.metrics.get_summaries(*args, **kwargs)
+
+    def get_prompt_metrics_summaries(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        return self.metrics.get_prompt_summaries(*args, **kwargs)
+
+    def get_metric_column_stats(self, *args: Any, **kwargs: Any) -> Dict[str, Dict[str, Any]]:
+        return self.metrics.get_column_stats(*args, **kwargs)
+
+    def aggregate_metrics(self, *args: Any, **kwargs: Any) -> Optional[float]:
+        return self.metrics.aggregate(*args, **kwargs)
+
+    def get_metric_percentiles(self, *args: Any, **kwargs: Any) -> Dict[float, float]:
+        return self.metrics.get_percentiles(*args, **kwargs)
+
+    def get_version_summaries(self) -> List[Dict[str, Any]]:
+        return CommonQueries.get_version_summaries(self.db)
+
+    def get_versions_with_metrics(self, name: str, versions: List[str]) -> List[Dict[str, Any]]:
+        return CommonQueries.get_versions_with_metrics(self.db, name, versions)
+
     # Delegate annotation operations
     def add_annotation(self, *args: Any, **kwargs: Any) -> int:
         return self.annotations.add(*args, **kwargs)
@@ -64,6 +129,9 @@ class PromptStorage:
     def get_annotations(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
         return self.annotations.get(*args, **kwargs)
 
+    def iter_annotations(self, *args: Any, **kwargs: Any) -> Iterator[Dict[str, Any]]:
+        return self.annotations.iter_annotations(*args, **kwargs)
+
 
 __all__ = [
     "PromptStorage",
@@ -72,4 +140,5 @@ __all__ = [
     "MetricsStorage",
     "AnnotationStorage",
     "QueryBuilder",
+    "CommonQueries",
 ]
@@ -1,9 +1,14 @@
 """Annotations storage operations."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 from prompt_versioner.storage.database import DatabaseManager
 
+_SQL_INSERT_ANNOTATION = """
+    INSERT INTO annotations (version_id, author, text, timestamp, annotation_type)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
 
 class AnnotationStorage:
     """Handles annotation CRUD operations."""
@@ -32,23 +37,22 @@ class AnnotationStorage:
 
         with self.db.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO annotations (version_id, author, text, timestamp, annotation_type)
-                VALUES (?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_ANNOTATION,
                 (version_id, author, text, timestamp, annotation_type),
             )
             return cursor.rowcount if cursor.rowcount is not None else 0
 
-    def get(self, version_id: int, include_resolved: bool = True) -> List[Dict[str, Any]]:
-        """Get all annotations for a version.
+    def iter_annotations(
+        self, version_id: int, include_resolved: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the annotations of a version without loading them all at once.
 
         Args:
             version_id: Version ID
             include_resolved: Whether to include resolved annotations
 
-        Returns:
-            List of annotations
+        Yields:
+            Annotation dicts, newest first
         """
         query = """
             SELECT * FROM annotations
@@ -60,8 +64,19 @@ class AnnotationStorage:
 
         query += " ORDER BY timestamp DESC"
 
-        rows = self.db.execute(query, (version_id,), fetch="all")
-        return [dict(row) for row in rows]
+        yield from self.db.iter_dicts(query, (version_id,))
+
+    def get(self, version_id: int, include_resolved: bool = True) -> List[Dict[str, Any]]:
+        """Get all annotations for a version.
+
+        Args:
+            version_id: Version ID
+            include_resolved: Whether to include resolved annotations
+
+        Returns:
+            List of annotations
+        """
+        return list(self.iter_annotations(version_id, include_resolved))
 
     def get_by_author(self, author: str) -> List[Dict[str, Any]]:
         """Get all annotations by an author.
@@ -72,7 +87,7 @@ class AnnotationStorage:
         Returns:
             List of annotations
         """
-        rows = self.db.execute(
+        rows = self.db.iter_dicts(
             """
             SELECT a.*, v.name, v.version
             FROM annotations a
@@ -81,9 +96,8 @@ class AnnotationStorage:
             ORDER BY a.timestamp DESC
             """,
             (author,),
-            fetch="all",
         )
-        return [dict(row) for row in rows]
+        return list(rows)
 
     def update(self, annotation_id: int, text: str) -> bool:
         """Update annotation text.
@@ -179,13 +193,12 @@ class AnnotationStorage:
         Returns:
             List of annotations
         """
-        rows = self.db.execute(
+        rows = self.db.iter_dicts(
             """
             SELECT * FROM annotations
             WHERE version_id = ? AND annotation_type = ?
             ORDER BY timestamp DESC
             """,
             (version_id, annotation_type),
-            fetch="all",
         )
-        return [dict(row) for row in rows]
+        return list(rows)
@@ -2,50 +2,163 @@
 
 import re
 import sqlite3
+import threading
 from pathlib import Path
-from typing import Optional, Any, List, Dict, Generator
-from contextlib import contextmanager
+from typing import Optional, Any, List, Dict, Generator, Iterator, Tuple
+from contextlib import contextmanager, suppress
 
-from prompt_versioner.storage.schema import SCHEMA_DEFINITIONS, INDEXES
+from prompt_versioner.storage.schema import (
+    SCHEMA_DEFINITIONS,
+    INDEXES,
+    DROPPED_INDEXES,
+    TRIGGERS,
+    SUMMARY_BACKFILL,
+)
 
 
 class DatabaseManager:
     """Manages SQLite database connection and operations."""
 
-    def __init__(self, db_path: Optional[Path] = None):
+    # Pragmas applied to every new connection, tuned for log-heavy workloads
+    CONNECTION_PRAGMAS: Dict[str, Any] = {
+        # WAL only needs a full sync at checkpoints; NORMAL is still crash-safe
+        "synchronous": "NORMAL",
+        "temp_store": "MEMORY",
+        # Memory-mapped I/O window for reads (256 MB)
+        "mmap_size": 256 * 1024 * 1024,
+        # Page cache size; negative values are in KiB (64 MB)
+        "cache_size": -64 * 1024,
+        # Wait for a competing writer instead of failing with "database is locked"
+        "busy_timeout": 5000,
+    }
+
+    def __init__(
+        self, db_path: Optional[Path] = None, pragmas: Optional[Dict[str, Any]] = None
+    ) -> None:
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file. Defaults to .prompt_versions/db.sqlite
+            pragmas: Pragmas to set on each connection, overriding or extending
+                CONNECTION_PRAGMAS (e.g. {"synchronous": "FULL"})
         """
         if db_path is None:
             db_path = Path.cwd() / ".prompt_versions" / "db.sqlite"
 
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.pragmas = {**self.CONNECTION_PRAGMAS, **(pragmas or {})}
+        # Bumped on every committed write made through this manager
+        self._generation = 0
+        self._generation_lock = threading.Lock()
+        # Per-thread connection and get_connection nesting depth
+        self._local = threading.local()
         self._init_db()
 
     @contextmanager
-    def get_connection(self) -> Generator[sqlite3.Connection, None, None]:
+    def get_connection(
+        self, transaction: bool = True, immediate: bool = False
+    ) -> Generator[sqlite3.Connection, None, None]:
         """Context manager for database connections.
 
+        Each thread reuses one connection in autocommit mode until close() is
+        called, and the block is wrapped in an explicit BEGIN/COMMIT, so all
+        statements of a block share one transaction (and one consistent snapshot
+        for reads). Nested blocks join the transaction of the enclosing block.
+
+        Args:
+            transaction: Wrap the block in a transaction. Disable for statements
+                that cannot run inside one, such as VACUUM or changing journal_mode.
+            immediate: Take the write lock when the transaction starts (BEGIN
+                IMMEDIATE) instead of on the first write, for blocks that only write.
+
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
+        conn = self._thread_connection()
+        outermost = self._local.depth == 0
+        started = False
+        changes_before = conn.total_changes
+        self._local.depth += 1
         try:
+            if transaction and not conn.in_transaction:
+                conn.execute("BEGIN IMMEDIATE" if immediate else "BEGIN")
+                started = True
             yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
+            if started or outermost:
+                if conn.in_transaction:
+                    conn.execute("COMMIT")
+                if conn.total_changes != changes_before:
+                    with self._generation_lock:
+                        self._generation += 1
+        except BaseException:
+            # Also on KeyboardInterrupt, SystemExit or GeneratorExit: the
+            # connection outlives the block, so an open transaction would
+            # otherwise be committed by the next block on this thread
+            if (started or outermost) and conn.in_transaction:
+                conn.execute("ROLLBACK")
             raise
         finally:
+            self._local.depth -= 1
+
+    def _thread_connection(self) -> sqlite3.Connection:
+        """Get the connection of the current thread, opening it on first use."""
+        conn: Optional[sqlite3.Connection] = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.db_path, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            for pragma, value in self.pragmas.items():
+                conn.execute(f"PRAGMA {pragma}={value}")
+            self._local.conn = conn
+            self._local.depth = 0
+        return conn
+
+    def close(self) -> None:
+        """Close the connection of the current thread, if one is open.
+
+        Safe to call at any time outside a get_connection block; the next block
+        opens a new connection. Long-lived servers call this at the end of each
+        request so connections do not outlive their worker threads.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.depth == 0:
             conn.close()
+            self._local.conn = None
+
+    def get_data_version(self) -> Tuple[Any, ...]:
+        """Get a token that changes whenever the database contents change.
+
+        Combines the in-process write generation with the modification time and
+        size of the database file and its WAL file, so writes from other processes
+        are also detected. Suitable as a cache key for read results.
+
+        Returns:
+            Hashable data version token
+        """
+        signature: List[Any] = [self._generation]
+        for path in (self.db_path, self.db_path.with_name(self.db_path.name + "-wal")):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with self.get_connection() as conn:
+        with self.get_connection(transaction=False) as conn:
+            # Persistent setting: readers no longer block the writer and commits
+            # append to the WAL instead of rewriting the rollback journal
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # Create the whole schema in a single transaction
+            conn.execute("BEGIN")
+
+            summary_exists = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='version_metric_summary'"
+            ).fetchone()
+
             # Create tables
             for table_name, table_sql in SCHEMA_DEFINITIONS.items():
                 conn.execute(table_sql)
@@ -53,6 +166,17 @@ class DatabaseManager:
             # Create indexes
             for index_sql in INDEXES:
                 conn.execute(index_sql)
+            for index_sql in DROPPED_INDEXES:
+                conn.execute(index_sql)
+
+            # Create triggers
+            for trigger_sql in TRIGGERS:
+                conn.execute(trigger_sql)
+
+            # Databases created before the summary table existed start from their
+            # current metrics
+            if not summary_exists:
+                conn.execute(SUMMARY_BACKFILL)
 
     def execute(self, query: str, params: tuple = (), fetch: str | None = None) -> Any:
         """Execute a query.
@@ -78,13 +202,47 @@ class DatabaseManager:
     def execute_many(self, query: str, params_list: List[tuple]) -> None:
         """Execute a query multiple times with different parameters.
 
+        All rows are written in one transaction that holds the write lock from
+        the start, so a concurrent writer cannot interleave with the batch.
+
         Args:
             query: SQL query
             params_list: List of parameter tuples
         """
-        with self.get_connection() as conn:
+        with self.get_connection(immediate=True) as conn:
             conn.executemany(query, params_list)
 
+    def iter_dicts(self, query: str, params: tuple = ()) -> Iterator[Dict[str, Any]]:
+        """Execute a query and yield each result row as a dict.
+
+        Rows are read from the cursor as they are consumed instead of being
+        fetched into a list first. The query runs as a single statement outside
+        an explicit transaction. The iterator does not count as an open
+        get_connection block while it is suspended, so close() still closes the
+        thread's connection (and ends the iteration) if it is abandoned part way.
+
+        Args:
+            query: SQL query
+            params: Query parameters
+
+        Yields:
+            Dict mapping column names to values
+        """
+        with self.get_connection(transaction=False) as conn:
+            cursor = conn.execute(query, params)
+
+        try:
+            # Plain tuples zipped with the column names once per query are
+            # cheaper to convert than sqlite3.Row objects
+            cursor.row_factory = None
+            names = [column[0] for column in cursor.description]
+            for row in cursor:
+                yield dict(zip(names, row))
+        finally:
+            # The connection may already have been closed by close()
+            with suppress(sqlite3.ProgrammingError):
+                cursor.close()
+
     def get_table_info(self, table_name: str) -> List[Dict[str, Any]]:
         self._validate_table_name(table_name)
         """Get information about a table.
@@ -113,7 +271,7 @@ class DatabaseManager:
 
     def vacuum(self) -> None:
         """Vacuum the database to reclaim space."""
-        with self.get_connection() as conn:
+        with self.get_connection(transaction=False) as conn:
             conn.execute("VACUUM")
 
     def get_db_size(self) -> int:
@@ -122,7 +280,13 @@ class DatabaseManager:
         Returns:
             Size in bytes
         """
-        return self.db_path.stat().st_size if self.db_path.exists() else 0
+        size = self.db_path.stat().st_size if self.db_path.exists() else 0
+
+        # Include pages not yet checkpointed from the write-ahead log
+        wal_path = self.db_path.with_name(self.db_path.name + "-wal")
+        if wal_path.exists():
+            size += wal_path.stat().st_size
+        return size
 
     def backup(self, backup_path: Path) -> None:
         """Backup database to another file.
@@ -1,10 +1,30 @@
 """Metrics storage operations."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Sequence
 import json
+import math
 from prompt_versioner.storage.database import DatabaseManager
 
+# Shared compact encoder for the metadata column (built once, no whitespace)
+_METADATA_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+# Shared by save and save_batch so both reuse one cached compiled statement
+_SQL_INSERT_METRICS = """
+    INSERT INTO prompt_metrics
+    (version_id, model_name, input_tokens, output_tokens, total_tokens,
+     cost_eur, latency_ms, quality_score, accuracy, temperature, top_p,
+     max_tokens, success, error_message, timestamp, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+# LIMIT is bound as a parameter (-1 means no limit)
+_SQL_GET_METRICS = """
+    SELECT * FROM prompt_metrics
+    WHERE version_id = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
 
 class MetricsStorage:
     # Allowed metric columns for time series queries
@@ -24,6 +44,94 @@ class MetricsStorage:
         # Add more if needed
     }
 
+    # Summary statistics derived from the running totals in version_metric_summary
+    SUMMARY_COLUMNS = """
+                call_count,
+                sum_input_tokens * 1.0 / NULLIF(n_input_tokens, 0) as avg_input_tokens,
+                sum_output_tokens * 1.0 / NULLIF(n_output_tokens, 0) as avg_output_tokens,
+                sum_total_tokens * 1.0 / NULLIF(n_total_tokens, 0) as avg_total_tokens,
+                CASE WHEN n_total_tokens > 0 THEN sum_total_tokens END as total_tokens_used,
+                sum_cost / NULLIF(n_cost, 0) as avg_cost,
+                CASE WHEN n_cost > 0 THEN sum_cost END as total_cost,
+                sum_latency / NULLIF(n_latency, 0) as avg_latency,
+                min_latency,
+                max_latency,
+                sum_quality / NULLIF(n_quality, 0) as avg_quality,
+                sum_accuracy / NULLIF(n_accuracy, 0) as avg_accuracy,
+                success_count,
+                error_count
+    """
+
+    # Summary of a version without metrics
+    EMPTY_SUMMARY: Dict[str, Any] = {
+        "call_count": 0,
+        "avg_input_tokens": None,
+        "avg_output_tokens": None,
+        "avg_total_tokens": None,
+        "total_tokens_used": None,
+        "avg_cost": None,
+        "total_cost": None,
+        "avg_latency": None,
+        "min_latency": None,
+        "max_latency": None,
+        "avg_quality": None,
+        "avg_accuracy": None,
+        "success_count": None,
+        "error_count": None,
+        "success_rate": 0,
+    }
+
+    # Numeric metric columns with a running average in version_metric_summary
+    AVERAGE_COLUMNS = (
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",
+        "cost_eur",
+        "latency_ms",
+        "quality_score",
+        "accuracy",
+    )
+
+    # Average of each AVERAGE_COLUMNS column from its version_metric_summary totals
+    SUMMARY_AVERAGES = {
+        "input_tokens": "sum_input_tokens * 1.0 / NULLIF(n_input_tokens, 0)",
+        "output_tokens": "sum_output_tokens * 1.0 / NULLIF(n_output_tokens, 0)",
+        "total_tokens": "sum_total_tokens * 1.0 / NULLIF(n_total_tokens, 0)",
+        "cost_eur": "sum_cost / NULLIF(n_cost, 0)",
+        "latency_ms": "sum_latency / NULLIF(n_latency, 0)",
+        "quality_score": "sum_quality / NULLIF(n_quality, 0)",
+        "accuracy": "sum_accuracy / NULLIF(n_accuracy, 0)",
+    }
+
+    # Numeric metric columns summarized by get_column_stats, in table order
+    STATS_COLUMNS = AVERAGE_COLUMNS + ("temperature", "top_p", "max_tokens", "success")
+
+    # Per-row metric columns accepted by save_batch, in INSERT order
+    INSERT_COLUMNS = (
+        "model_name",
+        "input_tokens",
+        "output_tokens",
+        "total_tokens",
+        "cost_eur",
+        "latency_ms",
+        "quality_score",
+        "accuracy",
+        "temperature",
+        "top_p",
+        "max_tokens",
+        "success",
+        "error_message",
+    )
+
+    # SQL aggregate expressions supported by aggregate()
+    AGGREGATE_FUNCTIONS = {
+        "avg": "AVG({column})",
+        "min": "MIN({column})",
+        "max": "MAX({column})",
+        "sum": "SUM({column})",
+        "count": "COUNT({column})",
+    }
+
     """Handles metrics CRUD operations."""
 
     def __init__(self, db_manager: DatabaseManager) -> None:
@@ -75,17 +183,11 @@ class MetricsStorage:
             Metrics ID
         """
         timestamp = datetime.now(timezone.utc).isoformat()
-        metadata_json = json.dumps(metadata) if metadata else None
+        metadata_json = _METADATA_ENCODER.encode(metadata) if metadata else None
 
         with self.db.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO prompt_metrics
-                (version_id, model_name, input_tokens, output_tokens, total_tokens,
-                 cost_eur, latency_ms, quality_score, accuracy, temperature, top_p,
-                 max_tokens, success, error_message, timestamp, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_METRICS,
                 (
                     version_id,
                     model_name,
@@ -107,79 +209,328 @@ class MetricsStorage:
             )
             return cursor.rowcount if cursor.rowcount is not None else 0
 
-    def get(self, version_id: int, limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get all metrics for a version.
+    def save_batch(self, version_id: int, metrics: List[Dict[str, Any]]) -> int:
+        """Save many metrics rows for a prompt version in a single transaction.
 
         Args:
             version_id: ID of the prompt version
-            limit: Optional limit on results
+            metrics: List of dicts using the same keys as ``save`` (any subset of
+                the metric columns plus ``metadata``)
 
         Returns:
-            List of metric dicts
-        """
-        query = """
-            SELECT * FROM prompt_metrics
-            WHERE version_id = ?
-            ORDER BY timestamp DESC
+            Number of rows inserted
         """
+        if not metrics:
+            return 0
 
-        if limit:
-            query += f" LIMIT {limit}"
+        timestamp = datetime.now(timezone.utc).isoformat()
+        # Rows often share one metadata dict; encode each distinct object once
+        encoded_metadata: Dict[int, str] = {}
+        rows = []
+        for record in metrics:
+            unknown = record.keys() - set(self.INSERT_COLUMNS) - {"metadata"}
+            if unknown:
+                raise ValueError(f"Unknown metric fields: {', '.join(sorted(unknown))}")
+
+            values = {"success": True, **record}
+            metadata = values.get("metadata")
+            metadata_json = None
+            if metadata:
+                metadata_json = encoded_metadata.get(id(metadata))
+                if metadata_json is None:
+                    metadata_json = _METADATA_ENCODER.encode(metadata)
+                    encoded_metadata[id(metadata)] = metadata_json
+
+            rows.append(
+                (
+                    version_id,
+                    *(values.get(column) for column in self.INSERT_COLUMNS),
+                    timestamp,
+                    metadata_json,
+                )
+            )
 
-        rows = self.db.execute(query, (version_id,), fetch="all")
+        self.db.execute_many(_SQL_INSERT_METRICS, rows)
+        return len(rows)
 
-        metrics = []
-        for row in rows:
-            metric = dict(row)
-            if metric.get("metadata"):
+    def iter_metrics(
+        self, version_id: int, limit: Optional[int] = None, decode_metadata: bool = True
+    ) -> Iterator[Dict[str, Any]]:
+        """Iterate over the metrics of a version without loading them all at once.
+
+        Args:
+            version_id: ID of the prompt version
+            limit: Optional limit on results
+            decode_metadata: Parse the metadata JSON into a dict. Callers that
+                never read metadata can disable it to skip json.loads per row
+
+        Yields:
+            Metric dicts, newest first
+        """
+        for metric in self.db.iter_dicts(_SQL_GET_METRICS, (version_id, limit or -1)):
+            if decode_metadata and metric.get("metadata"):
                 try:
                     metric["metadata"] = json.loads(metric["metadata"])
                 except json.JSONDecodeError:
                     metric["metadata"] = {}
-            metrics.append(metric)
+            yield metric
 
-        return metrics
+    def get(
+        self, version_id: int, limit: Optional[int] = None, decode_metadata: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Get all metrics for a version.
+
+        Args:
+            version_id: ID of the prompt version
+            limit: Optional limit on results
+            decode_metadata: Parse the metadata JSON into a dict; when False the
+                raw JSON string is returned
+
+        Returns:
+            List of metric dicts
+        """
+        return list(self.iter_metrics(version_id, limit, decode_metadata))
 
     def get_summary(self, version_id: int) -> Dict[str, Any]:
         """Get summary statistics of metrics for a version.
 
+        Reads the running totals kept by the metrics triggers, so the cost does not
+        grow with the number of recorded calls.
+
         Args:
             version_id: ID of the prompt version
 
         Returns:
             Dict with summary statistics
         """
+        return self.get_summaries([version_id])[version_id]
+
+    def get_summaries(self, version_ids: Sequence[int]) -> Dict[int, Dict[str, Any]]:
+        """Get summary statistics for several versions with one query.
+
+        Args:
+            version_ids: IDs of the prompt versions
+
+        Returns:
+            Dict mapping each version ID to the same statistics as get_summary
+        """
+        if not version_ids:
+            return {}
+
+        placeholders = ",".join("?" * len(version_ids))
+        rows = self.db.execute(
+            f"""
+            SELECT version_id, {self.SUMMARY_COLUMNS}
+            FROM version_metric_summary
+            WHERE version_id IN ({placeholders})
+            """,  # nosec B608 -- only placeholders and a class constant are interpolated
+            tuple(version_ids),
+            fetch="all",
+        )
+
+        summaries = {}
+        for row in rows:
+            summary = self._summary_from_row(row)
+            summaries[summary.pop("version_id")] = summary
+
+        # Versions without metrics have no summary row
+        for vid in version_ids:
+            if vid not in summaries:
+                summaries[vid] = dict(self.EMPTY_SUMMARY)
+
+        return summaries
+
+    def get_column_stats(self, version_id: int) -> Dict[str, Dict[str, Any]]:
+        """Get count, average, min, max and stddev of every numeric metric in one query.
+
+        Args:
+            version_id: ID of the prompt version
+
+        Returns:
+            Dict mapping each metric column with recorded values to its statistics
+            (stddev is the sample standard deviation, 0.0 for a single value)
+        """
+        means = ", ".join(f"AVG({col}) as {col}_mean" for col in self.STATS_COLUMNS)
+        aggregates = ", ".join(
+            f"COUNT({col}) as {col}_n, AVG({col}) as {col}_avg, MIN({col}) as {col}_min, "
+            f"MAX({col}) as {col}_max, {self._squared_deviations(col)} as {col}_ssd"
+            for col in self.STATS_COLUMNS
+        )
         row = self.db.execute(
+            f"""
+            WITH means AS (
+                SELECT {means} FROM prompt_metrics WHERE version_id = ?
+            )
+            SELECT {aggregates}
+            FROM prompt_metrics, means
+            WHERE version_id = ?
+            """,  # nosec B608 -- only a class constant is interpolated
+            (version_id, version_id),
+            fetch="one",
+        )
+
+        stats: Dict[str, Dict[str, Any]] = {}
+        for col in self.STATS_COLUMNS:
+            n = row[f"{col}_n"]
+            if not n:
+                continue
+            stats[col] = {
+                "count": n,
+                "avg": row[f"{col}_avg"],
+                "min": row[f"{col}_min"],
+                "max": row[f"{col}_max"],
+                "stddev": math.sqrt(row[f"{col}_ssd"] / (n - 1)) if n > 1 else 0.0,
+            }
+        return stats
+
+    @staticmethod
+    def _squared_deviations(column: str) -> str:
+        """SQL summing the squared deviations of a column from its mean.
+
+        Expects a ``means`` row with a ``<column>_mean`` value joined in. Two
+        passes avoid the cancellation of sum(x*x) - n*mean*mean, which loses
+        all precision (and can go negative) for large values such as latency.
+        """
+        deviation = f"({column} - means.{column}_mean)"
+        return f"SUM({deviation} * {deviation})"
+
+    def get_prompt_summaries(self, name: str, min_calls: int = 0) -> List[Dict[str, Any]]:
+        """Get headline metrics for every version of a prompt in one query.
+
+        Args:
+            name: Prompt name
+            min_calls: Only include versions with at least this many calls
+
+        Returns:
+            List of dicts with version_id, version, timestamp, call_count,
+            avg_quality, avg_cost and avg_latency, newest version first
+        """
+        rows = self.db.iter_dicts(
             """
             SELECT
-                COUNT(*) as call_count,
-                AVG(input_tokens) as avg_input_tokens,
-                AVG(output_tokens) as avg_output_tokens,
-                AVG(total_tokens) as avg_total_tokens,
-                SUM(total_tokens) as total_tokens_used,
-                AVG(cost_eur) as avg_cost,
-                SUM(cost_eur) as total_cost,
-                AVG(latency_ms) as avg_latency,
-                MIN(latency_ms) as min_latency,
-                MAX(latency_ms) as max_latency,
-                AVG(quality_score) as avg_quality,
-                AVG(accuracy) as avg_accuracy,
-                SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as success_count,
-                SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as error_count
-            FROM prompt_metrics
-            WHERE version_id = ?
+                v.id as version_id,
+                v.version,
+                v.timestamp,
+                COALESCE(s.call_count, 0) as call_count,
+                s.sum_quality / NULLIF(s.n_quality, 0) as avg_quality,
+                s.sum_cost / NULLIF(s.n_cost, 0) as avg_cost,
+                s.sum_latency / NULLIF(s.n_latency, 0) as avg_latency
+            FROM prompt_versions v
+            LEFT JOIN version_metric_summary s ON s.version_id = v.id
+            WHERE v.name = ? AND COALESCE(s.call_count, 0) >= ?
+            ORDER BY v.timestamp DESC
             """,
+            (name, min_calls),
+        )
+        return list(rows)
+
+    @staticmethod
+    def _summary_from_row(row: Any) -> Dict[str, Any]:
+        """Convert a summary row to a dict with the derived success rate."""
+        summary = dict(row)
+        summary["success_rate"] = (
+            summary["success_count"] / summary["call_count"] if summary["call_count"] > 0 else 0
+        )
+        return summary
+
+    def aggregate(self, version_id: int, metric_name: str, op: str = "avg") -> Optional[float]:
+        """Aggregate a single metric column in SQL without loading the rows.
+
+        Args:
+            version_id: Version ID
+            metric_name: Name of metric column
+            op: Aggregate to compute ('avg', 'min', 'max', 'sum', 'count' or 'stddev')
+
+        Returns:
+            Aggregate value, or None if there are no non-null values
+        """
+        # Validate metric_name to prevent SQL injection
+        self._validate_metric_name(metric_name)
+
+        if op == "stddev":
+            # Sample standard deviation about the mean (SQLite has no STDDEV)
+            row = self.db.execute(
+                f"""
+                WITH means AS (
+                    SELECT AVG({metric_name}) as {metric_name}_mean
+                    FROM prompt_metrics
+                    WHERE version_id = ?
+                )
+                SELECT COUNT({metric_name}) as n,
+                       {self._squared_deviations(metric_name)} as ssd
+                FROM prompt_metrics, means
+                WHERE version_id = ?
+                """,  # nosec: B608 -- metric_name validated
+                (version_id, version_id),
+                fetch="one",
+            )
+            n = row["n"]
+            if n < 2:
+                return None
+            return math.sqrt(row["ssd"] / (n - 1))
+
+        if op not in self.AGGREGATE_FUNCTIONS:
+            raise ValueError(f"Invalid aggregate: {op}")
+
+        expression = self.AGGREGATE_FUNCTIONS[op].format(column=metric_name)
+        row = self.db.execute(
+            f"SELECT {expression} as value FROM prompt_metrics WHERE version_id = ?",  # nosec: B608
             (version_id,),
             fetch="one",
         )
+        return row["value"]
 
-        if row:
-            summary = dict(row)
-            summary["success_rate"] = (
-                summary["success_count"] / summary["call_count"] if summary["call_count"] > 0 else 0
-            )
-            return summary
-        return {}
+    def get_percentiles(
+        self,
+        version_id: int,
+        metric_name: str,
+        percentiles: Sequence[float] = (50, 90, 95, 99),
+    ) -> Dict[float, float]:
+        """Compute exact percentiles of a metric column in SQL.
+
+        Uses the same nearest-rank rule as ``MetricsTracker.compute_percentiles``
+        (index ``int(n * p / 100)`` into the sorted values), but sorts and picks
+        the ranks inside SQLite so only the requested values reach Python.
+
+        Args:
+            version_id: Version ID
+            metric_name: Name of metric column
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            Dict of percentile -> value (0.0 for every percentile if there is no data)
+        """
+        # Validate metric_name to prevent SQL injection
+        self._validate_metric_name(metric_name)
+
+        with self.db.get_connection() as conn:
+            count = conn.execute(
+                f"SELECT COUNT({metric_name}) FROM prompt_metrics WHERE version_id = ?",  # nosec: B608
+                (version_id,),
+            ).fetchone()[0]
+
+            if count == 0:
+                return {p: 0.0 for p in percentiles}
+
+            ranks = {p: min(int(count * p / 100), count - 1) for p in percentiles}
+            wanted = sorted(set(ranks.values()))
+            placeholders = ",".join("?" * len(wanted))
+
+            rows = conn.execute(
+                f"""
+                SELECT rank, value FROM (
+                    SELECT {metric_name} as value,
+                           ROW_NUMBER() OVER (ORDER BY {metric_name}) - 1 as rank
+                    FROM prompt_metrics
+                    WHERE version_id = ? AND {metric_name} IS NOT NULL
+                )
+                WHERE rank IN ({placeholders})
+                """,  # nosec: B608 -- metric_name validated
+                (version_id, *wanted),
+            ).fetchall()
+
+        values = {row["rank"]: row["value"] for row in rows}
+        return {p: values[rank] for p, rank in ranks.items()}
 
     def get_by_model(self, version_id: int) -> Dict[str, Dict[str, Any]]:
         """Get metrics grouped by model.
@@ -190,7 +541,7 @@ class MetricsStorage:
         Returns:
             Dict of model_name -> summary stats
         """
-        rows = self.db.execute(
+        rows = self.db.iter_dicts(
             """
             SELECT
                 model_name,
@@ -204,10 +555,9 @@ class MetricsStorage:
             GROUP BY model_name
             """,
             (version_id,),
-            fetch="all",
         )
 
-        return {row["model_name"]: dict(row) for row in rows}
+        return {row["model_name"]: row for row in rows}
 
     def get_latest(self, version_id: int, n: int = 10) -> List[Dict[str, Any]]:
         """Get latest N metrics for a version.
@@ -256,17 +606,16 @@ class MetricsStorage:
         Returns:
             List of failed metric dicts
         """
-        rows = self.db.execute(
+        rows = self.db.iter_dicts(
             """
             SELECT * FROM prompt_metrics
             WHERE version_id = ? AND success = 0
             ORDER BY timestamp DESC
             """,
             (version_id,),
-            fetch="all",
         )
 
-        return [dict(row) for row in rows]
+        return list(rows)
 
     def get_time_series(
         self, version_id: int, metric_name: str, interval: str = "hour"
@@ -304,8 +653,8 @@ class MetricsStorage:
             GROUP BY time_bucket
             ORDER BY time_bucket
         """  # nosec: B608 -- metric_name validated
-        rows = self.db.execute(query, (version_id,), fetch="all")
-        return [dict(row) for row in rows]
+        rows = self.db.iter_dicts(query, (version_id,))
+        return list(rows)
 
     def _validate_metric_name(self, metric_name: str) -> None:
         """Validate metric name to prevent SQL injection."""
@@ -2,6 +2,7 @@
 
 from typing import List, Dict, Any
 from prompt_versioner.storage.database import DatabaseManager
+from prompt_versioner.storage.metrics import MetricsStorage
 
 
 class QueryBuilder:
@@ -142,7 +143,7 @@ class CommonQueries:
         Returns:
             List of model usage stats
         """
-        rows = db_manager.execute(
+        rows = db_manager.iter_dicts(
             f"""
             SELECT
                 model_name,
@@ -155,10 +156,55 @@ class CommonQueries:
             ORDER BY usage_count DESC
             LIMIT {limit}
             """,  # nosec: B608 -- limit is int and safe
+        )
+
+        return list(rows)
+
+    @staticmethod
+    def get_versions_with_metrics(
+        db_manager: DatabaseManager, name: str, versions: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Get several versions of a prompt with their metric averages in one query.
+
+        Args:
+            db_manager: DatabaseManager instance
+            name: Prompt name
+            versions: Version strings to load
+
+        Returns:
+            One dict per requested version that exists, in the requested order,
+            with id, version, timestamp, git_commit and a "metrics" dict of
+            {metric_name: average} (metrics with no recorded values are omitted)
+        """
+        if not versions:
+            return []
+
+        columns = MetricsStorage.AVERAGE_COLUMNS
+        # Averages come from the running totals, without reading metric rows
+        averages = ", ".join(f"{MetricsStorage.SUMMARY_AVERAGES[col]} as {col}" for col in columns)
+        placeholders = ",".join("?" * len(versions))
+        rows = db_manager.execute(
+            f"""
+            SELECT v.id, v.version, v.timestamp, v.git_commit, {averages}
+            FROM prompt_versions v
+            LEFT JOIN version_metric_summary s ON s.version_id = v.id
+            WHERE v.name = ? AND v.version IN ({placeholders})
+            """,  # nosec B608 -- only placeholders and class constants are interpolated
+            (name, *versions),
             fetch="all",
         )
 
-        return [dict(row) for row in rows]
+        by_version = {
+            row["version"]: {
+                "id": row["id"],
+                "version": row["version"],
+                "timestamp": row["timestamp"],
+                "git_commit": row["git_commit"],
+                "metrics": {col: row[col] for col in columns if row[col] is not None},
+            }
+            for row in rows
+        }
+        return [by_version[version] for version in versions if version in by_version]
 
     @staticmethod
     def get_recent_activity(db_manager: DatabaseManager, days: int = 7) -> List[Dict[str, Any]]:
@@ -171,14 +217,50 @@ class CommonQueries:
         Returns:
             List of recent versions
         """
-        rows = db_manager.execute(
+        rows = db_manager.iter_dicts(
             f"""
             SELECT *
             FROM prompt_versions
             WHERE datetime(timestamp) >= datetime('now', '-{days} days')
             ORDER BY timestamp DESC
             """,  # nosec: B608 -- days is int and safe
-            fetch="all",
         )
 
-        return [dict(row) for row in rows]
+        return list(rows)
+
+    @staticmethod
+    def get_version_summaries(db_manager: DatabaseManager) -> List[Dict[str, Any]]:
+        """Get per-version metric and annotation totals for every prompt in one query.
+
+        Metric totals come from version_metric_summary and annotations are counted
+        before joining, so the counts are not multiplied by each other.
+
+        Args:
+            db_manager: DatabaseManager instance
+
+        Returns:
+            List of version summaries ordered by prompt name, newest version first
+        """
+        rows = db_manager.iter_dicts(
+            """
+            SELECT
+                v.id as version_id,
+                v.name,
+                v.version,
+                v.timestamp,
+                COALESCE(m.call_count, 0) as call_count,
+                COALESCE(m.sum_cost, 0) as total_cost,
+                m.sum_quality / NULLIF(m.n_quality, 0) as avg_quality,
+                COALESCE(a.annotation_count, 0) as annotation_count
+            FROM prompt_versions v
+            LEFT JOIN version_metric_summary m ON m.version_id = v.id
+            LEFT JOIN (
+                SELECT version_id, COUNT(*) as annotation_count
+                FROM annotations
+                GROUP BY version_id
+            ) a ON a.version_id = v.id
+            ORDER BY v.name, v.timestamp DESC
+            """,
+        )
+
+        return list(rows)
@@ -60,6 +60,33 @@ SCHEMA_DEFINITIONS = {
             UNIQUE(version_id, tag)
         )
     """,
+    # Running per-version totals of prompt_metrics, kept current by TRIGGERS.
+    # sum_* hold the sum and n_* the number of non-null values of each column
+    "version_metric_summary": """
+        CREATE TABLE IF NOT EXISTS version_metric_summary (
+            version_id INTEGER PRIMARY KEY,
+            call_count INTEGER NOT NULL DEFAULT 0,
+            success_count INTEGER NOT NULL DEFAULT 0,
+            error_count INTEGER NOT NULL DEFAULT 0,
+            sum_input_tokens INTEGER NOT NULL DEFAULT 0,
+            n_input_tokens INTEGER NOT NULL DEFAULT 0,
+            sum_output_tokens INTEGER NOT NULL DEFAULT 0,
+            n_output_tokens INTEGER NOT NULL DEFAULT 0,
+            sum_total_tokens INTEGER NOT NULL DEFAULT 0,
+            n_total_tokens INTEGER NOT NULL DEFAULT 0,
+            sum_cost REAL NOT NULL DEFAULT 0,
+            n_cost INTEGER NOT NULL DEFAULT 0,
+            sum_latency REAL NOT NULL DEFAULT 0,
+            n_latency INTEGER NOT NULL DEFAULT 0,
+            min_latency REAL,
+            max_latency REAL,
+            sum_quality REAL NOT NULL DEFAULT 0,
+            n_quality INTEGER NOT NULL DEFAULT 0,
+            sum_accuracy REAL NOT NULL DEFAULT 0,
+            n_accuracy INTEGER NOT NULL DEFAULT 0,
+            FOREIGN KEY (version_id) REFERENCES prompt_versions(id) ON DELETE CASCADE
+        )
+    """,
 }
 
 # Indexes for performance
@@ -67,12 +94,158 @@ INDEXES = [
     "CREATE INDEX IF NOT EXISTS idx_name_version ON prompt_versions(name, version)",
     "CREATE INDEX IF NOT EXISTS idx_timestamp ON prompt_versions(timestamp DESC)",
     "CREATE INDEX IF NOT EXISTS idx_name ON prompt_versions(name)",
-    "CREATE INDEX IF NOT EXISTS idx_metrics_version ON prompt_metrics(version_id)",
+    # Also serves every version_id lookup; lets the delete trigger recompute
+    # min/max latency with one index seek
+    "CREATE INDEX IF NOT EXISTS idx_metrics_version_latency "
+    "ON prompt_metrics(version_id, latency_ms)",
     "CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON prompt_metrics(timestamp DESC)",
     "CREATE INDEX IF NOT EXISTS idx_annotations_version ON annotations(version_id)",
     "CREATE INDEX IF NOT EXISTS idx_tags_version ON version_tags(version_id)",
     "CREATE INDEX IF NOT EXISTS idx_tags_tag ON version_tags(tag)",
 ]
 
+# Indexes made redundant by idx_metrics_version_latency and version_metric_summary,
+# dropped from existing databases
+DROPPED_INDEXES = [
+    "DROP INDEX IF EXISTS idx_metrics_version",
+    "DROP INDEX IF EXISTS idx_metrics_version_summary",
+]
+
+# Triggers maintaining version_metric_summary on every metrics insert, delete and update
+TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS trg_metric_summary_insert
+    AFTER INSERT ON prompt_metrics
+    BEGIN
+        INSERT INTO version_metric_summary (
+            version_id, call_count, success_count, error_count,
+            sum_input_tokens, n_input_tokens, sum_output_tokens, n_output_tokens,
+            sum_total_tokens, n_total_tokens, sum_cost, n_cost,
+            sum_latency, n_latency, min_latency, max_latency,
+            sum_quality, n_quality, sum_accuracy, n_accuracy
+        ) VALUES (
+            NEW.version_id, 1, COALESCE(NEW.success = 1, 0), COALESCE(NEW.success = 0, 0),
+            COALESCE(NEW.input_tokens, 0), NEW.input_tokens IS NOT NULL,
+            COALESCE(NEW.output_tokens, 0), NEW.output_tokens IS NOT NULL,
+            COALESCE(NEW.total_tokens, 0), NEW.total_tokens IS NOT NULL,
+            COALESCE(NEW.cost_eur, 0), NEW.cost_eur IS NOT NULL,
+            COALESCE(NEW.latency_ms, 0), NEW.latency_ms IS NOT NULL,
+            NEW.latency_ms, NEW.latency_ms,
+            COALESCE(NEW.quality_score, 0), NEW.quality_score IS NOT NULL,
+            COALESCE(NEW.accuracy, 0), NEW.accuracy IS NOT NULL
+        )
+        ON CONFLICT(version_id) DO UPDATE SET
+            call_count = call_count + 1,
+            success_count = success_count + excluded.success_count,
+            error_count = error_count + excluded.error_count,
+            sum_input_tokens = sum_input_tokens + excluded.sum_input_tokens,
+            n_input_tokens = n_input_tokens + excluded.n_input_tokens,
+            sum_output_tokens = sum_output_tokens + excluded.sum_output_tokens,
+            n_output_tokens = n_output_tokens + excluded.n_output_tokens,
+            sum_total_tokens = sum_total_tokens + excluded.sum_total_tokens,
+            n_total_tokens = n_total_tokens + excluded.n_total_tokens,
+            sum_cost = sum_cost + excluded.sum_cost,
+            n_cost = n_cost + excluded.n_cost,
+            sum_latency = sum_latency + excluded.sum_latency,
+            n_latency = n_latency + excluded.n_latency,
+            min_latency = COALESCE(MIN(min_latency, excluded.min_latency), min_latency,
+                                   excluded.min_latency),
+            max_latency = COALESCE(MAX(max_latency, excluded.max_latency), max_latency,
+                                   excluded.max_latency),
+            sum_quality = sum_quality + excluded.sum_quality,
+            n_quality = n_quality + excluded.n_quality,
+            sum_accuracy = sum_accuracy + excluded.sum_accuracy,
+            n_accuracy = n_accuracy + excluded.n_accuracy;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS trg_metric_summary_delete
+    AFTER DELETE ON prompt_metrics
+    BEGIN
+        UPDATE version_metric_summary SET
+            call_count = call_count - 1,
+            success_count = success_count - COALESCE(OLD.success = 1, 0),
+            error_count = error_count - COALESCE(OLD.success = 0, 0),
+            sum_input_tokens = sum_input_tokens - COALESCE(OLD.input_tokens, 0),
+            n_input_tokens = n_input_tokens - (OLD.input_tokens IS NOT NULL),
+            sum_output_tokens = sum_output_tokens - COALESCE(OLD.output_tokens, 0),
+            n_output_tokens = n_output_tokens - (OLD.output_tokens IS NOT NULL),
+            sum_total_tokens = sum_total_tokens - COALESCE(OLD.total_tokens, 0),
+            n_total_tokens = n_total_tokens - (OLD.total_tokens IS NOT NULL),
+            sum_cost = sum_cost - COALESCE(OLD.cost_eur, 0),
+            n_cost = n_cost - (OLD.cost_eur IS NOT NULL),
+            sum_latency = sum_latency - COALESCE(OLD.latency_ms, 0),
+            n_latency = n_latency - (OLD.latency_ms IS NOT NULL),
+            sum_quality = sum_quality - COALESCE(OLD.quality_score, 0),
+            n_quality = n_quality - (OLD.quality_score IS NOT NULL),
+            sum_accuracy = sum_accuracy - COALESCE(OLD.accuracy, 0),
+            n_accuracy = n_accuracy - (OLD.accuracy IS NOT NULL)
+        WHERE version_id = OLD.version_id;
+
+        -- Extremes cannot be subtracted; rescan only when one was removed
+        UPDATE version_metric_summary SET
+            min_latency = (
+                SELECT MIN(latency_ms) FROM prompt_metrics WHERE version_id = OLD.version_id
+            ),
+            max_latency = (
+                SELECT MAX(latency_ms) FROM prompt_metrics WHERE version_id = OLD.version_id
+            )
+        WHERE version_id = OLD.version_id
+            AND (OLD.latency_ms <= min_latency OR OLD.latency_ms >= max_latency);
+
+        DELETE FROM version_metric_summary
+        WHERE version_id = OLD.version_id AND call_count <= 0;
+    END""",
+    # Updates are rare, so the affected versions are simply rebuilt from their rows
+    """CREATE TRIGGER IF NOT EXISTS trg_metric_summary_update
+    AFTER UPDATE OF version_id, success, input_tokens, output_tokens, total_tokens,
+        cost_eur, latency_ms, quality_score, accuracy ON prompt_metrics
+    BEGIN
+        DELETE FROM version_metric_summary
+        WHERE version_id IN (OLD.version_id, NEW.version_id);
+
+        INSERT INTO version_metric_summary (
+            version_id, call_count, success_count, error_count,
+            sum_input_tokens, n_input_tokens, sum_output_tokens, n_output_tokens,
+            sum_total_tokens, n_total_tokens, sum_cost, n_cost,
+            sum_latency, n_latency, min_latency, max_latency,
+            sum_quality, n_quality, sum_accuracy, n_accuracy
+        )
+        SELECT
+            version_id, COUNT(*),
+            COALESCE(SUM(success = 1), 0), COALESCE(SUM(success = 0), 0),
+            COALESCE(SUM(input_tokens), 0), COUNT(input_tokens),
+            COALESCE(SUM(output_tokens), 0), COUNT(output_tokens),
+            COALESCE(SUM(total_tokens), 0), COUNT(total_tokens),
+            COALESCE(SUM(cost_eur), 0), COUNT(cost_eur),
+            COALESCE(SUM(latency_ms), 0), COUNT(latency_ms), MIN(latency_ms), MAX(latency_ms),
+            COALESCE(SUM(quality_score), 0), COUNT(quality_score),
+            COALESCE(SUM(accuracy), 0), COUNT(accuracy)
+        FROM prompt_metrics
+        WHERE version_id IN (OLD.version_id, NEW.version_id)
+        GROUP BY version_id;
+    END""",
+]
+
+# Fills version_metric_summary from existing metrics when the table is first created
+SUMMARY_BACKFILL = """
+    INSERT INTO version_metric_summary (
+        version_id, call_count, success_count, error_count,
+        sum_input_tokens, n_input_tokens, sum_output_tokens, n_output_tokens,
+        sum_total_tokens, n_total_tokens, sum_cost, n_cost,
+        sum_latency, n_latency, min_latency, max_latency,
+        sum_quality, n_quality, sum_accuracy, n_accuracy
+    )
+    SELECT
+        version_id, COUNT(*),
+        COALESCE(SUM(success = 1), 0), COALESCE(SUM(success = 0), 0),
+        COALESCE(SUM(input_tokens), 0), COUNT(input_tokens),
+        COALESCE(SUM(output_tokens), 0), COUNT(output_tokens),
+        COALESCE(SUM(total_tokens), 0), COUNT(total_tokens),
+        COALESCE(SUM(cost_eur), 0), COUNT(cost_eur),
+        COALESCE(SUM(latency_ms), 0), COUNT(latency_ms), MIN(latency_ms), MAX(latency_ms),
+        COALESCE(SUM(quality_score), 0), COUNT(quality_score),
+        COALESCE(SUM(accuracy), 0), COUNT(accuracy)
+    FROM prompt_metrics
+    GROUP BY version_id
+"""
+
 # Schema version for migrations
 SCHEMA_VERSION = 1
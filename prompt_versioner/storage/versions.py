@@ -1,13 +1,39 @@
 """Version storage operations."""
 
-from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 import sqlite3
 import json
 
 from prompt_versioner.storage.queries import QueryBuilder
 from prompt_versioner.storage.database import DatabaseManager
 
+# Maximum number of versions bound into a single DELETE ... IN (...) statement
+DELETE_BATCH_SIZE = 500
+
+# Tables holding per-version data, deleted along with a version. The metrics
+# summary comes first: once its row is gone, the per-row delete trigger on
+# prompt_metrics finds nothing to update and never rescans latency extremes
+_VERSION_DATA_TABLES = ("version_metric_summary", "prompt_metrics", "annotations", "version_tags")
+
+# Statements run on every save/lookup. Keeping one text per statement lets the
+# per-connection statement cache of sqlite3 reuse the compiled statement
+_SQL_INSERT_VERSION = """
+    INSERT INTO prompt_versions
+    (name, version, system_prompt, user_prompt, metadata,
+     git_commit, timestamp, created_by, tags)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+_SQL_GET_VERSION = "SELECT * FROM prompt_versions WHERE name = ? AND version = ?"
+_SQL_GET_VERSION_ID = "SELECT id FROM prompt_versions WHERE name = ? AND version = ?"
+# LIMIT is bound as a parameter (-1 means no limit) so every call shares one statement
+_SQL_LIST_VERSIONS = """
+    SELECT * FROM prompt_versions
+    WHERE name = ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+
 
 class VersionStorage:
     """Handles version CRUD operations."""
@@ -20,6 +46,10 @@ class VersionStorage:
         """
         self.db = db_manager
         self.query = QueryBuilder()
+        # Data version the entries were read at, and (name, version) -> id. Any
+        # write, including one from another process, changes the data version
+        # and starts a new map, so a deleted version's id is never reused
+        self._id_cache: Tuple[Optional[Tuple[Any, ...]], Dict[Tuple[str, str], int]] = (None, {})
 
     def save(
         self,
@@ -53,12 +83,7 @@ class VersionStorage:
 
         with self.db.get_connection() as conn:
             cursor = conn.execute(
-                """
-                INSERT INTO prompt_versions
-                (name, version, system_prompt, user_prompt, metadata,
-                 git_commit, timestamp, created_by, tags)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
+                _SQL_INSERT_VERSION,
                 (
                     name,
                     version,
@@ -83,6 +108,128 @@ class VersionStorage:
 
             return version_id if version_id is not None else 0
 
+    def upsert(
+        self,
+        name: str,
+        version: str,
+        system_prompt: str,
+        user_prompt: str,
+        metadata: Optional[Dict[str, Any]] = None,
+        git_commit: Optional[str] = None,
+        created_by: Optional[str] = None,
+    ) -> int:
+        """Save a prompt version, replacing an existing one with the same version.
+
+        The replaced version keeps its ID but loses its metrics, annotations and
+        tags, as if it had been deleted and saved again.
+
+        Args:
+            name: Name/identifier for the prompt
+            version: Version string
+            system_prompt: System prompt content
+            user_prompt: User prompt content
+            metadata: Additional metadata as dict
+            git_commit: Git commit hash
+            created_by: Creator name/email
+
+        Returns:
+            ID of the saved version
+        """
+        timestamp = datetime.now(timezone.utc).isoformat()
+        metadata_json = json.dumps(metadata) if metadata else None
+
+        with self.db.get_connection(immediate=True) as conn:
+            # Related data of the version being replaced
+            for table in _VERSION_DATA_TABLES:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE version_id IN "  # nosec: B608 -- fixed table names, values parameterized
+                    "(SELECT id FROM prompt_versions WHERE name = ? AND version = ?)",
+                    (name, version),
+                )
+
+            row = conn.execute(
+                """
+                INSERT INTO prompt_versions
+                (name, version, system_prompt, user_prompt, metadata,
+                 git_commit, timestamp, created_by)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(name, version) DO UPDATE SET
+                    system_prompt = excluded.system_prompt,
+                    user_prompt = excluded.user_prompt,
+                    metadata = excluded.metadata,
+                    git_commit = excluded.git_commit,
+                    timestamp = excluded.timestamp,
+                    created_by = excluded.created_by,
+                    tags = NULL
+                RETURNING id
+                """,
+                (
+                    name,
+                    version,
+                    system_prompt,
+                    user_prompt,
+                    metadata_json,
+                    git_commit,
+                    timestamp,
+                    created_by,
+                ),
+            ).fetchone()
+
+            return int(row["id"])
+
+    def save_batch(self, versions: List[Dict[str, Any]], replace: bool = False) -> int:
+        """Save many prompt versions in a single transaction.
+
+        Args:
+            versions: List of dicts with the arguments of ``save`` (name, version,
+                system_prompt, user_prompt and optionally metadata, git_commit and
+                created_by), in the order they should be created
+            replace: Delete existing versions with the same name and version first
+
+        Returns:
+            Number of versions inserted
+        """
+        if not versions:
+            return 0
+
+        # Latest-version lookups order by timestamp, so keep them strictly increasing
+        rows = []
+        timestamp = datetime.now(timezone.utc)
+        # Batches often share one metadata dict; encode each object once. The
+        # records keep the dicts alive, so their ids are stable for this call
+        encoded_metadata: Dict[int, Optional[str]] = {}
+        for record in versions:
+            metadata = record.get("metadata")
+            key = id(metadata)
+            if key not in encoded_metadata:
+                encoded_metadata[key] = json.dumps(metadata) if metadata else None
+            rows.append(
+                (
+                    record["name"],
+                    record["version"],
+                    record["system_prompt"],
+                    record["user_prompt"],
+                    encoded_metadata[key],
+                    record.get("git_commit"),
+                    timestamp.isoformat(),
+                    record.get("created_by"),
+                    None,
+                )
+            )
+            timestamp += timedelta(microseconds=1)
+
+        with self.db.get_connection(immediate=True) as conn:
+            if replace:
+                by_name: Dict[str, List[str]] = {}
+                for record in versions:
+                    by_name.setdefault(record["name"], []).append(record["version"])
+                for name, version_strings in by_name.items():
+                    self.delete_versions(name, version_strings)
+
+            conn.executemany(_SQL_INSERT_VERSION, rows)
+
+        return len(rows)
+
     def get(self, name: str, version: str) -> Optional[Dict[str, Any]]:
         """Get a specific prompt version.
 
@@ -93,16 +240,37 @@ class VersionStorage:
         Returns:
             Dict with version data or None if not found
         """
-        row = self.db.execute(
-            "SELECT * FROM prompt_versions WHERE name = ? AND version = ?",
-            (name, version),
-            fetch="one",
-        )
+        row = self.db.execute(_SQL_GET_VERSION, (name, version), fetch="one")
 
         if row:
             return self._row_to_dict(row)
         return None
 
+    def get_id(self, name: str, version: str) -> Optional[int]:
+        """Get the ID of a prompt version without loading its prompts.
+
+        Args:
+            name: Prompt name
+            version: Version string
+
+        Returns:
+            Version ID or None if not found
+        """
+        data_version = self.db.get_data_version()
+        cache_version, id_cache = self._id_cache
+        if cache_version != data_version:
+            id_cache = {}
+            self._id_cache = (data_version, id_cache)
+
+        key = (name, version)
+        version_id = id_cache.get(key)
+        if version_id is None:
+            row = self.db.execute(_SQL_GET_VERSION_ID, key, fetch="one")
+            if row is None:
+                return None
+            version_id = id_cache[key] = row["id"]
+        return version_id
+
     def get_by_id(self, version_id: int) -> Optional[Dict[str, Any]]:
         """Get version by ID.
 
@@ -144,6 +312,19 @@ class VersionStorage:
             return self._row_to_dict(row)
         return None
 
+    def iter_versions(self, name: str, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Iterate over the versions of a prompt without loading them all at once.
+
+        Args:
+            name: Prompt name
+            limit: Optional limit on number of results
+
+        Yields:
+            Version dicts ordered by timestamp (newest first)
+        """
+        for data in self.db.iter_dicts(_SQL_LIST_VERSIONS, (name, limit or -1)):
+            yield self._decode_json_fields(data)
+
     def list(self, name: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """List all versions of a prompt.
 
@@ -154,17 +335,21 @@ class VersionStorage:
         Returns:
             List of version dicts ordered by timestamp (newest first)
         """
-        query = """
-            SELECT * FROM prompt_versions
-            WHERE name = ?
-            ORDER BY timestamp DESC
-        """
+        return list(self.iter_versions(name, limit))
+
+    def list_version_strings(self, name: str) -> Set[str]:
+        """Get the version strings of a prompt, without loading the versions.
 
-        if limit:
-            query += f" LIMIT {limit}"
+        Args:
+            name: Prompt name
 
-        rows = self.db.execute(query, (name,), fetch="all")
-        return [self._row_to_dict(row) for row in rows]
+        Returns:
+            Set of version strings
+        """
+        rows = self.db.execute(
+            "SELECT version FROM prompt_versions WHERE name = ?", (name,), fetch="all"
+        )
+        return {row["version"] for row in rows}
 
     def list_all_prompts(self) -> List[str]:
         """List all unique prompt names.
@@ -172,11 +357,56 @@ class VersionStorage:
         Returns:
             List of prompt names
         """
-        rows = self.db.execute(
-            "SELECT DISTINCT name FROM prompt_versions ORDER BY name", fetch="all"
-        )
+        rows = self.db.iter_dicts("SELECT DISTINCT name FROM prompt_versions ORDER BY name")
         return [row["name"] for row in rows]
 
+    def list_prompt_summaries(self) -> List[Dict[str, Any]]:
+        """List every prompt with its version count and latest version.
+
+        Returns:
+            List of dicts with name, version_count, latest_version and
+            latest_timestamp, ordered by name
+        """
+        rows = self.db.iter_dicts(
+            """
+            SELECT name, version_count, version AS latest_version,
+                   timestamp AS latest_timestamp
+            FROM (
+                SELECT name, version, timestamp,
+                       COUNT(*) OVER (PARTITION BY name) AS version_count,
+                       ROW_NUMBER() OVER (
+                           PARTITION BY name ORDER BY timestamp DESC
+                       ) AS position
+                FROM prompt_versions
+            )
+            WHERE position = 1
+            ORDER BY name
+            """,
+        )
+        return list(rows)
+
+    def prompt_exists(self, name: str) -> bool:
+        """Check whether a prompt has at least one version.
+
+        Args:
+            name: Prompt name
+
+        Returns:
+            True if the prompt exists
+        """
+        row = self.db.execute(
+            "SELECT 1 FROM prompt_versions WHERE name = ? LIMIT 1", (name,), fetch="one"
+        )
+        return row is not None
+
+    def has_prompts(self) -> bool:
+        """Check whether any prompt is stored.
+
+        Returns:
+            True if at least one prompt version exists
+        """
+        return self.db.execute("SELECT 1 FROM prompt_versions LIMIT 1", fetch="one") is not None
+
     def search(
         self,
         query: Optional[str] = None,
@@ -219,8 +449,8 @@ class VersionStorage:
 
         sql += f" ORDER BY v.timestamp DESC LIMIT {limit}"
 
-        rows = self.db.execute(sql, tuple(params), fetch="all")
-        return [self._row_to_dict(row) for row in rows]
+        rows = self.db.iter_dicts(sql, tuple(params))
+        return [self._decode_json_fields(row) for row in rows]
 
     def delete(self, name: str, version: str) -> bool:
         """Delete a specific version.
@@ -234,10 +464,7 @@ class VersionStorage:
         """
         with self.db.get_connection() as conn:
             # Get version_id first
-            cursor = conn.execute(
-                "SELECT id FROM prompt_versions WHERE name = ? AND version = ?",
-                (name, version),
-            )
+            cursor = conn.execute(_SQL_GET_VERSION_ID, (name, version))
             row = cursor.fetchone()
 
             if not row:
@@ -246,9 +473,11 @@ class VersionStorage:
             version_id = row["id"]
 
             # Delete related data (CASCADE should handle this, but explicit is better)
-            conn.execute("DELETE FROM prompt_metrics WHERE version_id = ?", (version_id,))
-            conn.execute("DELETE FROM annotations WHERE version_id = ?", (version_id,))
-            conn.execute("DELETE FROM version_tags WHERE version_id = ?", (version_id,))
+            for table in _VERSION_DATA_TABLES:
+                conn.execute(
+                    f"DELETE FROM {table} WHERE version_id = ?",  # nosec: B608 -- fixed table names
+                    (version_id,),
+                )
 
             # Delete version
             conn.execute("DELETE FROM prompt_versions WHERE id = ?", (version_id,))
@@ -264,24 +493,51 @@ class VersionStorage:
         Returns:
             True if deleted, False if not found
         """
-        with self.db.get_connection() as conn:
-            # Get all version_ids for this prompt
-            cursor = conn.execute("SELECT id FROM prompt_versions WHERE name = ?", (name,))
-            version_ids = [row["id"] for row in cursor.fetchall()]
+        return self.delete_versions(name) > 0
 
-            if not version_ids:
-                return False
+    def delete_versions(self, name: str, versions: Optional[List[str]] = None) -> int:
+        """Delete several versions of a prompt (and related data) in one transaction.
 
-            # Delete all related data for all versions
-            for version_id in version_ids:
-                conn.execute("DELETE FROM prompt_metrics WHERE version_id = ?", (version_id,))
-                conn.execute("DELETE FROM annotations WHERE version_id = ?", (version_id,))
-                conn.execute("DELETE FROM version_tags WHERE version_id = ?", (version_id,))
+        Args:
+            name: Prompt name
+            versions: Version strings to delete, or None to delete every version
 
-            # Delete all versions for this prompt
-            conn.execute("DELETE FROM prompt_versions WHERE name = ?", (name,))
+        Returns:
+            Number of versions deleted
+        """
+        if versions is None:
+            batches: List[List[str]] = [[]]
+        else:
+            # Stay well below SQLite's limit on bound parameters per statement
+            batches = [
+                versions[i : i + DELETE_BATCH_SIZE]
+                for i in range(0, len(versions), DELETE_BATCH_SIZE)
+            ]
+
+        deleted = 0
+        with self.db.get_connection(immediate=True) as conn:
+            for batch in batches:
+                condition = "name = ?"
+                params: tuple = (name,)
+                if versions is not None:
+                    condition += f" AND version IN ({','.join('?' * len(batch))})"
+                    params += tuple(batch)
+
+                # Delete related data (CASCADE should handle this, but explicit is better)
+                for table in _VERSION_DATA_TABLES:
+                    conn.execute(
+                        f"DELETE FROM {table} WHERE version_id IN "  # nosec: B608 -- fixed table names, values parameterized
+                        f"(SELECT id FROM prompt_versions WHERE {condition})",
+                        params,
+                    )
 
-            return True
+                cursor = conn.execute(
+                    f"DELETE FROM prompt_versions WHERE {condition}",  # nosec: B608 -- placeholders safe, values parameterized
+                    params,
+                )
+                deleted += cursor.rowcount
+
+        return deleted
 
     def update_metadata(self, name: str, version: str, metadata: Dict[str, Any]) -> bool:
         """Update metadata for a version.
@@ -375,8 +631,18 @@ class VersionStorage:
         Returns:
             Dict representation
         """
-        data = dict(row)
+        return VersionStorage._decode_json_fields(dict(row))
+
+    @staticmethod
+    def _decode_json_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Parse the JSON-encoded metadata and tags of a version dict in place.
 
+        Args:
+            data: Version dict as read from the database
+
+        Returns:
+            The same dict with decoded fields
+        """
         # Parse JSON fields
         if data.get("metadata"):
             try:
@@ -1,8 +1,10 @@
 """A/B testing framework for prompt versions."""
 
-from typing import Any, List
+from typing import Any, Iterable, List, Sequence, Tuple
+import math
 import statistics
 
+from prompt_versioner.metrics import RunningStats
 from prompt_versioner.testing.models import ABTestResult
 from prompt_versioner.testing.formatters import format_ab_test_result
 
@@ -36,6 +38,10 @@ class ABTest:
         self.results_a: List[float] = []
         self.results_b: List[float] = []
 
+        # Streaming mean/variance per version, updated as results are logged
+        self.stats_a = RunningStats()
+        self.stats_b = RunningStats()
+
     def log_result(self, version: str, metric_value: float) -> None:
         """Log a test result.
 
@@ -45,20 +51,33 @@ class ABTest:
         """
         if version == "a":
             self.results_a.append(metric_value)
+            self.stats_a.add(metric_value)
         elif version == "b":
             self.results_b.append(metric_value)
+            self.stats_b.add(metric_value)
         else:
             raise ValueError(f"Invalid version: {version}. Must be 'a' or 'b'")
 
-    def log_batch_results(self, version: str, metric_values: List[float]) -> None:
+    def log_batch_results(self, version: str, metric_values: Iterable[float]) -> None:
         """Log multiple test results at once.
 
+        The version is validated once and the values are appended with a single
+        ``list.extend`` instead of one ``log_result`` call per sample.
+
         Args:
             version: Which version (a or b)
-            metric_values: List of metric values
+            metric_values: Iterable of metric values
         """
-        for value in metric_values:
-            self.log_result(version, value)
+        if version == "a":
+            results, stats = self.results_a, self.stats_a
+        elif version == "b":
+            results, stats = self.results_b, self.stats_b
+        else:
+            raise ValueError(f"Invalid version: {version}. Must be 'a' or 'b'")
+
+        start = len(results)
+        results.extend(map(float, metric_values))
+        stats.update(results[start:])
 
     def get_result(self) -> ABTestResult:
         """Get A/B test result.
@@ -69,15 +88,17 @@ class ABTest:
         if not self.results_a or not self.results_b:
             raise ValueError("Not enough data for A/B test. Both versions need results.")
 
-        mean_a = statistics.mean(self.results_a)
-        mean_b = statistics.mean(self.results_b)
+        # Means are maintained incrementally as results are logged
+        mean_a = self.stats_a.mean
+        mean_b = self.stats_b.mean
 
         # Determine winner
         winner = "b" if mean_b > mean_a else "a"
         improvement = abs(mean_b - mean_a) / mean_a * 100 if mean_a != 0 else 0
 
-        # Calculate confidence (simplified - would use t-test in production)
-        confidence = self._calculate_confidence()
+        # Confidence from a two-sided Mann-Whitney U test
+        _, p_value = _mann_whitney_u(self.results_a, self.results_b)
+        confidence = 1.0 - p_value
 
         return ABTestResult(
             version_a=self.version_a,
@@ -90,6 +111,7 @@ class ABTest:
             winner=self.version_b if winner == "b" else self.version_a,
             improvement=improvement,
             confidence=confidence,
+            p_value=p_value,
         )
 
     def print_result(self) -> None:
@@ -103,6 +125,8 @@ class ABTest:
         """Clear all logged results."""
         self.results_a.clear()
         self.results_b.clear()
+        self.stats_a.clear()
+        self.stats_b.clear()
 
     def get_sample_counts(self) -> tuple[int, int]:
         """Get number of samples for each version.
@@ -123,28 +147,120 @@ class ABTest:
         """
         return len(self.results_a) >= min_samples and len(self.results_b) >= min_samples
 
-    # Private methods
+    def should_stop(
+        self, min_samples: int = 15, max_samples: int = 100, alpha: float = 0.05
+    ) -> bool:
+        """Check whether a sequential test can stop collecting samples.
 
-    def _calculate_confidence(self) -> float:
-        """Calculate confidence level (simplified).
+        Computes a Welch z statistic from the running means and variances and
+        compares it with an O'Brien-Fleming boundary, ``z(1 - alpha/2) *
+        sqrt(max_samples / n)``. The boundary is strict early on and relaxes to
+        the fixed-sample critical value at ``max_samples``, so the overall type I
+        error stays close to ``alpha`` while clear differences stop early.
+
+        Args:
+            min_samples: Minimum samples per version before stopping is allowed
+            max_samples: Planned maximum samples per version (always stops there)
+            alpha: Two-sided significance level
 
         Returns:
-            Confidence score between 0 and 1
+            True if the difference is resolved or the sample budget is spent
         """
-        # Simplified confidence based on sample size
-        # In production, use proper statistical tests (t-test, etc.)
-        min_samples = min(len(self.results_a), len(self.results_b))
-        confidence = min(min_samples / 30.0, 1.0)
-
-        # Adjust for variance
-        if len(self.results_a) > 1 and len(self.results_b) > 1:
-            std_a = statistics.stdev(self.results_a)
-            std_b = statistics.stdev(self.results_b)
-            avg_std = (std_a + std_b) / 2
-
-            # Lower confidence if high variance
-            if avg_std > 0:
-                variance_penalty = 1.0 / (1.0 + avg_std)
-                confidence *= variance_penalty
-
-        return confidence
+        n = min(self.stats_a.count, self.stats_b.count)
+        if n < min_samples:
+            return False
+        if n >= max_samples:
+            return True
+
+        standard_error = math.sqrt(
+            self.stats_a.variance / self.stats_a.count + self.stats_b.variance / self.stats_b.count
+        )
+        if standard_error == 0:
+            return self.stats_a.mean != self.stats_b.mean
+
+        z = (self.stats_b.mean - self.stats_a.mean) / standard_error
+        boundary = statistics.NormalDist().inv_cdf(1 - alpha / 2) * math.sqrt(max_samples / n)
+        return abs(z) > boundary
+
+
+# Sample sizes up to which the exact U distribution is used when there are no ties
+_EXACT_MAX_SAMPLES = 8
+
+
+def _mann_whitney_u(a: Sequence[float], b: Sequence[float]) -> Tuple[float, float]:
+    """Two-sided Mann-Whitney U test.
+
+    Ranks are computed with a single sort of the pooled samples (average ranks for
+    ties), so the statistic costs O((n+m) log(n+m)) rather than a pairwise double
+    loop. Small samples without ties use the exact null distribution; otherwise
+    the normal approximation with tie and continuity corrections is used.
+
+    Args:
+        a: Samples for version A
+        b: Samples for version B
+
+    Returns:
+        Tuple of (U statistic for A, two-sided p-value)
+    """
+    n1, n2 = len(a), len(b)
+    if n1 == 0 or n2 == 0:
+        raise ValueError("Both samples must be non-empty")
+
+    pooled = sorted([(float(x), 0) for x in a] + [(float(x), 1) for x in b])
+    n = n1 + n2
+
+    rank_sum_a = 0.0
+    tie_term = 0.0
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        avg_rank = (i + j) / 2 + 1
+        rank_sum_a += avg_rank * sum(1 for k in range(i, j + 1) if pooled[k][1] == 0)
+        t = j - i + 1
+        tie_term += t**3 - t
+        i = j + 1
+
+    u1 = rank_sum_a - n1 * (n1 + 1) / 2
+    u_max = max(u1, n1 * n2 - u1)
+
+    if tie_term == 0 and n1 <= _EXACT_MAX_SAMPLES and n2 <= _EXACT_MAX_SAMPLES:
+        counts = _u_distribution(n1, n2)
+        tail = sum(counts[math.ceil(u_max) :]) / sum(counts)
+        return u1, min(1.0, 2 * tail)
+
+    mu = n1 * n2 / 2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u1, 1.0
+
+    z = (u_max - mu - 0.5) / math.sqrt(variance)
+    p_value = 2 * (1.0 - statistics.NormalDist().cdf(z))
+    return u1, min(1.0, max(0.0, p_value))
+
+
+def _u_distribution(n1: int, n2: int) -> List[int]:
+    """Count rank arrangements for each value of U under the null hypothesis.
+
+    The counts are the coefficients of the Gaussian binomial coefficient
+    [n1 + n2 choose n1]_q, built one factor at a time.
+
+    Args:
+        n1: Size of the first sample
+        n2: Size of the second sample
+
+    Returns:
+        List where index u holds the number of arrangements with U == u
+    """
+    size = n1 * n2 + 1
+    poly = [1] + [0] * (size - 1)
+    for i in range(1, n1 + 1):
+        # Multiply by (1 - q^(n2 + i))
+        shift = n2 + i
+        for k in range(size - 1, shift - 1, -1):
+            poly[k] -= poly[k - shift]
+        # Divide by (1 - q^i)
+        for k in range(i, size):
+            poly[k] += poly[k - i]
+    return poly
@@ -40,3 +40,4 @@ class ABTestResult:
     winner: str
     improvement: float
     confidence: float
+    p_value: Optional[float] = None
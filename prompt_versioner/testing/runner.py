@@ -1,7 +1,7 @@
 """Test runner for executing prompt tests."""
 
-from typing import Callable, Dict, List, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Callable, Dict, List, Any, Literal, Optional
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 import time
 
 from prompt_versioner.metrics import MetricAggregator
@@ -12,13 +12,21 @@ from prompt_versioner.testing.formatters import format_test_summary
 class PromptTestRunner:
     """Test runner for prompt versions."""
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(self, max_workers: int = 4, backend: Literal["thread", "process"] = "thread"):
         """Initialize test runner.
 
         Args:
             max_workers: Maximum number of parallel test workers
+            backend: 'thread' for I/O-bound prompt functions (e.g. network LLM calls),
+                'process' for CPU-bound prompt, metric or validation functions that
+                would otherwise serialize on the GIL. With 'process' the functions and
+                test cases must be picklable (defined at module level).
         """
+        if backend not in ("thread", "process"):
+            raise ValueError(f"Invalid backend: {backend}. Must be 'thread' or 'process'")
+
         self.max_workers = max_workers
+        self.backend = backend
         self.aggregator = MetricAggregator()
 
     def run_test(
@@ -37,39 +45,7 @@ class PromptTestRunner:
         Returns:
             TestResult object
         """
-        start_time = time.time()
-
-        try:
-            # Run the prompt function
-            output = prompt_fn(test_case.inputs)
-
-            # Validate output
-            success = self._validate_output(test_case, output)
-
-            # Compute metrics
-            metrics = self._compute_metrics(output, metric_fn, start_time)
-
-            # Aggregate metrics
-            self.aggregator.add_dict(**metrics)
-
-            return TestResult(
-                test_case=test_case,
-                success=success,
-                output=output,
-                metrics=metrics,
-                duration_ms=metrics["duration_ms"],
-            )
-
-        except Exception as e:
-            duration_ms = (time.time() - start_time) * 1000
-            return TestResult(
-                test_case=test_case,
-                success=False,
-                output=None,
-                metrics={"duration_ms": duration_ms},
-                error=str(e),
-                duration_ms=duration_ms,
-            )
+        return self._record(_execute_test(test_case, prompt_fn, metric_fn))
 
     def run_tests(
         self,
@@ -133,43 +109,31 @@ class PromptTestRunner:
 
     # Private methods
 
-    def _validate_output(self, test_case: TestCase, output: Any) -> bool:
-        """Validate test output.
-
-        Args:
-            test_case: TestCase with validation rules
-            output: Output to validate
-
-        Returns:
-            True if validation passes
-        """
-        if test_case.validation_fn:
-            return test_case.validation_fn(output)
-        elif test_case.expected_output is not None:
-            return output == test_case.expected_output
-        return True
-
-    def _compute_metrics(
-        self, output: Any, metric_fn: Optional[Callable[[Any], Dict[str, float]]], start_time: float
-    ) -> Dict[str, float]:
-        """Compute metrics for test output.
+    def _record(self, result: TestResult) -> TestResult:
+        """Aggregate the metrics of a finished test in the calling process.
 
         Args:
-            output: Test output
-            metric_fn: Optional metric computation function
-            start_time: Test start time
+            result: TestResult produced by a worker
 
         Returns:
-            Dictionary of metrics
+            The result, turned into a failure if its metrics cannot be aggregated
         """
-        metrics = {}
-        if metric_fn:
-            metrics = metric_fn(output)
+        if result.error is not None:
+            return result
 
-        duration_ms = (time.time() - start_time) * 1000
-        metrics["duration_ms"] = duration_ms
+        try:
+            self.aggregator.add_dict(**result.metrics)
+        except Exception as e:
+            return TestResult(
+                test_case=result.test_case,
+                success=False,
+                output=None,
+                metrics={"duration_ms": result.duration_ms},
+                error=str(e),
+                duration_ms=result.duration_ms,
+            )
 
-        return metrics
+        return result
 
     def _run_sequential(
         self,
@@ -190,16 +154,111 @@ class PromptTestRunner:
         prompt_fn: Callable[[Dict[str, Any]], Any],
         metric_fn: Optional[Callable[[Any], Dict[str, float]]],
     ) -> List[TestResult]:
-        """Run tests in parallel."""
+        """Run tests in parallel on the configured backend."""
         results = []
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        executor: Executor
+        if self.backend == "process":
+            executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        else:
+            executor = ThreadPoolExecutor(max_workers=self.max_workers)
+
+        with executor:
             futures = {
-                executor.submit(self.run_test, tc, prompt_fn, metric_fn): tc for tc in test_cases
+                executor.submit(_execute_test, tc, prompt_fn, metric_fn): tc for tc in test_cases
             }
 
+            # Workers only compute results; aggregation happens here
             for future in as_completed(futures):
-                result = future.result()
-                results.append(result)
+                results.append(self._record(future.result()))
 
         return results
+
+
+def _execute_test(
+    test_case: TestCase,
+    prompt_fn: Callable[[Dict[str, Any]], Any],
+    metric_fn: Optional[Callable[[Any], Dict[str, float]]] = None,
+) -> TestResult:
+    """Run a single test case without touching runner state.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        test_case: TestCase to run
+        prompt_fn: Function that takes inputs and returns LLM output
+        metric_fn: Optional function to compute metrics from output
+
+    Returns:
+        TestResult object
+    """
+    start_time = time.time()
+
+    try:
+        # Run the prompt function
+        output = prompt_fn(test_case.inputs)
+
+        # Validate output
+        success = _validate_output(test_case, output)
+
+        # Compute metrics
+        metrics = _compute_metrics(output, metric_fn, start_time)
+
+        return TestResult(
+            test_case=test_case,
+            success=success,
+            output=output,
+            metrics=metrics,
+            duration_ms=metrics["duration_ms"],
+        )
+
+    except Exception as e:
+        duration_ms = (time.time() - start_time) * 1000
+        return TestResult(
+            test_case=test_case,
+            success=False,
+            output=None,
+            metrics={"duration_ms": duration_ms},
+            error=str(e),
+            duration_ms=duration_ms,
+        )
+
+
+def _validate_output(test_case: TestCase, output: Any) -> bool:
+    """Validate test output.
+
+    Args:
+        test_case: TestCase with validation rules
+        output: Output to validate
+
+    Returns:
+        True if validation passes
+    """
+    if test_case.validation_fn:
+        return test_case.validation_fn(output)
+    elif test_case.expected_output is not None:
+        return output == test_case.expected_output
+    return True
+
+
+def _compute_metrics(
+    output: Any, metric_fn: Optional[Callable[[Any], Dict[str, float]]], start_time: float
+) -> Dict[str, float]:
+    """Compute metrics for test output.
+
+    Args:
+        output: Test output
+        metric_fn: Optional metric computation function
+        start_time: Test start time
+
+    Returns:
+        Dictionary of metrics
+    """
+    metrics = {}
+    if metric_fn:
+        metrics = metric_fn(output)
+
+    duration_ms = (time.time() - start_time) * 1000
+    metrics["duration_ms"] = duration_ms
+
+    return metrics
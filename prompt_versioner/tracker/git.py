@@ -2,7 +2,7 @@
 
 import subprocess  # nosec: B404
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional, Tuple
 
 
 class GitTracker:
@@ -15,15 +15,56 @@ class GitTracker:
             repo_path: Path to Git repository. Defaults to current directory.
         """
         self.repo_path = repo_path or Path.cwd()
+        # (HEAD signature, commit) of the last get_current_commit call
+        self._commit_cache: Optional[Tuple[Tuple[Any, ...], str]] = None
         self._check_git_repo()
 
     def _check_git_repo(self) -> None:
         """Check if we're in a Git repository."""
         try:
-            self._run_git_command(["rev-parse", "--git-dir"])
+            output = self._run_git_command(["rev-parse", "--git-dir", "--git-common-dir"])
         except subprocess.CalledProcessError:
             raise RuntimeError(f"Not a git repository: {self.repo_path}")
 
+        git_dir, _, common_dir = output.partition("\n")
+        self._git_dir = self.repo_path / git_dir
+        self._common_dir = self.repo_path / (common_dir or git_dir)
+
+    def _head_signature(self) -> Optional[Tuple[Any, ...]]:
+        """Get a token that changes whenever HEAD points to a different commit.
+
+        Built from the contents of HEAD and of the loose branch ref plus the
+        modification time and size of packed-refs, so reading it costs a couple
+        of small reads and a stat call instead of a git subprocess. The loose ref
+        is read rather than stat-ed: it always has the same size, and two commits
+        within one timestamp tick of a coarse filesystem would look identical.
+
+        Returns:
+            Hashable signature, or None if the Git files cannot be read
+        """
+        try:
+            head = (self._git_dir / "HEAD").read_text().strip()
+        except OSError:
+            return None
+
+        signature: list[Any] = [head]
+        if head.startswith("ref: "):
+            ref = head[len("ref: ") :]
+            try:
+                signature.append((self._common_dir / ref).read_bytes())
+            except FileNotFoundError:
+                signature.append(None)
+            except OSError:
+                return None
+
+            try:
+                stat = (self._common_dir / "packed-refs").stat()
+            except FileNotFoundError:
+                signature.append(None)
+            else:
+                signature.append((stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
     def _run_git_command(self, args: list[str]) -> str:
         """Run a git command and return output.
 
@@ -48,10 +89,20 @@ class GitTracker:
     def get_current_commit(self) -> str:
         """Get current Git commit hash.
 
+        The hash is cached until HEAD or the branch it points to changes, so
+        repeated calls do not each start a git process.
+
         Returns:
             Short commit hash (7 characters)
         """
-        return self._run_git_command(["rev-parse", "--short", "HEAD"])
+        signature = self._head_signature()
+        cached = self._commit_cache
+        if signature is not None and cached is not None and cached[0] == signature:
+            return cached[1]
+
+        commit = self._run_git_command(["rev-parse", "--short", "HEAD"])
+        self._commit_cache = (signature, commit) if signature is not None else None
+        return commit
 
     def get_current_branch(self) -> str:
         """Get current Git branch name.
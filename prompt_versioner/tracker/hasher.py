@@ -13,6 +13,40 @@ class PromptHasher:
     # Number of characters to use from hash
     HASH_LENGTH = 16
 
+    @staticmethod
+    def _new_hash(data: bytes = b"") -> "hashlib._Hash":
+        """Create a hash object for content addressing.
+
+        Hashes identify prompt content and are not a security boundary, so
+        ``usedforsecurity=False`` lets FIPS-enabled builds use the fast path.
+
+        Args:
+            data: Initial data to hash
+
+        Returns:
+            Hash object
+        """
+        return hashlib.new(PromptHasher.HASH_ALGORITHM, data, usedforsecurity=False)
+
+    @staticmethod
+    def _hash_pair(system_prompt: str, user_prompt: str) -> "hashlib._Hash":
+        """Hash a prompt pair as ``f"{system_prompt}\\n---\\n{user_prompt}"``.
+
+        The parts are fed to the hash one after the other, so long prompts are
+        not copied into a combined string first.
+
+        Args:
+            system_prompt: System prompt content
+            user_prompt: User prompt content
+
+        Returns:
+            Hash object
+        """
+        pair_hash = PromptHasher._new_hash(system_prompt.encode("utf-8"))
+        pair_hash.update(b"\n---\n")
+        pair_hash.update(user_prompt.encode("utf-8"))
+        return pair_hash
+
     @staticmethod
     def compute_hash(system_prompt: str, user_prompt: str) -> str:
         """Compute hash of prompt pair.
@@ -24,10 +58,9 @@ class PromptHasher:
         Returns:
             SHA256 hash of concatenated prompts (truncated)
         """
-        combined = f"{system_prompt}\n---\n{user_prompt}"
-        hash_obj = hashlib.new(PromptHasher.HASH_ALGORITHM)
-        hash_obj.update(combined.encode("utf-8"))
-        return hash_obj.hexdigest()[: PromptHasher.HASH_LENGTH]
+        return PromptHasher._hash_pair(system_prompt, user_prompt).hexdigest()[
+            : PromptHasher.HASH_LENGTH
+        ]
 
     @staticmethod
     def compute_hash_full(system_prompt: str, user_prompt: str) -> str:
@@ -40,10 +73,7 @@ class PromptHasher:
         Returns:
             Full SHA256 hash
         """
-        combined = f"{system_prompt}\n---\n{user_prompt}"
-        hash_obj = hashlib.new(PromptHasher.HASH_ALGORITHM)
-        hash_obj.update(combined.encode("utf-8"))
-        return hash_obj.hexdigest()
+        return PromptHasher._hash_pair(system_prompt, user_prompt).hexdigest()
 
     @staticmethod
     def compute_individual_hashes(system_prompt: str, user_prompt: str) -> Tuple[str, str]:
@@ -56,11 +86,8 @@ class PromptHasher:
         Returns:
             Tuple of (system_hash, user_hash)
         """
-        system_hash = hashlib.new(PromptHasher.HASH_ALGORITHM)
-        system_hash.update(system_prompt.encode("utf-8"))
-
-        user_hash = hashlib.new(PromptHasher.HASH_ALGORITHM)
-        user_hash.update(user_prompt.encode("utf-8"))
+        system_hash = PromptHasher._new_hash(system_prompt.encode("utf-8"))
+        user_hash = PromptHasher._new_hash(user_prompt.encode("utf-8"))
 
         return (
             system_hash.hexdigest()[: PromptHasher.HASH_LENGTH],
@@ -85,9 +112,8 @@ class PromptHasher:
         Returns:
             True if prompts differ
         """
-        old_hash = PromptHasher.compute_hash(old_system, old_user)
-        new_hash = PromptHasher.compute_hash(new_system, new_user)
-        return old_hash != new_hash
+        # Direct comparison is exact and short-circuits, no need to hash both pairs
+        return old_system != new_system or old_user != new_user
 
     @staticmethod
     def detect_changes(
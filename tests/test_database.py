@@ -0,0 +1,51 @@
+"""Tests for DatabaseManager connection handling."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from prompt_versioner.storage import PromptStorage
+
+
+def _count_versions(db_path: Path) -> int:
+    """Count stored versions through a separate connection."""
+    conn = sqlite3.connect(db_path)
+    try:
+        return int(conn.execute("SELECT COUNT(*) FROM prompt_versions").fetchone()[0])
+    finally:
+        conn.close()
+
+
+@pytest.fixture
+def storage(tmp_path: Path) -> PromptStorage:
+    storage = PromptStorage(tmp_path / "db.sqlite")
+    storage.save_version(name="p", version="1.0.0", system_prompt="s", user_prompt="u")
+    return storage
+
+
+@pytest.mark.parametrize("interrupt", [KeyboardInterrupt, SystemExit, GeneratorExit])
+def test_interrupted_block_is_rolled_back(storage: PromptStorage, interrupt: type) -> None:
+    with pytest.raises(interrupt):
+        with storage.db.get_connection() as conn:
+            conn.execute("DELETE FROM prompt_versions")
+            raise interrupt()
+
+    # The next block on the same thread must not commit the aborted delete
+    assert storage.prompt_exists("p")
+    assert _count_versions(storage.db.db_path) == 1
+
+
+def test_close_after_partial_iteration(storage: PromptStorage) -> None:
+    storage.save_version(name="p", version="1.0.1", system_prompt="s", user_prompt="u")
+    rows = storage.iter_versions("p")
+    next(rows)
+
+    # A suspended iterator must not keep the connection open
+    storage.close()
+    assert storage.db._local.conn is None
+    with pytest.raises(sqlite3.ProgrammingError):
+        next(rows)
+    rows.close()
+
+    assert len(storage.list_versions("p")) == 2